@@ -0,0 +1,18 @@
+"""
+Interface comum para as árvores do projeto (e outras estruturas): um conjunto
+ordenado com insert, search, delete, iteração em ordem e estatísticas, e um
+registro de backends criados pelo nome.
+
+Exemplo:
+    from arvores import create, available_backends
+    tree = create('rb')
+    tree.insert(10)
+    tree.search(10)
+
+A linha de comando (python3 -m arvores, a partir da pasta Utils) executa
+qualquer backend registrado sobre os arquivos de Entradas Árvores.
+"""
+from arvores.interface import SortedSet, TreeBackend, VersionedBackend
+from arvores.registry import register, create, available_backends, describe
+
+__all__ = ['SortedSet', 'TreeBackend', 'VersionedBackend', 'register', 'create', 'available_backends', 'describe']
@@ -0,0 +1,105 @@
+import os
+import time
+import argparse
+
+from arvores.registry import create, available_backends, describe
+from utils import INPUT_DIR, OUTPUT_DIR, read_numbers, iter_number_chunks, list_input_files
+from results import write_rows, write_report
+
+# Executa qualquer backend registrado sobre os arquivos de Entradas Árvores com
+# o mesmo código de leitura e de medida para todos, para que a comparação entre
+# eles dependa apenas da estrutura: construção por inserções sucessivas e
+# consulta com search_many, ambas medidas com perf_counter.
+# Exemplo: python3 -m arvores --backends bst rb sorted-array --files 10000.txt --repeat 3
+#          python3 -m arvores --backends rb rb-compact --stream --csv arvores.csv --report arvores.txt
+
+def build(backend_name, path, stream=False):
+    """
+    Constrói o backend com as chaves do arquivo e retorna (conjunto, chaves
+    lidas, tempo em segundos). Com stream, o arquivo é lido em blocos e o tempo
+    inclui a leitura; sem stream, os números são lidos antes e só a inserção é
+    medida.
+    """
+    tree = create(backend_name)
+    insert = tree.insert
+
+    if stream:
+        count = 0
+        start_time = time.perf_counter()
+        for chunk in iter_number_chunks(path):
+            count += len(chunk)
+            for number in chunk:
+                insert(number)
+        return tree, count, time.perf_counter() - start_time
+
+    numbers = read_numbers(path)
+    start_time = time.perf_counter()
+    for number in numbers:
+        insert(number)
+    return tree, len(numbers), time.perf_counter() - start_time
+
+def query(tree, path, sort_queries=False):
+    """
+    Consulta as chaves do arquivo e retorna (hits, misses, comparações, tempo).
+    """
+    numbers = read_numbers(path)
+    if sort_queries:
+        numbers.sort()
+
+    start_time = time.perf_counter()
+    hits, misses, comparisons = tree.search_many(numbers)
+    return hits, misses, sum(comparisons), time.perf_counter() - start_time
+
+def run(backend_name, input_file, repetition, stream=False, sort_queries=False):
+    """
+    Executa uma construção e uma consulta e retorna as duas linhas no formato
+    de results.FIELDS.
+    """
+    tree, size, build_time = build(backend_name, os.path.join(INPUT_DIR, 'Construir', input_file), stream)
+    stats = tree.stats()
+    hits, misses, comparisons, query_time = query(tree, os.path.join(INPUT_DIR, 'Consultar', input_file), sort_queries)
+
+    # O tamanho é o da entrada, como no parallel_runner, e não len(tree), que
+    # depende da política de duplicatas do backend.
+    common = {'tree': backend_name, 'input_file': input_file, 'size': size, 'repetition': repetition}
+    return [
+        dict(common, phase='build', comparisons=stats['comparisons'], time=build_time),
+        dict(common, phase='query', comparisons=comparisons, time=query_time, hits=hits, misses=misses),
+    ]
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(prog='python3 -m arvores', description="Executa os backends registrados sobre os arquivos de Entradas Árvores.")
+    parser.add_argument('--backends', nargs='*', default=['bst', 'rb'], choices=available_backends(), help="Backends a executar.")
+    parser.add_argument('--files', nargs='*', help="Arquivos de Entradas Árvores/Construir (padrão: todos).")
+    parser.add_argument('--repeat', type=int, default=1, help="Quantidade de repetições de cada combinação.")
+    parser.add_argument('--stream', action='store_true', help="Lê as entradas em blocos durante a construção.")
+    parser.add_argument('--sort-queries', action='store_true', help="Ordena as chaves de consulta antes da busca.")
+    parser.add_argument('--list', action='store_true', help="Lista os backends registrados e termina.")
+    parser.add_argument('--csv', help="Grava uma linha por (backend, tamanho, fase, repetição) neste CSV em Saídas Árvores.")
+    parser.add_argument('--jsonl', help="Grava as mesmas linhas do --csv neste JSONL em Saídas Árvores.")
+    parser.add_argument('--report', help="Grava o relatório agregado (backends lado a lado por tamanho) neste arquivo em Saídas Árvores.")
+    args = parser.parse_args()
+
+    if args.list:
+        for name in available_backends():
+            print(f"{name:>14}  {describe(name)}")
+        raise SystemExit
+
+    print(f"{'Arquivo':>12} {'Backend':>14} {'Rep.':>4} {'Comp. (constr.)':>16} {'Constr. (s)':>12} {'Comp. (cons.)':>14} {'Cons. (s)':>10} {'Hits':>8} {'Misses':>8}")
+
+    rows = []
+    for input_file in args.files or list_input_files():
+        for backend_name in args.backends:
+            for repetition in range(1, args.repeat + 1):
+                build_row, query_row = run(backend_name, input_file, repetition, args.stream, args.sort_queries)
+                rows += [build_row, query_row]
+                print(f"{input_file:>12} {backend_name:>14} {repetition:>4} {build_row['comparisons']:>16} {build_row['time']:>12.6f} "
+                      f"{query_row['comparisons']:>14} {query_row['time']:>10.6f} {query_row['hits']:>8} {query_row['misses']:>8}")
+
+    if args.csv:
+        write_rows(os.path.join(OUTPUT_DIR, args.csv), rows)
+    if args.jsonl:
+        write_rows(os.path.join(OUTPUT_DIR, args.jsonl), rows)
+    if args.report:
+        write_report(os.path.join(OUTPUT_DIR, args.report), rows)
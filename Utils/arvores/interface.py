@@ -0,0 +1,165 @@
+from abc import ABC, abstractmethod
+
+class SortedSet(ABC):
+    """
+    Conjunto ordenado de chaves inteiras, a interface comum a todos os backends.
+
+    Além das operações, cada backend conta as comparações de chaves feitas nas
+    inserções e os hits e misses das buscas, com o mesmo significado da
+    BinarySearchTree e da RedBlackTree, para que as comparações sejam diretas.
+    """
+
+    @abstractmethod
+    def insert(self, key):
+        """
+        Insere a chave. Retorna False se ela não foi armazenada (por exemplo,
+        duplicata recusada) e True caso contrário.
+        """
+
+    @abstractmethod
+    def search(self, key):
+        """
+        Busca a chave, atualizando hits e misses, e retorna a quantidade de
+        comparações feitas.
+        """
+
+    @abstractmethod
+    def delete(self, key):
+        """
+        Remove uma ocorrência da chave. Retorna True se ela existia.
+        """
+
+    @abstractmethod
+    def __iter__(self):
+        """
+        Gera as chaves em ordem crescente.
+        """
+
+    @abstractmethod
+    def __len__(self):
+        """
+        Quantidade de chaves armazenadas, contando cada repetição guardada.
+        """
+
+    @abstractmethod
+    def stats(self):
+        """
+        Dicionário com as estatísticas do backend; contém pelo menos size,
+        comparisons, hits e misses.
+        """
+
+    @abstractmethod
+    def search_many(self, keys):
+        """
+        Busca um lote de chaves e retorna (hits, misses, comparações de cada
+        chave), atualizando hits e misses como o search.
+        """
+
+    @abstractmethod
+    def search_mask(self, keys):
+        """
+        Busca um lote de chaves e retorna uma lista com True para cada chave
+        encontrada, atualizando hits e misses como o search.
+        """
+
+    def range(self, lo, hi):
+        """
+        Gera as chaves k com lo <= k <= hi em ordem crescente.
+        """
+        for key in self:
+            if key > hi:
+                break
+            if key >= lo:
+                yield key
+
+    def __contains__(self, key):
+        # Uma busca como as outras (O(log n) nas árvores balanceadas), então
+        # também conta nos hits e misses.
+        return self.search_mask([key])[0]
+
+class TreeBackend(SortedSet):
+    """
+    Adapta qualquer uma das árvores do projeto (com Node ou compactas) para a
+    interface SortedSet. Recursos que a árvore não tiver (como o delete da
+    árvore persistente) levantam NotImplementedError.
+    """
+
+    def __init__(self, tree_class, **options):
+        self.tree = tree_class(**options)
+        self._size = 0
+
+        # Com duplicates='count' a repetição não cria nó (o insert da árvore
+        # retorna False), mas fica guardada no count do nó e sai com o delete.
+        self._counts_duplicates = getattr(self.tree, 'duplicates', None) == 'count'
+
+    def insert(self, key):
+        # A BinarySearchTree e as versões compactas não retornam nada no insert.
+        stored = self.tree.insert(key) is not False or self._counts_duplicates
+        self._size += stored
+        return stored
+
+    def search(self, key):
+        return self.tree.search(key)
+
+    def search_many(self, keys):
+        return self.tree.search_many(keys)
+
+    def search_mask(self, keys):
+        return self.tree.search_mask(keys)
+
+    def range(self, lo, hi):
+        if hasattr(self.tree, 'range'):
+            return self.tree.range(lo, hi)
+        return super().range(lo, hi)
+
+    def delete(self, key):
+        if not hasattr(self.tree, 'delete'):
+            raise NotImplementedError(f"{type(self.tree).__name__} não suporta remoção.")
+        deleted = self.tree.delete(key)
+        self._size -= deleted
+        return deleted
+
+    def __iter__(self):
+        if hasattr(self.tree, 'iter_inorder'):
+            return self.tree.iter_inorder()
+        return self._iter_compact()
+
+    def _iter_compact(self):
+        # Percurso em ordem das árvores compactas, em que o índice 0 é o NIL.
+        keys, left, right = self.tree.key, self.tree.left, self.tree.right
+        stack = []
+        node = self.tree.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield keys[node]
+            node = right[node]
+
+    def __len__(self):
+        return self._size
+
+    def stats(self):
+        result = {
+            'size': self._size,
+            'comparisons': self.tree.comparison_count,
+            'hits': self.tree.hits,
+            'misses': self.tree.misses,
+        }
+        # As árvores instrumentadas trazem também rotações, recolorações e
+        # histogramas de profundidade.
+        if hasattr(self.tree, 'stats'):
+            result.update(self.tree.stats.as_dict())
+        return result
+
+class VersionedBackend(TreeBackend):
+    """
+    Adapta as árvores persistentes, em que insert retorna uma nova versão em vez
+    de alterar a árvore: o backend passa a apontar sempre para a última versão.
+    """
+
+    def insert(self, key):
+        self.tree = self.tree.insert(key)
+        self._size += 1
+        return True
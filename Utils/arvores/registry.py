@@ -0,0 +1,69 @@
+import os
+import sys
+from functools import partial
+
+# A pasta Utils precisa estar no caminho de importação para o utils.py, mesmo
+# quando o pacote é importado de outro lugar.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import BST_DIR, RB_DIR, TREES, load_tree_class, import_tree_module
+from arvores.interface import TreeBackend, VersionedBackend
+from arvores.sorted_array import SortedArray
+
+# Registro dos backends: nome -> (fábrica, descrição). A fábrica é chamada sem
+# argumentos e retorna um SortedSet vazio. As classes só são importadas na
+# primeira criação, para que registrar um backend não custe nada.
+_BACKENDS = {}
+
+def register(name, factory, description=''):
+    """
+    Registra um backend. Registrar de novo o mesmo nome substitui o anterior.
+    """
+    _BACKENDS[name] = (factory, description)
+
+def create(name):
+    """
+    Cria um SortedSet vazio do backend registrado com o nome fornecido.
+    """
+    try:
+        factory, _ = _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Backend desconhecido: {name!r}. Disponíveis: {', '.join(available_backends())}.") from None
+    return factory()
+
+def available_backends():
+    return sorted(_BACKENDS)
+
+def describe(name):
+    return _BACKENDS[name][1]
+
+def _tree_factory(load, **options):
+    # Adia a importação da árvore até a primeira criação.
+    def factory():
+        return TreeBackend(load(), **options)
+    return factory
+
+def _module_class(folder, module):
+    return lambda: getattr(import_tree_module(folder, module), module)
+
+_DESCRIPTIONS = {
+    'bst': "Árvore Binária de Busca",
+    'bst-compact': "Árvore Binária de Busca (compacta)",
+    'rb': "Árvore Rubro-Negra",
+    'rb-compact': "Árvore Rubro-Negra (compacta)",
+}
+
+for _name in TREES:
+    register(_name, _tree_factory(partial(load_tree_class, _name)), _DESCRIPTIONS[_name])
+
+register('rb-reject', _tree_factory(partial(load_tree_class, 'rb'), duplicates='reject'),
+         "Árvore Rubro-Negra sem chaves duplicadas")
+register('rb-stats', _tree_factory(_module_class(RB_DIR, 'InstrumentedRedBlackTree')),
+         "Árvore Rubro-Negra instrumentada (rotações, recolorações, profundidades)")
+register('bst-stats', _tree_factory(_module_class(BST_DIR, 'InstrumentedBinarySearchTree')),
+         "Árvore Binária de Busca instrumentada (profundidades)")
+register('rb-concurrent', _tree_factory(_module_class(RB_DIR, 'ConcurrentRedBlackTree')),
+         "Árvore Rubro-Negra com trava de leitores e escritores")
+register('rb-persistent', lambda: VersionedBackend(_module_class(RB_DIR, 'PersistentRedBlackTree')()),
+         "Árvore Rubro-Negra persistente (cópia do caminho a cada inserção)")
+register('sorted-array', lambda: TreeBackend(SortedArray), "Lista ordenada com busca binária")
@@ -0,0 +1,128 @@
+from bisect import bisect_left, bisect_right
+
+class SortedArray:
+    """
+    Lista Python mantida ordenada, usada como referência contra as árvores: a
+    busca binária faz cerca de log2(n) comparações, como uma árvore perfeitamente
+    balanceada, mas cada inserção desloca em média metade da lista (O(n)).
+
+    Os contadores seguem as árvores: comparison_count soma as comparações das
+    inserções e search conta uma comparação por posição visitada.
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.comparison_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.keys)
+
+    def insert(self, key):
+        """
+        Insere a chave depois das chaves iguais, como a BinarySearchTree.
+        """
+        keys = self.keys
+        lo, hi = 0, len(keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            self.comparison_count += 1
+            if key < keys[mid]:
+                hi = mid
+            else:
+                lo = mid + 1
+        keys.insert(lo, key)
+
+    def search(self, key):
+        """
+        Busca binária; retorna o número de comparações feitas e atualiza os
+        contadores de hits e misses.
+        """
+        keys = self.keys
+        lo, hi = 0, len(keys)
+        comparisons = 0
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            comparisons += 1
+            current = keys[mid]
+            if key == current:
+                self.hits += 1
+                return comparisons
+            elif key < current:
+                hi = mid
+            else:
+                lo = mid + 1
+
+        self.misses += 1
+        return comparisons
+
+    def search_many(self, keys):
+        """
+        Busca um lote de chaves e retorna (hits, misses, comparações de cada
+        chave), como o search_many das árvores.
+        """
+        found, comparisons = self._search_batch(keys)
+        hits = sum(found)
+        return hits, len(found) - hits, comparisons
+
+    def search_mask(self, keys):
+        """
+        Busca um lote de chaves e retorna uma lista com True para cada chave
+        encontrada, atualizando hits e misses como o search.
+        """
+        found, _ = self._search_batch(keys)
+        return found
+
+    def _search_batch(self, keys):
+        # A mesma busca binária do search para cada chave do lote; retorna os
+        # acertos e as comparações de cada chave.
+        sorted_keys = self.keys
+        found = []
+        comparisons = []
+
+        for key in keys:
+            lo, hi = 0, len(sorted_keys)
+            count = 0
+            hit = False
+            while lo < hi:
+                mid = (lo + hi) // 2
+                count += 1
+                current = sorted_keys[mid]
+                if key == current:
+                    hit = True
+                    break
+                elif key < current:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            found.append(hit)
+            comparisons.append(count)
+
+        hits = sum(found)
+        self.hits += hits
+        self.misses += len(found) - hits
+
+        return found, comparisons
+
+    def delete(self, key):
+        """
+        Remove uma ocorrência da chave. Retorna True se ela existia.
+        """
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            del self.keys[index]
+            return True
+        return False
+
+    def range(self, lo, hi):
+        """
+        Gera as chaves k com lo <= k <= hi em ordem crescente.
+        """
+        keys = self.keys
+        for index in range(bisect_left(keys, lo), bisect_right(keys, hi)):
+            yield keys[index]
+
+    def iter_inorder(self):
+        return iter(self.keys)
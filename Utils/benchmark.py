@@ -0,0 +1,118 @@
+import gc
+import os
+import math
+import time
+import argparse
+import statistics
+from functools import partial
+from contextlib import contextmanager
+
+from utils import INPUT_DIR, read_numbers, list_input_files
+from arvores import create, available_backends
+
+# Benchmark repetível da construção e da consulta das árvores: executa algumas
+# rodadas de aquecimento, depois N repetições medidas com perf_counter_ns, e
+# reporta mínimo, mediana, p95 e desvio padrão de cada fase. As árvores são os
+# backends registrados no pacote arvores.
+# Exemplo: python3 benchmark.py --files 10000.txt 100000.txt --repeat 10 --no-gc
+
+PHASES = ('build', 'query')
+
+@contextmanager
+def gc_paused(disable_gc):
+    """
+    Desliga o coletor de lixo durante o bloco, se pedido, religando-o ao final
+    caso ele estivesse ligado antes.
+    """
+    was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        yield
+    finally:
+        if disable_gc and was_enabled:
+            gc.enable()
+
+def time_build(tree_class, numbers, disable_gc=False):
+    """
+    Constrói a árvore e retorna o tempo em nanossegundos e a árvore construída.
+    tree_class é a classe da árvore ou qualquer fábrica sem argumentos (como um
+    backend do pacote arvores).
+    """
+    with gc_paused(disable_gc):
+        start = time.perf_counter_ns()
+        tree = tree_class()
+        for number in numbers:
+            tree.insert(number)
+        elapsed = time.perf_counter_ns() - start
+    return elapsed, tree
+
+def time_query(tree, query_numbers, disable_gc=False):
+    """
+    Realiza as consultas e retorna o tempo em nanossegundos.
+    """
+    with gc_paused(disable_gc):
+        start = time.perf_counter_ns()
+        if hasattr(tree, 'search_many'):
+            tree.search_many(query_numbers)
+        else:
+            for number in query_numbers:
+                tree.search(number)
+        elapsed = time.perf_counter_ns() - start
+    return elapsed
+
+def run_benchmark(tree_class, numbers, query_numbers, warmup=1, repeat=5, disable_gc=False):
+    """
+    Executa as rodadas de aquecimento (descartadas) e as repetições medidas,
+    retornando as amostras em nanossegundos de cada fase.
+    """
+    samples = {phase: [] for phase in PHASES}
+
+    for i in range(warmup + repeat):
+        build_ns, tree = time_build(tree_class, numbers, disable_gc)
+        query_ns = time_query(tree, query_numbers, disable_gc)
+
+        if i >= warmup:
+            samples['build'].append(build_ns)
+            samples['query'].append(query_ns)
+
+    return samples
+
+def summarize(samples):
+    """
+    Calcula as estatísticas de uma lista de amostras (em nanossegundos).
+    """
+    ordered = sorted(samples)
+    return {
+        'min': ordered[0],
+        'median': statistics.median(ordered),
+        # p95 pelo método do posto mais próximo
+        'p95': ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)],
+        'stddev': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Benchmark repetível da construção e consulta das árvores.")
+    parser.add_argument('--trees', nargs='*', default=['bst', 'rb'], choices=available_backends(), help="Árvores (backends do pacote arvores) a medir.")
+    parser.add_argument('--files', nargs='*', help="Arquivos de Entradas Árvores/Construir (padrão: todos).")
+    parser.add_argument('--warmup', type=int, default=1, help="Rodadas de aquecimento descartadas.")
+    parser.add_argument('--repeat', type=int, default=5, help="Repetições medidas.")
+    parser.add_argument('--no-gc', action='store_true', help="Desliga o coletor de lixo durante as fases medidas.")
+    args = parser.parse_args()
+
+    print(f"{'Arquivo':>12} {'Árvore':>12} {'Fase':>6} {'Mín (ms)':>10} {'Mediana (ms)':>13} {'p95 (ms)':>10} {'Desvio (ms)':>12}")
+
+    for input_file in args.files or list_input_files():
+        numbers = read_numbers(os.path.join(INPUT_DIR, 'Construir', input_file))
+        query_numbers = read_numbers(os.path.join(INPUT_DIR, 'Consultar', input_file))
+
+        for name in args.trees:
+            samples = run_benchmark(partial(create, name), numbers, query_numbers, args.warmup, args.repeat, args.no_gc)
+
+            for phase in PHASES:
+                stats = summarize(samples[phase])
+                print(f"{input_file:>12} {name:>12} {phase:>6} "
+                      f"{stats['min'] / 1e6:>10.3f} {stats['median'] / 1e6:>13.3f} "
+                      f"{stats['p95'] / 1e6:>10.3f} {stats['stddev'] / 1e6:>12.3f}")
@@ -0,0 +1,121 @@
+import os
+import time
+import random
+import argparse
+import threading
+
+from utils import INPUT_DIR, RB_DIR, import_tree_module, read_numbers
+from tree_analysis import analyze
+
+# Teste de carga da ConcurrentRedBlackTree: a árvore começa com metade das
+# chaves do arquivo de construção, e enquanto os escritores inserem a outra
+# metade, os leitores buscam as chaves do arquivo de consulta em lotes. Cada
+# leitor também busca chaves da primeira metade, que precisam ser sempre
+# encontradas, mesmo no meio das rotações. Ao final, a árvore é validada (ordem
+# e propriedades rubro-negras) e os contadores por thread são conferidos.
+# Como o GIL executa uma thread Python por vez, a vazão total não cresce com o
+# número de leitores; o teste mede o custo das travas e a correção sob disputa.
+# Exemplo: python3 benchmark_concurrent.py --file 100000.txt --readers 1 2 4 8 --batch 64
+
+ConcurrentRedBlackTree = import_tree_module(RB_DIR, 'ConcurrentRedBlackTree').ConcurrentRedBlackTree
+
+def run(numbers, queries, readers, writers, batch, rounds):
+    """
+    Executa uma rodada do teste e retorna um dicionário com os tempos, as
+    quantidades de operações e as falhas encontradas.
+    """
+    half = len(numbers) // 2
+    prefill, pending = numbers[:half], numbers[half:]
+
+    tree = ConcurrentRedBlackTree()
+    for number in prefill:
+        tree.insert(number)
+
+    start = threading.Barrier(readers + writers + 1)
+    missing = []     # Chaves da primeira metade não encontradas
+    searched = [0] * readers
+    elapsed = {}
+
+    def reader(index):
+        rng = random.Random(index)
+        checks = rng.sample(prefill, min(len(prefill), batch)) if prefill else []
+        start.wait()
+        begin = time.perf_counter()
+        for _ in range(rounds):
+            for i in range(0, len(queries), batch):
+                hits, misses, comparisons = tree.search_many(queries[i:i + batch])
+                searched[index] += len(comparisons)
+            hits, misses, comparisons = tree.search_many(checks)
+            searched[index] += len(comparisons)
+            if misses:
+                missing.append(misses)
+        elapsed[f'r{index}'] = time.perf_counter() - begin
+
+    def writer(index):
+        keys = pending[index::writers]
+        start.wait()
+        begin = time.perf_counter()
+        for key in keys:
+            tree.insert(key)
+        elapsed[f'w{index}'] = time.perf_counter() - begin
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+
+    start.wait()
+    begin = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    total_time = time.perf_counter() - begin
+
+    analysis = analyze(tree.tree)
+    stats = tree.thread_stats()
+
+    errors = list(analysis['errors'])
+    if analysis['size'] != len(numbers):
+        errors.append(f"A árvore tem {analysis['size']} nós, mas {len(numbers)} chaves foram inseridas.")
+    if tree.hits + tree.misses != sum(searched):
+        errors.append(f"Hits + misses = {tree.hits + tree.misses}, mas {sum(searched)} buscas foram feitas.")
+    if sum(s[2] for s in stats) != sum(searched):
+        errors.append("A soma das buscas por thread não confere.")
+    if missing:
+        errors.append(f"{sum(missing)} buscas por chaves já inseridas terminaram em miss.")
+
+    write_time = max((elapsed[f'w{i}'] for i in range(writers)), default=0.0)
+    return {
+        'time': total_time,
+        'searches': sum(searched),
+        'inserts': len(pending),
+        'write_time': write_time,
+        'errors': errors,
+    }
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Teste de carga com vários leitores e escritores na ConcurrentRedBlackTree.")
+    parser.add_argument('--file', default='100000.txt', help="Arquivo de Entradas Árvores (Construir e Consultar).")
+    parser.add_argument('--readers', nargs='*', type=int, default=[1, 2, 4, 8], help="Quantidades de threads leitoras testadas.")
+    parser.add_argument('--writers', type=int, default=1, help="Quantidade de threads escritoras.")
+    parser.add_argument('--batch', type=int, default=64, help="Chaves por lote de busca (1 = uma entrada na trava por busca).")
+    parser.add_argument('--rounds', type=int, default=1, help="Quantas vezes cada leitor percorre o arquivo de consulta.")
+    args = parser.parse_args()
+
+    numbers = read_numbers(os.path.join(INPUT_DIR, 'Construir', args.file))
+    queries = read_numbers(os.path.join(INPUT_DIR, 'Consultar', args.file))
+
+    print(f"{'Leitores':>8} {'Escritores':>10} {'Tempo (s)':>10} {'Buscas/s':>10} {'Inserções/s':>12} {'Árvore válida':>14}")
+
+    failed = False
+    for readers in args.readers:
+        result = run(numbers, queries, readers, args.writers, args.batch, args.rounds)
+        inserts = result['inserts'] / result['write_time'] if result['write_time'] else 0
+
+        print(f"{readers:>8} {args.writers:>10} {result['time']:>10.3f} {result['searches'] / result['time']:>10.0f} {inserts:>12.0f} {'sim' if not result['errors'] else 'não':>14}")
+        for message in result['errors']:
+            print(f"    {message}")
+        failed = failed or bool(result['errors'])
+
+    if failed:
+        raise SystemExit(1)
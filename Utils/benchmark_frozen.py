@@ -0,0 +1,68 @@
+import os
+import time
+import argparse
+import statistics
+
+from utils import INPUT_DIR, load_tree_class, read_numbers
+from vectorized_search import HAVE_NUMPY, search_batch
+
+# Compara as consultas na árvore com nós (search_many da BinarySearchTree e da
+# RedBlackTree) com as cópias congeladas pelo freeze() nas ordens por nível
+# (bfs) e van Emde Boas (veb). As comparações de cada busca precisam ser iguais
+# nas três versões, então a diferença de tempo vem só da disposição na memória.
+# Com o NumPy instalado, mede também a busca vetorizada (search_batch) sobre cada
+# cópia congelada.
+# Exemplo: python3 benchmark_frozen.py --files 100000.txt 250000.txt 500000.txt --repeat 5
+
+LAYOUTS = ('bfs', 'veb')
+
+def time_queries(searcher, queries, repeat, vectorized=False):
+    """
+    Mede o search_many (ou o search_batch, com vectorized) do lote repeat vezes
+    e retorna a mediana em segundos e as comparações de cada busca.
+    """
+    samples = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        if vectorized:
+            _, comparisons = search_batch(searcher, queries)
+        else:
+            _, _, comparisons = searcher.search_many(queries)
+        samples.append(time.perf_counter() - start_time)
+    return statistics.median(samples), list(map(int, comparisons))
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Compara as consultas na árvore com nós e nas cópias congeladas (bfs e veb).")
+    parser.add_argument('--files', nargs='*', default=['100000.txt', '250000.txt', '500000.txt'], help="Arquivos de Entradas Árvores (Construir e Consultar).")
+    parser.add_argument('--trees', nargs='*', default=['bst', 'rb'], choices=['bst', 'rb'], help="Árvores a congelar.")
+    parser.add_argument('--repeat', type=int, default=5, help="Repetições medidas de cada lote de consultas.")
+    args = parser.parse_args()
+
+    print(f"{'Arquivo':>12} {'Árvore':>6} {'Versão':>9} {'Congelar (s)':>13} {'Consulta (s)':>13} {'Consultas/s':>12} {'Aceleração':>11} {'Comparações':>12}")
+
+    for input_file in args.files:
+        numbers = read_numbers(os.path.join(INPUT_DIR, 'Construir', input_file))
+        queries = read_numbers(os.path.join(INPUT_DIR, 'Consultar', input_file))
+
+        for tree_name in args.trees:
+            tree = load_tree_class(tree_name)()
+            for number in numbers:
+                tree.insert(number)
+
+            reference, expected = time_queries(tree, queries, args.repeat)
+            print(f"{input_file:>12} {tree_name:>6} {'nós':>9} {'-':>13} {reference:>13.4f} {len(queries) / reference:>12.0f} {1:>10.2f}x {sum(expected):>12}")
+
+            for layout in LAYOUTS:
+                start_time = time.perf_counter()
+                frozen = tree.freeze(layout)
+                freeze_time = time.perf_counter() - start_time
+
+                for vectorized in (False, True) if HAVE_NUMPY else (False,):
+                    label = layout + (' numpy' if vectorized else '')
+
+                    elapsed, comparisons = time_queries(frozen, queries, args.repeat, vectorized)
+                    if comparisons != expected:
+                        raise SystemExit(f"{tree_name} ({label}): comparações diferentes da árvore com nós em {input_file}")
+
+                    print(f"{input_file:>12} {tree_name:>6} {label:>9} {freeze_time:>13.4f} {elapsed:>13.4f} {len(queries) / elapsed:>12.0f} {reference / elapsed:>10.2f}x {sum(comparisons):>12}")
@@ -0,0 +1,117 @@
+import os
+import argparse
+import statistics
+from functools import partial
+
+from utils import INPUT_DIR, RB_DIR, load_tree_class, import_tree_module, read_numbers
+from benchmark import time_build
+
+# Microbenchmark do insert da RedBlackTree: compara o insert atual (cores
+# inteiras, pai e avô em variáveis locais e alocação do nó só depois da
+# descida) com uma cópia do insert anterior, com as cores 'RED'/'BLACK' em
+# strings e node.parent.parent relido a cada passo.
+# Exemplo: python3 benchmark_insert.py --file 500000.txt --repeat 5 --no-gc
+
+RedBlackTree = load_tree_class('rb')
+Node = import_tree_module(RB_DIR, 'RedBlackTree').Node
+
+class ReferenceRedBlackTree(RedBlackTree):
+    """
+    Insert anterior da RedBlackTree, mantido apenas como referência de medida.
+    Só insert e _fix_insert são substituídos; as rotações não olham as cores.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.NIL.color = 'BLACK'
+
+    def insert(self, key):
+        new_node = Node(key)
+        new_node.left = self.NIL
+        new_node.right = self.NIL
+
+        parent = None
+        current = self.root
+        while current != self.NIL:
+            parent = current
+            self.comparison_count += 1
+            if new_node.key < current.key:
+                current = current.left
+            else:
+                current = current.right
+
+        new_node.parent = parent
+        if parent is None:
+            self.root = new_node
+        elif new_node.key < parent.key:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        new_node.color = 'RED'
+        self._fix_insert(new_node)
+
+    def _fix_insert(self, node):
+        while node.parent and node.parent.color == 'RED':
+            if node.parent == node.parent.parent.left:
+                uncle = node.parent.parent.right
+                if uncle.color == 'RED':
+                    node.parent.color = 'BLACK'
+                    uncle.color = 'BLACK'
+                    node.parent.parent.color = 'RED'
+                    node = node.parent.parent
+                else:
+                    if node == node.parent.right:
+                        node = node.parent
+                        self._left_rotate(node)
+                    node.parent.color = 'BLACK'
+                    node.parent.parent.color = 'RED'
+                    self._right_rotate(node.parent.parent)
+            else:
+                uncle = node.parent.parent.left
+                if uncle.color == 'RED':
+                    node.parent.color = 'BLACK'
+                    uncle.color = 'BLACK'
+                    node.parent.parent.color = 'RED'
+                    node = node.parent.parent
+                else:
+                    if node == node.parent.left:
+                        node = node.parent
+                        self._right_rotate(node)
+                    node.parent.color = 'BLACK'
+                    node.parent.parent.color = 'RED'
+                    self._left_rotate(node.parent.parent)
+            if node == self.root:
+                break
+        self.root.color = 'BLACK'
+
+VARIANTS = {
+    'referência (strings)': ReferenceRedBlackTree,
+    'atual': RedBlackTree,
+    'atual (reject)': partial(RedBlackTree, duplicates='reject'),
+}
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Compara o insert atual da RedBlackTree com o insert anterior de cores em strings.")
+    parser.add_argument('--file', default='500000.txt', help="Arquivo de Entradas Árvores/Construir.")
+    parser.add_argument('--warmup', type=int, default=1, help="Rodadas de aquecimento descartadas.")
+    parser.add_argument('--repeat', type=int, default=5, help="Repetições medidas.")
+    parser.add_argument('--no-gc', action='store_true', help="Desliga o coletor de lixo durante a construção.")
+    args = parser.parse_args()
+
+    numbers = read_numbers(os.path.join(INPUT_DIR, 'Construir', args.file))
+
+    print(f"{'Variante':>22} {'Mediana (s)':>12} {'Inserções/s':>12} {'Aceleração':>11} {'Comparações':>12}")
+
+    reference = None
+    for name, tree_class in VARIANTS.items():
+        samples = []
+        for i in range(args.warmup + args.repeat):
+            elapsed, tree = time_build(tree_class, numbers, args.no_gc)
+            if i >= args.warmup:
+                samples.append(elapsed)
+
+        median = statistics.median(samples) / 1e9
+        reference = reference or median
+        print(f"{name:>22} {median:>12.4f} {len(numbers) / median:>12.0f} {reference / median:>10.2f}x {tree.comparison_count:>12}")
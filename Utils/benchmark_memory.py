@@ -0,0 +1,52 @@
+import os
+import time
+import argparse
+
+from utils import INPUT_DIR, load_tree_class, read_numbers, list_input_files
+from memory_profile import MemoryProfile
+
+# Benchmark de memória por chave: compara as árvores baseadas na classe Node com
+# as versões de armazenamento compacto (vetores paralelos tipados).
+# Exemplo: python3 benchmark_memory.py --files 10000.txt 500000.txt
+
+parser = argparse.ArgumentParser(description="Compara a memória por chave das árvores com Node e das versões compactas.")
+parser.add_argument('--files', nargs='*', help="Arquivos de Entradas Árvores/Construir (padrão: todos).")
+parser.add_argument('--trees', nargs='*', default=['bst', 'bst-compact', 'rb', 'rb-compact'], help="Árvores a comparar.")
+args = parser.parse_args()
+
+def measure(tree_class, numbers):
+    """
+    Constrói a árvore com os números fornecidos sob o MemoryProfile e retorna o
+    perfil e o tempo de construção. A lista de entrada é lida antes do início
+    da medição, então só é contado o que a árvore aloca.
+    """
+    profile = MemoryProfile()
+    profile.start()
+    start_time = time.perf_counter()
+
+    tree = tree_class()
+    for number in numbers:
+        tree.insert(number)
+
+    total_time = time.perf_counter() - start_time
+    # A árvore continua referenciada aqui até o stop, que conta os seus nós.
+    profile.stop(tree)
+
+    return profile, total_time
+
+if __name__ == '__main__':
+
+    input_files = args.files or list_input_files()
+    tree_classes = {name: load_tree_class(name) for name in args.trees}
+
+    print(f"{'Arquivo':>12} {'Árvore':>12} {'Chaves':>8} {'Bytes':>12} {'Bytes/chave':>12} {'Pico (bytes)':>13} {'RSS +MB':>8} {'Nodes':>8} {'Tempo (s)':>10}")
+
+    for input_file in input_files:
+        numbers = read_numbers(os.path.join(INPUT_DIR, 'Construir', input_file))
+
+        for name, tree_class in tree_classes.items():
+            profile, total_time = measure(tree_class, numbers)
+            print(
+                f"{input_file:>12} {name:>12} {len(numbers):>8} {profile.traced_steady:>12} {profile.traced_steady / len(numbers):>12.1f}"
+                f" {profile.traced_peak:>13} {(profile.rss_after - profile.rss_before) / 2**20:>8.1f} {profile.nodes_allocated:>8} {total_time:>10.4f}"
+            )
@@ -0,0 +1,84 @@
+import os
+import time
+import random
+import argparse
+
+from utils import INPUT_DIR, load_tree_class, read_numbers
+
+# Compara rank, select e count_range da RedBlackTree com estatísticas de ordem
+# contra as mesmas respostas obtidas percorrendo a árvore em ordem.
+# Exemplo: python3 benchmark_order_statistics.py --file 100000.txt --queries 200
+
+parser = argparse.ArgumentParser(description="Compara as estatísticas de ordem com respostas obtidas por percurso.")
+parser.add_argument('--file', default='100000.txt', help="Arquivo de Entradas Árvores/Construir.")
+parser.add_argument('--queries', type=int, default=100, help="Quantidade de consultas de cada tipo.")
+parser.add_argument('--seed', type=int, default=0, help="Semente das consultas aleatórias.")
+args = parser.parse_args()
+
+# Respostas por percurso em ordem, usadas como referência.
+
+def rank_by_traversal(tree, key):
+    count = 0
+    for current in tree.iter_inorder():
+        if current > key:
+            break
+        count += 1
+    return count
+
+def select_by_traversal(tree, k):
+    for i, current in enumerate(tree.iter_inorder(), 1):
+        if i == k:
+            return current
+
+def count_range_by_traversal(tree, lo, hi):
+    count = 0
+    for current in tree.iter_inorder():
+        if current > hi:
+            break
+        if current >= lo:
+            count += 1
+    return count
+
+def timed(function, arguments):
+    """
+    Executa a função para cada tupla de argumentos e retorna as respostas e o
+    tempo médio por chamada, em microssegundos.
+    """
+    start = time.perf_counter()
+    answers = [function(*a) for a in arguments]
+    return answers, (time.perf_counter() - start) / len(arguments) * 1e6
+
+if __name__ == '__main__':
+
+    RedBlackTree = load_tree_class('rb')
+    numbers = read_numbers(os.path.join(INPUT_DIR, 'Construir', args.file))
+
+    # Custo de manter os tamanhos das subárvores durante a construção.
+    for order_statistics in (False, True):
+        start = time.perf_counter()
+        tree = RedBlackTree(order_statistics=order_statistics)
+        for number in numbers:
+            tree.insert(number)
+        label = "com" if order_statistics else "sem"
+        print(f"Construção {label} estatísticas de ordem: {time.perf_counter() - start:.4f} s")
+
+    random.seed(args.seed)
+    low, high = min(numbers), max(numbers)
+    keys = [(random.randint(low, high),) for _ in range(args.queries)]
+    positions = [(random.randint(1, len(numbers)),) for _ in range(args.queries)]
+    ranges = [tuple(sorted((random.randint(low, high), random.randint(low, high)))) for _ in range(args.queries)]
+
+    print(f"{'Operação':>12} {'Árvore (µs)':>12} {'Percurso (µs)':>14} {'Aceleração':>11}")
+
+    for name, fast, slow, arguments in (
+        ('rank', tree.rank, lambda k: rank_by_traversal(tree, k), keys),
+        ('select', tree.select, lambda k: select_by_traversal(tree, k), positions),
+        ('count_range', tree.count_range, lambda lo, hi: count_range_by_traversal(tree, lo, hi), ranges),
+    ):
+        fast_answers, fast_time = timed(fast, arguments)
+        slow_answers, slow_time = timed(slow, arguments)
+
+        # As duas formas precisam dar a mesma resposta.
+        assert fast_answers == slow_answers, name
+
+        print(f"{name:>12} {fast_time:>12.2f} {slow_time:>14.2f} {slow_time / fast_time:>10.0f}x")
@@ -0,0 +1,123 @@
+import os
+import gc
+import time
+import argparse
+import threading
+import statistics
+import tracemalloc
+
+from utils import INPUT_DIR, RB_DIR, load_tree_class, import_tree_module, read_numbers
+from benchmark import time_build
+from tree_analysis import analyze
+
+# Compara a PersistentRedBlackTree com a RedBlackTree:
+#
+# - vazão de inserção construindo a árvore inteira (na persistente, cada
+#   inserção cria uma versão nova e descarta a anterior);
+# - memória por versão: a partir de uma árvore com todas as chaves do arquivo,
+#   cria --versions versões de uma inserção cada, mantendo todas vivas, e mede
+#   os bytes alocados por versão, comparados com o custo de guardar cada versão
+#   como uma cópia inteira da RedBlackTree;
+# - leitura de versões antigas: uma thread consulta a primeira versão enquanto
+#   as novas são criadas, e as respostas precisam continuar as mesmas.
+#
+# Ao final, a última versão é validada pelo tree_analysis.
+# Exemplo: python3 benchmark_persistent.py --file 100000.txt --versions 10000 --repeat 3
+
+RedBlackTree = load_tree_class('rb')
+PersistentRedBlackTree = import_tree_module(RB_DIR, 'PersistentRedBlackTree').PersistentRedBlackTree
+
+class LatestVersion:
+    """
+    Guarda só a última versão da PersistentRedBlackTree, com um insert que a
+    substitui pela nova, para ser medida pelo time_build como as outras árvores.
+    """
+
+    def __init__(self):
+        self.tree = PersistentRedBlackTree()
+
+    def insert(self, key):
+        self.tree = self.tree.insert(key)
+
+def traced_bytes(function):
+    """
+    Executa a função com o tracemalloc ligado e retorna (resultado, bytes que
+    continuam alocados ao final).
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Compara a PersistentRedBlackTree com a RedBlackTree.")
+    parser.add_argument('--file', default='100000.txt', help="Arquivo de Entradas Árvores (Construir e Consultar).")
+    parser.add_argument('--versions', type=int, default=10000, help="Versões criadas na medida de memória.")
+    parser.add_argument('--repeat', type=int, default=3, help="Repetições da medida de vazão.")
+    args = parser.parse_args()
+
+    numbers = read_numbers(os.path.join(INPUT_DIR, 'Construir', args.file))
+    queries = read_numbers(os.path.join(INPUT_DIR, 'Consultar', args.file))
+
+    # Vazão de inserção
+    print(f"{'Árvore':>14} {'Mediana (s)':>12} {'Inserções/s':>12} {'Relativo':>9}")
+    reference = None
+    for name, factory in (('mutável', RedBlackTree), ('persistente', LatestVersion)):
+        samples = [time_build(factory, numbers, False)[0] / 1e9 for _ in range(args.repeat)]
+        median = statistics.median(samples)
+        reference = reference or median
+        print(f"{name:>14} {median:>12.4f} {len(numbers) / median:>12.0f} {reference / median:>8.2f}x")
+
+    # Memória por versão
+    base = PersistentRedBlackTree().insert_many(numbers)
+    extra = [number + 1 for number in queries[:args.versions]]
+
+    def create_versions():
+        versions = [base]
+        for key in extra:
+            versions.append(versions[-1].insert(key))
+        return versions
+
+    versions, versions_bytes = traced_bytes(create_versions)
+    _, copy_bytes = traced_bytes(lambda: time_build(RedBlackTree, numbers, False)[1])
+    count = len(versions) - 1
+
+    print()
+    print(f"Versões criadas: {count} (sobre {len(base)} chaves)")
+    print(f"Bytes por versão (persistente): {versions_bytes / count:.0f}")
+    print(f"Bytes por cópia inteira da RedBlackTree: {copy_bytes:.0f}")
+    print(f"Uma versão custa 1/{copy_bytes * count / versions_bytes:.0f} de uma cópia inteira")
+    del versions
+
+    # Leitura de uma versão antiga enquanto novas versões são criadas
+    old = base
+    _, _, expected = old.search_many(queries)
+    mismatches = []
+
+    def reader():
+        for _ in range(3):
+            _, _, comparisons = old.search_many(queries)
+            if comparisons != expected:
+                mismatches.append(1)
+
+    thread = threading.Thread(target=reader)
+    start_time = time.perf_counter()
+    thread.start()
+    latest = old.insert_many(extra)
+    thread.join()
+    elapsed = time.perf_counter() - start_time
+
+    print()
+    print(f"Leitura da versão antiga durante {len(extra)} inserções: {'respostas iguais' if not mismatches else 'RESPOSTAS DIFERENTES'} ({elapsed:.3f} s)")
+
+    analysis = analyze(latest)
+    print(f"Última versão: {len(latest)} chaves, altura {analysis['height']}, altura negra {analysis['black_height']}, "
+          f"{'válida' if not analysis['errors'] else 'inválida'}")
+    for message in analysis['errors']:
+        print(f"    {message}")
+
+    if mismatches or analysis['errors']:
+        raise SystemExit(1)
@@ -0,0 +1,58 @@
+import os
+import sys
+import argparse
+import subprocess
+
+from utils import INPUT_DIR, TREES
+
+# Compara o pico de memória (RSS) da leitura completa das entradas (read_numbers,
+# que monta a lista inteira) com a leitura em blocos (iter_number_chunks), com e
+# sem a construção da árvore. Como o pico de RSS só cresce durante a vida do
+# processo, cada medição roda em um interpretador novo.
+# Exemplo: python3 benchmark_streaming.py --file 500000.txt --tree rb
+
+PROBE = """
+import sys, time
+sys.path.insert(0, {utils!r})
+from utils import load_tree_class, read_numbers, iter_numbers, peak_rss
+
+baseline = peak_rss()
+start = time.perf_counter()
+numbers = read_numbers({path!r}) if {mode!r} == 'lista' else iter_numbers({path!r})
+
+if {tree!r}:
+    tree = load_tree_class({tree!r})()
+    for number in numbers:
+        tree.insert(number)
+else:
+    total = sum(numbers)
+
+print(baseline, peak_rss(), time.perf_counter() - start)
+"""
+
+def measure(path, mode, tree):
+    """
+    Executa a leitura (e a construção, se tree não for vazio) em um processo
+    novo e retorna o RSS do interpretador antes da leitura, o pico de RSS ao
+    final e o tempo.
+    """
+    code = PROBE.format(utils=os.path.dirname(os.path.abspath(__file__)), path=path, mode=mode, tree=tree)
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    baseline, peak, elapsed = result.stdout.split()
+    return int(baseline), int(peak), float(elapsed)
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Compara o pico de memória da leitura completa com a leitura em blocos.")
+    parser.add_argument('--file', default='500000.txt', help="Arquivo de Entradas Árvores/Construir.")
+    parser.add_argument('--tree', default='rb', choices=sorted(TREES), help="Árvore construída na segunda medição.")
+    args = parser.parse_args()
+
+    path = os.path.join(INPUT_DIR, 'Construir', args.file)
+
+    print(f"{'Medição':>24} {'Leitura':>8} {'Pico RSS (MB)':>14} {'Acima do Python (MB)':>21} {'Tempo (s)':>10}")
+
+    for label, tree in (("apenas leitura", ''), (f"construção ({args.tree})", args.tree)):
+        for mode in ('lista', 'blocos'):
+            baseline, peak, elapsed = measure(path, mode, tree)
+            print(f"{label:>24} {mode:>8} {peak / 2**20:>14.1f} {(peak - baseline) / 2**20:>21.1f} {elapsed:>10.3f}")
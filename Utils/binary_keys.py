@@ -0,0 +1,120 @@
+import os
+import sys
+import mmap
+import struct
+import argparse
+from array import array
+
+# Formato binário dos arquivos de chaves (.bin):
+#
+#   cabeçalho (16 bytes, little-endian)
+#     4 bytes  assinatura b'ARVK'
+#     1 byte   versão do formato
+#     1 byte   tamanho de cada chave em bytes (4 = int32, 8 = int64)
+#     2 bytes  reservado
+#     8 bytes  quantidade de chaves
+#   dados
+#     as chaves em sequência, como inteiros com sinal little-endian
+#
+# Como as chaves ficam alinhadas logo depois do cabeçalho, o arquivo pode ser
+# mapeado em memória e lido como um memoryview de inteiros, sem cópia.
+# Exemplo de conversão de todo o corpus: python3 binary_keys.py --convert-all
+
+MAGIC = b'ARVK'
+VERSION = 1
+HEADER = struct.Struct('<4sBBxxQ')
+
+# Tamanho da chave -> typecode usado pelo array/memoryview
+TYPECODES = {4: 'i', 8: 'q'}
+
+def write_keys(path, numbers):
+    """
+    Escreve as chaves no formato binário. Usa inteiros de 32 bits quando todas
+    as chaves cabem, e de 64 bits caso contrário.
+    """
+    keys = array('q', numbers)
+    if all(-2**31 <= key < 2**31 for key in keys):
+        keys = array('i', keys)
+
+    # O formato é little-endian, então inverte os bytes em máquinas big-endian.
+    if sys.byteorder == 'big':
+        keys.byteswap()
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, keys.itemsize, len(keys)))
+        keys.tofile(file)
+
+def load_keys(path):
+    """
+    Abre um arquivo de chaves binário mapeando-o em memória e retorna um
+    memoryview de inteiros sobre os dados, sem copiá-los. O mapeamento é
+    liberado quando o memoryview deixa de ser usado.
+    """
+    with open(path, 'rb') as file:
+        header = file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise ValueError(f"Arquivo de chaves inválido: {path}")
+
+        magic, version, itemsize, count = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION or itemsize not in TYPECODES:
+            raise ValueError(f"Arquivo de chaves inválido: {path}")
+
+        # Um arquivo sem chaves não tem dados para mapear.
+        if count == 0:
+            return memoryview(array(TYPECODES[itemsize]))
+
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    keys = memoryview(mapped)[HEADER.size:HEADER.size + count * itemsize].cast(TYPECODES[itemsize])
+
+    # Em máquinas big-endian os bytes precisam ser invertidos, o que exige cópia.
+    if sys.byteorder == 'big':
+        swapped = array(TYPECODES[itemsize])
+        swapped.frombytes(keys.cast('B'))
+        swapped.byteswap()
+        keys = memoryview(swapped)
+
+    return keys
+
+def read_keys(path):
+    """
+    Lê um arquivo de chaves binário e retorna as chaves em um array (cópia).
+    """
+    keys = load_keys(path)
+    copy = array(keys.format)
+    copy.frombytes(keys.cast('B'))
+    return copy
+
+def binary_path(path):
+    """
+    Retorna o caminho do arquivo binário correspondente a um arquivo .txt.
+    """
+    return os.path.splitext(path)[0] + '.bin'
+
+def convert(path):
+    """
+    Converte um arquivo de entrada .txt para o formato binário, ao lado do original.
+    """
+    from utils import read_numbers
+
+    output = binary_path(path)
+    write_keys(output, read_numbers(path))
+    return output
+
+if __name__ == '__main__':
+
+    from utils import INPUT_DIR, list_input_files
+
+    parser = argparse.ArgumentParser(description="Converte arquivos de entrada .txt para o formato binário de chaves.")
+    parser.add_argument('files', nargs='*', help="Arquivos .txt a converter.")
+    parser.add_argument('--convert-all', action='store_true', help="Converte todos os arquivos de Entradas Árvores (Construir e Consultar).")
+    args = parser.parse_args()
+
+    files = list(args.files)
+    if args.convert_all:
+        for folder in ('Construir', 'Consultar'):
+            folder = os.path.join(INPUT_DIR, folder)
+            files.extend(os.path.join(folder, f) for f in list_input_files(folder))
+
+    for path in files:
+        print(f"{path} -> {convert(path)}")
@@ -0,0 +1,50 @@
+from functools import cmp_to_key
+
+# Preparação das chaves para o from_iterable da BinarySearchTree e da
+# RedBlackTree, que montam a árvore balanceada a partir do lote ordenado e sem
+# duplicatas.
+
+def sorted_unique(iterable, count_comparisons=True):
+    """
+    Retorna as chaves do lote ordenadas e sem duplicatas, junto com o número de
+    comparações feitas.
+
+    Com count_comparisons=True (o que os main.py usam, pois exibem as
+    comparações da construção), uma entrada já ordenada (como as geradas pelo
+    create_inputs_seq.py) só é verificada em uma passada linear; caso contrário
+    as chaves são ordenadas contando cada comparação feita pela ordenação. Com
+    count_comparisons=False usa simplesmente sorted(set(...)), bem mais rápido,
+    e retorna 0 comparações.
+    """
+    if not count_comparisons:
+        return sorted(set(iterable)), 0
+
+    keys = list(iterable)
+    comparisons = 0
+
+    # Verifica se a entrada já está ordenada, comparando elementos vizinhos.
+    is_sorted = True
+    for i in range(1, len(keys)):
+        comparisons += 1
+        if keys[i] < keys[i - 1]:
+            is_sorted = False
+            break
+
+    if not is_sorted:
+        counter = [0]
+
+        def compare(a, b):
+            counter[0] += 1
+            return (a > b) - (a < b)
+
+        keys.sort(key=cmp_to_key(compare))
+        comparisons += counter[0]
+
+    # Remove as duplicatas, que ficam vizinhas depois de ordenar.
+    unique = keys[:1]
+    for i in range(1, len(keys)):
+        comparisons += 1
+        if keys[i] != keys[i - 1]:
+            unique.append(keys[i])
+
+    return unique, comparisons
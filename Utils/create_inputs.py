@@ -1,6 +1,7 @@
 import random
 import os
 import argparse
+from binary_keys import write_keys, binary_path
 
 # Gerador de entradas para criar as árvores binárias de busca
 # Exemplo: 40 54 34 42 17 61 98 13 14 35 39 8 37 31 86 92 15 27 59 28
@@ -9,28 +10,24 @@ parser = argparse.ArgumentParser(description="Gerador de entradas para criar as
 parser.add_argument('--amount', type=int, help="Número de números em cada arquivo.")
 parser.add_argument('--range', type=int, help="Range de números de 1 a RANGE.")
 parser.add_argument('--name', type=str, help="Nome do arquivo de saída.")
+parser.add_argument('--binary', action='store_true', help="Também grava as entradas no formato binário (.bin).")
 args = parser.parse_args()
 
 AMOUNT = args.amount
 RANGE = args.range
 
+def write_input(path, numbers):
+    # Grava os números separados por espaço e, se pedido, também em binário
+    with open(path, 'w') as file:
+        file.write(' '.join(map(str, numbers)))
+
+    if args.binary:
+        write_keys(binary_path(path), numbers)
+
 # Cria o arquivo de entrada para contruir a árvore 
 
 # Verifica se o argumento de nome do arquivo foi passado
-if args.name:
-    with open(f"../Entradas Árvores/Construir/{args.name}.txt", 'w') as file:
-        numbers = random.sample(range(1, RANGE), AMOUNT)
-        file.write(' '.join(map(str, numbers)))
-        
-    with open(f"../Entradas Árvores/Consultar/{args.name}.txt", 'w') as file:
-        numbers = random.sample(range(1, RANGE), AMOUNT)
-        file.write(' '.join(map(str, numbers)))
-else:
-    with open(f"../Entradas Árvores/Construir/entrada_{AMOUNT}.txt", 'w') as file:
-        numbers = random.sample(range(1, RANGE), AMOUNT)
-        file.write(' '.join(map(str, numbers)))
-        
-    with open(f"../Entradas Árvores/Consultar/entrada_{AMOUNT}.txt", 'w') as file:
-        numbers = random.sample(range(1, RANGE), AMOUNT)
-        file.write(' '.join(map(str, numbers)))
-    
\ No newline at end of file
+name = args.name if args.name else f"entrada_{AMOUNT}"
+
+write_input(f"../Entradas Árvores/Construir/{name}.txt", random.sample(range(1, RANGE), AMOUNT))
+write_input(f"../Entradas Árvores/Consultar/{name}.txt", random.sample(range(1, RANGE), AMOUNT))
@@ -1,6 +1,7 @@
 import random
 import os
 import argparse
+from binary_keys import write_keys, binary_path
 
 # Gerador de entradas para criar as árvores binárias de busca, neste arquivo ele cria uma sequencia de 1 a AMOUNT
 # Tendo uma diferença que aleatoriza os números de 1 a RANGE para a consulta
@@ -9,6 +10,7 @@ import argparse
 parser = argparse.ArgumentParser(description="Gerador de entradas para criar as árvores binárias de busca.")
 parser.add_argument('amount', type=int, help="Número de números em cada arquivo.")
 parser.add_argument('range', type=int, help="Range de números de 1 a RANGE.")
+parser.add_argument('--binary', action='store_true', help="Também grava as entradas no formato binário (.bin).")
 args = parser.parse_args()
 
 AMOUNT = args.amount
@@ -18,8 +20,14 @@ RANGE = args.range
 with open(f"../Entradas Árvores/Construir/entrada_{AMOUNT}.txt", 'w') as file:
     numbers = range(1, AMOUNT+1)
     file.write(' '.join(map(str, numbers)))
+
+if args.binary:
+    write_keys(binary_path(f"../Entradas Árvores/Construir/entrada_{AMOUNT}.txt"), numbers)
     
 # Cria o arquivo de entrada para consultar a árvore
 with open(f"../Entradas Árvores/Consultar/entrada_{AMOUNT}.txt", 'w') as file:
     numbers = random.sample(range(1, RANGE), AMOUNT)
-    file.write(' '.join(map(str, numbers)))
\ No newline at end of file
+    file.write(' '.join(map(str, numbers)))
+
+if args.binary:
+    write_keys(binary_path(f"../Entradas Árvores/Consultar/entrada_{AMOUNT}.txt"), numbers)
@@ -0,0 +1,66 @@
+import os
+import random
+import argparse
+
+# Gerador de cargas mistas de inserção, remoção e busca, para medir a vazão das
+# árvores sob alterações contínuas em vez de apenas construir e consultar.
+# Cada linha do arquivo gerado é uma operação: "I chave" (inserção),
+# "D chave" (remoção) ou "S chave" (busca). A linha "# carga mista" separa as
+# inserções iniciais das operações mistas.
+# Exemplo: python3 create_workload.py --amount 100000 --range 1000000 --initial 50000
+
+parser = argparse.ArgumentParser(description="Gerador de cargas mistas de inserção, remoção e busca.")
+parser.add_argument('--amount', type=int, required=True, help="Número de operações após a carga inicial.")
+parser.add_argument('--range', type=int, required=True, help="Range de chaves de 1 a RANGE.")
+parser.add_argument('--initial', type=int, default=0, help="Quantidade de inserções iniciais antes da carga mista.")
+parser.add_argument('--insert', type=float, default=0.3, help="Proporção de inserções.")
+parser.add_argument('--delete', type=float, default=0.3, help="Proporção de remoções.")
+parser.add_argument('--search', type=float, default=0.4, help="Proporção de buscas.")
+parser.add_argument('--seed', type=int, help="Semente do gerador aleatório.")
+parser.add_argument('--name', type=str, help="Nome do arquivo de saída.")
+args = parser.parse_args()
+
+AMOUNT = args.amount
+RANGE = args.range
+
+random.seed(args.seed)
+
+# Chaves presentes na árvore no momento, para que as remoções (e metade das
+# buscas) acertem chaves existentes.
+live = []
+
+def insert_key():
+    key = random.randrange(1, RANGE)
+    live.append(key)
+    return f"I {key}"
+
+def delete_key():
+    # Sem chaves para remover, a remoção vira uma inserção.
+    if not live:
+        return insert_key()
+
+    # Remove uma chave aleatória trocando-a com a última da lista.
+    i = random.randrange(len(live))
+    live[i], live[-1] = live[-1], live[i]
+    return f"D {live.pop()}"
+
+def search_key():
+    # Metade das buscas procura uma chave existente e metade uma chave aleatória.
+    if live and random.random() < 0.5:
+        return f"S {random.choice(live)}"
+    return f"S {random.randrange(1, RANGE)}"
+
+os.makedirs("../Entradas Árvores/Operações", exist_ok=True)
+
+name = args.name if args.name else f"operacoes_{AMOUNT}"
+
+with open(f"../Entradas Árvores/Operações/{name}.txt", 'w') as file:
+    for _ in range(args.initial):
+        file.write(insert_key() + "\n")
+
+    # Marca o início da carga mista, para que ela seja medida separadamente.
+    file.write("# carga mista\n")
+
+    operations = random.choices([insert_key, delete_key, search_key], weights=[args.insert, args.delete, args.search], k=AMOUNT)
+    for operation in operations:
+        file.write(operation() + "\n")
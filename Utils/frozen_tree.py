@@ -0,0 +1,207 @@
+from array import array
+
+# Cópia congelada das árvores com Node (BinarySearchTree e RedBlackTree), gerada
+# pelo freeze() delas. As duas só diferem na folha (o sentinela NIL da
+# rubro-negra ou None na árvore binária de busca), que o from_tree recebe.
+
+# Índice reservado para o "filho vazio", como o NIL das árvores compactas. A
+# raiz fica sempre na posição 1.
+NIL = 0
+
+# Ordens em que os nós podem ser dispostos nos vetores.
+LAYOUTS = ('bfs', 'veb')
+
+class FrozenTree:
+    """
+    Cópia imutável de uma BinarySearchTree ou RedBlackTree para a fase de
+    consultas, gerada pelo freeze() da árvore. Os nós ficam em vetores tipados
+    (chave, esquerda e direita), com a mesma forma da árvore original, em uma
+    de duas ordens:
+
+    - 'bfs' (Eytzinger): por nível, da raiz para as folhas. Os primeiros níveis,
+      visitados por todas as buscas, ficam juntos no início dos vetores.
+    - 'veb' (van Emde Boas): a árvore é cortada na metade da altura e a metade
+      de cima é gravada antes das subárvores de baixo, recursivamente. Cada
+      trecho de poucos níveis de um caminho fica contíguo, seja qual for o
+      tamanho da árvore.
+
+    Como a forma é mantida, search e search_many fazem exatamente as mesmas
+    comparações da árvore original e atualizam hits e misses da mesma forma.
+    """
+
+    def __init__(self, keys, left, right, layout='bfs', comparison_count=0):
+        self.key = keys
+        self.left = left
+        self.right = right
+        self.root = 1 if len(keys) > 1 else NIL
+        self.layout = layout
+
+        # As comparações da construção vêm da árvore original.
+        self.comparison_count = comparison_count
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        # Desconta a posição reservada para o NIL.
+        return len(self.key) - 1
+
+    @classmethod
+    def from_tree(cls, tree, layout='bfs', nil=None):
+        """
+        Gera a cópia congelada da árvore na ordem pedida. nil é a folha da
+        árvore: o tree.NIL da RedBlackTree ou None na BinarySearchTree.
+        """
+        if layout not in LAYOUTS:
+            raise ValueError(f"Ordem inválida: {layout!r}. Use {' ou '.join(LAYOUTS)}.")
+
+        order = _bfs_order(tree.root, nil) if layout == 'bfs' else _veb_order(tree.root, nil)
+
+        # Posição de cada nó nos vetores (a posição 0 é o NIL).
+        index = {id(node): i for i, node in enumerate(order, 1)}
+        index[id(nil)] = NIL
+
+        key_list = [0] + [node.key for node in order]
+        try:
+            keys = array('q', key_list)
+        except OverflowError:
+            keys = key_list  # Chaves fora dos 64 bits ficam em uma lista comum.
+
+        left = array('i', [NIL] + [index[id(node.left)] for node in order])
+        right = array('i', [NIL] + [index[id(node.right)] for node in order])
+
+        return cls(keys, left, right, layout, tree.comparison_count)
+
+    def search(self, key):
+        """
+        Busca a chave e retorna o número de comparações feitas. Incrementa os
+        contadores de hits e misses.
+        """
+        keys = self.key
+        left = self.left
+        right = self.right
+
+        current = self.root
+        comparisons = 0
+
+        while current != NIL:
+            comparisons += 1
+            current_key = keys[current]
+            if key == current_key:
+                self.hits += 1
+                return comparisons
+            elif key < current_key:
+                current = left[current]
+            else:
+                current = right[current]
+
+        self.misses += 1
+        return comparisons
+
+    def search_many(self, keys):
+        """
+        Busca um lote de chaves. Retorna a quantidade de hits, a de misses e a
+        lista com o número de comparações de cada chave, como o search_many da
+        árvore original.
+        """
+        node_keys = self.key
+        left = self.left
+        right = self.right
+        root = self.root
+
+        hits = 0
+        comparisons = []
+        append = comparisons.append
+
+        for key in keys:
+            current = root
+            count = 0
+            while current:
+                count += 1
+                current_key = node_keys[current]
+                if key == current_key:
+                    hits += 1
+                    break
+                elif key < current_key:
+                    current = left[current]
+                else:
+                    current = right[current]
+            append(count)
+
+        misses = len(comparisons) - hits
+        self.hits += hits
+        self.misses += misses
+
+        return hits, misses, comparisons
+
+    def iter_inorder(self):
+        """
+        Gera as chaves em ordem crescente.
+        """
+        keys = self.key
+        left = self.left
+        right = self.right
+
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield keys[node]
+            node = right[node]
+
+def _bfs_order(root, nil):
+    """
+    Lista os nós por nível, da esquerda para a direita.
+    """
+    if root is nil:
+        return []
+
+    order = [root]
+    for node in order:
+        if node.left is not nil:
+            order.append(node.left)
+        if node.right is not nil:
+            order.append(node.right)
+    return order
+
+def _veb_order(root, nil):
+    """
+    Lista os nós na ordem van Emde Boas da forma real da árvore: uma subárvore
+    de altura h é dividida na parte de cima (h // 2 níveis) e nas subárvores
+    penduradas logo abaixo dela, cada uma gravada em seguida pela mesma regra.
+    """
+    if root is nil:
+        return []
+
+    # Altura da árvore, por níveis, sem recursão (a BST pode ser bem profunda).
+    height = 0
+    level = [root]
+    while level:
+        height += 1
+        level = [child for node in level for child in (node.left, node.right) if child is not nil]
+
+    order = []
+    # Pilha de (raiz, quantidade de níveis) ainda por gravar; como uma pilha
+    # inverte a ordem, as partes de cada divisão são empilhadas do fim para o
+    # começo.
+    stack = [(root, height)]
+    while stack:
+        node, levels = stack.pop()
+        if levels == 1:
+            order.append(node)
+            continue
+
+        top = levels // 2
+
+        # Raízes das subárvores de baixo: os nós logo abaixo da parte de cima.
+        frontier = [node]
+        for _ in range(top):
+            frontier = [child for n in frontier for child in (n.left, n.right) if child is not nil]
+
+        for child in reversed(frontier):
+            stack.append((child, levels - top))
+        stack.append((node, top))
+
+    return order
@@ -0,0 +1,160 @@
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import subprocess
+from collections import deque
+
+from utils import INPUT_DIR, read_numbers
+from tree_server import LINE_LIMIT
+
+# Gerador de carga para o tree_server.py: abre várias conexões, envia pedidos de
+# busca (e, opcionalmente, de inserção e de intervalo) com as chaves de um
+# arquivo de Entradas Árvores/Consultar, mantendo até --pipeline pedidos sem
+# resposta em cada conexão, e mede a vazão e os percentis de latência (do envio
+# do pedido até a chegada da resposta).
+# Com --spawn, o próprio cliente inicia o servidor em outro processo e o encerra
+# ao final, então o teste inteiro roda só com este comando.
+# Exemplo: python3 load_client.py --spawn --backend rb --file 100000.txt --connections 4 --pipeline 16 --batch 64
+#          python3 load_client.py --unix /tmp/arvores.sock --requests 20000 --insert-ratio 0.1
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+def percentile(values, p):
+    """
+    Percentil p (0 a 100) de uma lista já ordenada, pelo posto mais próximo.
+    """
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(p / 100 * len(values)) - 1))
+    return values[index]
+
+def make_request(rng, queries, bounds, batch, insert_ratio, range_ratio):
+    """
+    Sorteia um pedido e retorna (tipo, linha). As chaves de busca vêm do arquivo
+    de consulta; as inserções usam chaves aleatórias entre os limites (menor e
+    maior chave) do arquivo.
+    """
+    draw = rng.random()
+    start = rng.randrange(len(queries))
+    keys = [queries[(start + i) % len(queries)] for i in range(batch)]
+
+    if draw < insert_ratio:
+        return 'I', "I " + ' '.join(str(rng.randint(*bounds)) for _ in range(batch)) + "\n"
+    if draw < insert_ratio + range_ratio:
+        lo = keys[0]
+        return 'R', f"R {lo} {lo + 1000}\n"
+    return 'S', "S " + ' '.join(map(str, keys)) + "\n"
+
+async def open_connection(args):
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix, limit=LINE_LIMIT)
+    host, port = args.tcp.rsplit(':', 1)
+    return await asyncio.open_connection(host, int(port), limit=LINE_LIMIT)
+
+async def run_connection(args, queries, requests, seed, latencies, counts):
+    """
+    Envia `requests` pedidos por uma conexão, com até args.pipeline pedidos em
+    trânsito, e registra a latência de cada um.
+    """
+    reader, writer = await open_connection(args)
+    rng = random.Random(seed)
+    window = asyncio.Semaphore(args.pipeline)
+    in_flight = deque()  # (tipo, instante do envio) na ordem dos pedidos
+    bounds = (min(queries), max(queries))
+
+    async def receive():
+        for _ in range(requests):
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("o servidor encerrou a conexão antes de responder a todos os pedidos")
+            kind, sent = in_flight.popleft()
+            latencies.append(time.perf_counter() - sent)
+            window.release()
+
+            if not line.startswith(b"OK"):
+                counts['errors'] += 1
+            elif kind == 'S':
+                answer = line[3:].strip()
+                counts['keys'] += len(answer)
+                counts['hits'] += answer.count(b"1")
+
+    receiver = asyncio.create_task(receive())
+
+    for _ in range(requests):
+        await window.acquire()
+        kind, line = make_request(rng, queries, bounds, args.batch, args.insert_ratio, args.range_ratio)
+        in_flight.append((kind, time.perf_counter()))
+        writer.write(line.encode())
+        counts[kind] += 1
+        await writer.drain()
+
+    await receiver
+    writer.write(b"Q\n")
+    await writer.drain()
+    writer.close()
+
+async def run_load(args, queries):
+    latencies = []
+    counts = {'S': 0, 'I': 0, 'R': 0, 'keys': 0, 'hits': 0, 'errors': 0}
+
+    # Divide os pedidos entre as conexões.
+    share = [args.requests // args.connections + (i < args.requests % args.connections) for i in range(args.connections)]
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(run_connection(args, queries, requests, i, latencies, counts)
+                           for i, requests in enumerate(share)))
+    return time.perf_counter() - start_time, sorted(latencies), counts
+
+def spawn_server(args):
+    """
+    Inicia o tree_server.py em outro processo e espera ele ficar pronto.
+    """
+    command = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tree_server.py'),
+               '--backend', args.backend, '--file', args.file]
+    command += ['--unix', args.unix] if args.unix else ['--tcp', args.tcp]
+
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    ready = server.stdout.readline()
+    if not ready:
+        raise SystemExit("O servidor terminou antes de ficar pronto.")
+    print(ready.strip())
+    return server
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Gerador de carga para o tree_server.py.")
+    address = parser.add_mutually_exclusive_group()
+    address.add_argument('--tcp', default='127.0.0.1:7070', help="Endereço host:porta do servidor.")
+    address.add_argument('--unix', help="Caminho do socket Unix do servidor.")
+    parser.add_argument('--file', default='100000.txt', help="Arquivo de Entradas Árvores/Consultar com as chaves buscadas.")
+    parser.add_argument('--connections', type=int, default=4, help="Quantidade de conexões simultâneas.")
+    parser.add_argument('--pipeline', type=int, default=16, help="Máximo de pedidos sem resposta por conexão.")
+    parser.add_argument('--batch', type=int, default=64, help="Chaves por pedido.")
+    parser.add_argument('--requests', type=int, default=10000, help="Total de pedidos, divididos entre as conexões.")
+    parser.add_argument('--insert-ratio', type=float, default=0.0, help="Fração dos pedidos que são inserções.")
+    parser.add_argument('--range-ratio', type=float, default=0.0, help="Fração dos pedidos que são consultas de intervalo.")
+    parser.add_argument('--spawn', action='store_true', help="Inicia o servidor (com --backend e --file) antes da carga e o encerra ao final.")
+    parser.add_argument('--backend', default='rb', help="Backend do servidor iniciado com --spawn.")
+    args = parser.parse_args()
+
+    queries = read_numbers(os.path.join(INPUT_DIR, 'Consultar', args.file))
+    server = spawn_server(args) if args.spawn else None
+
+    try:
+        elapsed, latencies, counts = asyncio.run(run_load(args, queries))
+    except ConnectionError as error:
+        raise SystemExit(f"Falha na conexão: {error}")
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    print(f"Pedidos: {len(latencies)} (busca {counts['S']}, inserção {counts['I']}, intervalo {counts['R']}), erros: {counts['errors']}")
+    print(f"Tempo total (s): {elapsed:.3f}")
+    print(f"Pedidos/s: {len(latencies) / elapsed:.0f}")
+    print(f"Chaves buscadas/s: {counts['keys'] / elapsed:.0f} (hits: {counts['hits']})")
+    print("Latência (ms): " + ', '.join(f"p{p:g} {percentile(latencies, p) * 1000:.3f}" for p in PERCENTILES)
+          + f", máx. {latencies[-1] * 1000:.3f}" if latencies else "Latência: sem pedidos")
@@ -0,0 +1,123 @@
+import gc
+import os
+import sys
+import threading
+import tracemalloc
+
+from utils import peak_rss
+
+# Perfil de memória de um trecho (a construção de uma árvore): memória alocada
+# pelo Python no pico e ao final (tracemalloc), RSS do processo amostrado em uma
+# thread durante o trecho, bytes por chave e quantidade de objetos Node criados.
+# Usado pelo --profile-memory dos main.py e pelo benchmark_memory.py.
+
+def current_rss():
+    """
+    Retorna o RSS atual do processo em bytes. Fora do Linux (sem /proc), usa o
+    pico de RSS, que é a melhor aproximação disponível.
+    """
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return peak_rss()
+
+def inner_tree(tree):
+    """
+    Retorna a árvore que guarda os nós: a própria árvore ou, nas que envolvem
+    outra (como a ConcurrentRedBlackTree), a árvore envolvida em tree.tree.
+    """
+    return getattr(tree, 'tree', tree)
+
+def node_class(tree):
+    """
+    Retorna a classe Node usada pela árvore (procurando no módulo da classe e
+    das classes base), ou None para as árvores compactas, que não usam Node.
+    """
+    for cls in type(inner_tree(tree)).__mro__:
+        node = getattr(sys.modules.get(cls.__module__), 'Node', None)
+        if node is not None:
+            return node
+    return None
+
+def count_instances(cls, exclude=None):
+    """
+    Conta os objetos vivos da classe, percorrendo os objetos rastreados pelo gc,
+    sem contar o objeto exclude (o NIL da rubro-negra, que não guarda chave).
+    """
+    if cls is None:
+        return 0
+    return sum(1 for obj in gc.get_objects() if type(obj) is cls and obj is not exclude)
+
+class MemoryProfile:
+    """
+    Mede a memória entre start() e stop(tree). O tracemalloc deixa o código
+    medido algumas vezes mais lento, então o tempo medido junto não deve ser
+    comparado com o de uma execução sem perfil. Pelo mesmo motivo, o RSS inclui
+    a memória usada pelo próprio tracemalloc para registrar as alocações.
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self._samples = []
+        self._running = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._running.wait(self.interval):
+            self._samples.append(current_rss())
+
+    def start(self, tree=None):
+        """
+        Inicia a medição. Se a árvore já existir (por exemplo, vazia), os nós
+        que ela já possui não entram na contagem de Node alocados.
+        """
+        gc.collect()
+        self.nodes_before = count_instances(node_class(tree), getattr(inner_tree(tree), 'NIL', None)) if tree is not None else 0
+        self.rss_before = current_rss()
+        self._samples = [self.rss_before]
+
+        tracemalloc.start()
+        self._running.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def stop(self, tree):
+        """
+        Encerra a medição e calcula os resultados para a árvore construída.
+        """
+        steady, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self._running.set()
+        self._thread.join()
+
+        self.traced_steady = steady
+        self.traced_peak = peak
+        self.rss_after = current_rss()
+        self.rss_peak = max(self._samples + [self.rss_after])
+
+        # O sentinela NIL da árvore não é um nó com chave e fica fora da contagem.
+        nodes = node_class(tree)
+        self.nodes_allocated = count_instances(nodes, getattr(inner_tree(tree), 'NIL', None)) - (self.nodes_before if nodes is not None else 0)
+
+        # As árvores compactas informam o tamanho; nas demais, as chaves são
+        # contadas pelo percurso (o NIL da rubro-negra é um Node sem chave).
+        self.keys = len(tree) if hasattr(tree, '__len__') else sum(1 for _ in tree.iter_inorder())
+
+        return self
+
+    def rows(self):
+        """
+        Linhas (descrição, valor) no formato das tabelas e arquivos de resultados.
+        """
+        mb = 2 ** 20
+        return [
+            ("Memória alocada no pico (MB)", f"{self.traced_peak / mb:.2f}"),
+            ("Memória alocada ao final (MB)", f"{self.traced_steady / mb:.2f}"),
+            ("Bytes por chave", f"{self.traced_steady / self.keys:.1f}" if self.keys else "-"),
+            ("RSS no pico (MB)", f"{self.rss_peak / mb:.2f}"),
+            ("RSS ao final (MB)", f"{self.rss_after / mb:.2f}"),
+            ("Aumento do RSS (MB)", f"{(self.rss_after - self.rss_before) / mb:.2f}"),
+            ("Objetos Node alocados", str(self.nodes_allocated)),
+        ]
@@ -0,0 +1,232 @@
+from itertools import islice
+
+# Operações comuns às árvores com Node (BinarySearchTree e RedBlackTree), que
+# só diferem na folha: a RedBlackTree usa o nó sentinela self.NIL e a
+# BinarySearchTree usa None.
+
+class NodeTreeMixin:
+    """
+    Buscas em lote e percursos iterativos compartilhados pela BinarySearchTree e
+    pela RedBlackTree. A folha é o self.NIL da árvore, ou None quando ela não
+    tem sentinela.
+    """
+
+    def search_many(self, keys):
+        """
+        Busca um lote de chaves de uma só vez. Retorna a quantidade de hits, a de
+        misses e a lista com o número de comparações de cada chave, que é o mesmo
+        valor que o search retornaria. Também incrementa os contadores de hits e
+        misses da árvore.
+
+        Quando o lote está em ordem crescente, cada busca reaproveita o caminho
+        da anterior (finger search): em vez de recomeçar na raiz, sobe apenas até
+        o primeiro nó do caminho cujo intervalo ainda contém a nova chave e desce
+        a partir dele.
+        """
+        found, comparisons = self._search_batch(keys)
+        hits = sum(found)
+        return hits, len(found) - hits, comparisons
+
+    def search_mask(self, keys):
+        """
+        Busca um lote de chaves como o search_many e retorna uma lista com True
+        para cada chave encontrada.
+        """
+        found, _ = self._search_batch(keys)
+        return found
+
+    def _search_batch(self, keys):
+        """
+        Busca do search_many e do search_mask: retorna a lista de acertos e a de
+        comparações de cada chave, atualizando hits e misses da árvore.
+        """
+        nil = getattr(self, 'NIL', None)
+        found = []
+        comparisons = []
+
+        # O lote é percorrido duas vezes, então iteradores viram uma lista.
+        if not hasattr(keys, '__getitem__'):
+            keys = list(keys)
+
+        # Verifica se o lote está em ordem crescente.
+        is_sorted = all(a <= b for a, b in zip(keys, islice(keys, 1, None)))
+
+        if not is_sorted:
+            # Lote fora de ordem: cada chave é buscada a partir da raiz.
+            for key in keys:
+                current = self.root
+                count = 0
+                while current is not nil:
+                    count += 1
+                    if key == current.key:
+                        break
+                    elif key < current.key:
+                        current = current.left
+                    else:
+                        current = current.right
+                found.append(current is not nil)
+                comparisons.append(count)
+        else:
+            # Caminho da raiz até o último nó visitado e, para cada nó do caminho,
+            # o limite superior (exclusivo) das chaves que podem chegar até ele.
+            # None indica que não há limite superior.
+            path = []
+            bounds = []
+
+            for key in keys:
+                # Como as chaves são crescentes, o limite inferior de cada nó do
+                # caminho continua valendo; basta subir enquanto a chave passar
+                # do limite superior do nó no topo.
+                while bounds and bounds[-1] is not None and key >= bounds[-1]:
+                    path.pop()
+                    bounds.pop()
+
+                # A descida recomeça no nó do topo do caminho (ou na raiz).
+                if path:
+                    current = path.pop()
+                    upper = bounds.pop()
+                else:
+                    current = self.root
+                    upper = None
+
+                while current is not nil:
+                    path.append(current)
+                    bounds.append(upper)
+                    if key == current.key:
+                        break
+                    elif key < current.key:
+                        upper = current.key
+                        current = current.left
+                    else:
+                        current = current.right
+                found.append(current is not nil)
+
+                # Cada nó do caminho corresponde a uma comparação feita pelo search.
+                comparisons.append(len(path))
+
+        hits = sum(found)
+        self.hits += hits
+        self.misses += len(found) - hits
+
+        return found, comparisons
+
+    def _inorder_nodes(self, node):
+        """
+        Gera os nós da subárvore em ordem (esquerda, nó, direita) usando uma pilha
+        explícita, então mesmo uma árvore degenerada não esbarra no limite de recursão.
+        """
+        nil = getattr(self, 'NIL', None)
+        stack = []
+
+        while stack or node is not nil:
+            # Desce o máximo possível pela esquerda, empilhando o caminho.
+            while node is not nil:
+                stack.append(node)
+                node = node.left
+
+            node = stack.pop()
+            yield node
+
+            # Continua pela subárvore direita do nó visitado.
+            node = node.right
+
+    def _preorder_nodes(self, node):
+        """
+        Gera os nós da subárvore em pré-ordem (nó, esquerda, direita).
+        """
+        nil = getattr(self, 'NIL', None)
+        stack = [node] if node is not nil else []
+
+        while stack:
+            node = stack.pop()
+            yield node
+
+            # Empilha a direita primeiro para que a esquerda seja visitada antes.
+            if node.right is not nil:
+                stack.append(node.right)
+            if node.left is not nil:
+                stack.append(node.left)
+
+    def _postorder_nodes(self, node):
+        """
+        Gera os nós da subárvore em pós-ordem (esquerda, direita, nó).
+        """
+        nil = getattr(self, 'NIL', None)
+        stack = []
+        last_visited = None
+
+        while stack or node is not nil:
+            while node is not nil:
+                stack.append(node)
+                node = node.left
+
+            top = stack[-1]
+
+            # Só visita o nó depois que a subárvore direita já foi visitada.
+            if top.right is not nil and top.right is not last_visited:
+                node = top.right
+            else:
+                last_visited = stack.pop()
+                yield last_visited
+
+    def _level_order_nodes(self, node):
+        """
+        Gera os nós da subárvore por nível (busca em largura).
+        """
+        nil = getattr(self, 'NIL', None)
+        level = [node] if node is not nil else []
+
+        while level:
+            next_level = []
+            for node in level:
+                yield node
+                if node.left is not nil:
+                    next_level.append(node.left)
+                if node.right is not nil:
+                    next_level.append(node.right)
+            level = next_level
+
+    def iter_inorder(self, node=None):
+        """
+        Gera as chaves em ordem crescente, de forma preguiçosa.
+        """
+        for node in self._inorder_nodes(self.root if node is None else node):
+            yield node.key
+
+    def iter_preorder(self, node=None):
+        """
+        Gera as chaves em pré-ordem, de forma preguiçosa.
+        """
+        for node in self._preorder_nodes(self.root if node is None else node):
+            yield node.key
+
+    def iter_postorder(self, node=None):
+        """
+        Gera as chaves em pós-ordem, de forma preguiçosa.
+        """
+        for node in self._postorder_nodes(self.root if node is None else node):
+            yield node.key
+
+    def iter_level_order(self, node=None):
+        """
+        Gera as chaves nível por nível, de forma preguiçosa.
+        """
+        for node in self._level_order_nodes(self.root if node is None else node):
+            yield node.key
+
+    def write_traversal(self, path, order='inorder'):
+        """
+        Escreve as chaves da árvore em um arquivo, uma por linha, na ordem pedida
+        ('inorder', 'preorder', 'postorder' ou 'level'). As chaves são gravadas
+        conforme o percurso avança, sem montar uma lista intermediária.
+        """
+        traversals = {
+            'inorder': self.iter_inorder,
+            'preorder': self.iter_preorder,
+            'postorder': self.iter_postorder,
+            'level': self.iter_level_order,
+        }
+
+        with open(path, 'w') as file:
+            for key in traversals[order]():
+                file.write(f"{key}\n")
@@ -0,0 +1,147 @@
+import os
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from utils import INPUT_DIR, OUTPUT_DIR, read_numbers, list_input_files
+from arvores import create, available_backends, describe
+from results import result_rows, write_rows, write_report
+from memory_profile import MemoryProfile
+
+# Executa a construção e a consulta de várias árvores em vários arquivos de
+# entrada ao mesmo tempo, distribuindo cada combinação (árvore × arquivo ×
+# repetição) entre os processos de um ProcessPoolExecutor. As árvores são os
+# backends do registro do pacote arvores, então qualquer backend registrado
+# (inclusive a lista ordenada e as árvores instrumentadas) pode ser executado.
+# Exemplo: python3 parallel_runner.py --trees bst rb --repeat 3 --jobs 8
+#          python3 parallel_runner.py --repeat 3 --memory --csv resultados.csv --report relatorio.txt
+
+def measure_memory(tree_name, numbers):
+    """
+    Constrói a árvore novamente sob o MemoryProfile (o mesmo do --profile-memory
+    dos main.py) e retorna os bytes que continuam alocados ao final. É uma
+    construção separada da medida, para que o tracemalloc não afete o tempo.
+    """
+    profile = MemoryProfile()
+    profile.start()
+    tree = create(tree_name)
+    for number in numbers:
+        tree.insert(number)
+
+    # O perfil recebe a árvore de dentro do backend, que é onde estão os Node.
+    profile.stop(tree.tree)
+    return profile.traced_steady
+
+def run_job(job):
+    """
+    Constrói a árvore a partir do arquivo de entrada e realiza as consultas,
+    retornando as métricas que o process_file dos main.py exibe. Com a memória
+    habilitada, inclui também os bytes ocupados pela árvore (senão, None).
+    """
+    tree_name, input_file, repetition, memory = job
+
+    numbers = read_numbers(os.path.join(INPUT_DIR, 'Construir', input_file))
+    query_numbers = read_numbers(os.path.join(INPUT_DIR, 'Consultar', input_file))
+
+    # Construção
+    start_time = time.perf_counter()
+    tree = create(tree_name)
+    for number in numbers:
+        tree.insert(number)
+    total_time = time.perf_counter() - start_time
+
+    # Consulta (os backends sem busca em lote própria usam a do SortedSet)
+    start_query_time = time.perf_counter()
+    _, _, query_comparisons = tree.search_many(query_numbers)
+    total_query_time = time.perf_counter() - start_query_time
+
+    stats = tree.stats()
+
+    return {
+        'tree': tree_name,
+        'input_file': input_file,
+        'size': len(numbers),
+        'repetition': repetition,
+        'comparisons': stats['comparisons'],
+        'time': total_time,
+        'query_comparisons': sum(query_comparisons),
+        'query_time': total_query_time,
+        'hits': stats['hits'],
+        'misses': stats['misses'],
+        'memory': measure_memory(tree_name, numbers) if memory else None,
+    }
+
+def run_all(trees, input_files, repeat=1, jobs=None, memory=False):
+    """
+    Executa todas as combinações em paralelo e retorna os resultados sempre na
+    mesma ordem (arquivo, árvore, repetição), independente de qual processo
+    terminou primeiro.
+    """
+    job_list = [(tree, input_file, repetition, memory)
+                for input_file in input_files
+                for tree in trees
+                for repetition in range(1, repeat + 1)]
+
+    # Os arquivos maiores são enviados primeiro para equilibrar a carga entre os
+    # processos; a ordem de envio não afeta a ordem dos resultados.
+    submission = sorted(job_list, key=lambda job: -os.path.getsize(os.path.join(INPUT_DIR, 'Construir', job[1])))
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {job: executor.submit(run_job, job) for job in submission}
+        return [futures[job].result() for job in job_list]
+
+if __name__ == '__main__':
+
+    import rich.console as console
+    import rich.table as table
+
+    parser = argparse.ArgumentParser(description="Executa as árvores em todos os arquivos de entrada usando vários processos.")
+    parser.add_argument('--trees', nargs='*', default=['bst', 'rb'], choices=available_backends(), help="Árvores (backends do pacote arvores) a executar.")
+    parser.add_argument('--files', nargs='*', help="Arquivos de Entradas Árvores/Construir (padrão: todos).")
+    parser.add_argument('--repeat', type=int, default=1, help="Quantidade de repetições de cada combinação.")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="Quantidade de processos usados.")
+    parser.add_argument('--memory', action='store_true', help="Mede também a memória ocupada por cada árvore (em uma construção extra).")
+    parser.add_argument('--csv', help="Grava uma linha por (árvore, tamanho, fase, repetição) neste CSV em Saídas Árvores.")
+    parser.add_argument('--jsonl', help="Grava as mesmas linhas do --csv neste JSONL em Saídas Árvores.")
+    parser.add_argument('--report', help="Grava o relatório agregado (árvores lado a lado por tamanho) neste arquivo em Saídas Árvores.")
+    args = parser.parse_args()
+
+    console = console.Console()
+
+    results = run_all(args.trees, args.files or list_input_files(), args.repeat, args.jobs, args.memory)
+
+    # Exibe todos os resultados em uma única tabela
+    result_table = table.Table(title="Resultados da Construção e Consulta das Árvores")
+    result_table.add_column("Arquivo", justify="left", style="cyan")
+    result_table.add_column("Árvore", justify="left", style="cyan")
+    result_table.add_column("Rep.", justify="right")
+    result_table.add_column("Comparações (construção)", justify="right", style="green")
+    result_table.add_column("Tempo de construção (s)", justify="right", style="green")
+    result_table.add_column("Comparações (consulta)", justify="right", style="green")
+    result_table.add_column("Tempo de consulta (s)", justify="right", style="green")
+    result_table.add_column("Hits", justify="right", style="green")
+    result_table.add_column("Misses", justify="right", style="red")
+
+    for result in results:
+        result_table.add_row(
+            result['input_file'],
+            describe(result['tree']),
+            str(result['repetition']),
+            str(result['comparisons']),
+            f"{result['time']:.6f}",
+            str(result['query_comparisons']),
+            f"{result['query_time']:.6f}",
+            str(result['hits']),
+            str(result['misses']),
+        )
+
+    console.print(result_table)
+
+    # Saídas estruturadas, todas gravadas de uma vez ao final
+    rows = [row for result in results for row in result_rows(result)]
+    if args.csv:
+        write_rows(os.path.join(OUTPUT_DIR, args.csv), rows)
+    if args.jsonl:
+        write_rows(os.path.join(OUTPUT_DIR, args.jsonl), rows)
+    if args.report:
+        write_report(os.path.join(OUTPUT_DIR, args.report), rows)
@@ -0,0 +1,140 @@
+import os
+import csv
+import json
+import tempfile
+import statistics
+from contextlib import contextmanager
+
+# Saída estruturada dos resultados: uma linha por (árvore, tamanho da entrada,
+# fase, repetição), em CSV ou JSONL, e um relatório agregado que alinha as
+# árvores lado a lado em todos os tamanhos. Todos os arquivos são gravados de
+# forma atômica: o conteúdo vai para um arquivo temporário na mesma pasta, que
+# só então substitui o arquivo final, então quem lê nunca vê um arquivo pela
+# metade (nem a ausência dele, como no antigo remove-e-escreve).
+
+FIELDS = ('tree', 'input_file', 'size', 'phase', 'repetition', 'comparisons', 'time', 'hits', 'misses', 'memory')
+
+@contextmanager
+def atomic_write(path, newline=None):
+    """
+    Abre um arquivo temporário para escrita de texto e, se o bloco terminar sem
+    erro, o move para `path` com os.replace. Em caso de erro o arquivo original
+    fica intacto.
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=folder, prefix='.tmp-', suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'w', newline=newline) as file:
+            yield file
+
+        # O mkstemp cria o arquivo só para o dono; mantém as permissões do
+        # arquivo substituído ou usa as de um arquivo comum.
+        os.chmod(temp_path, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def result_rows(result):
+    """
+    Converte um resultado do parallel_runner.run_job nas linhas estruturadas
+    das fases de construção (build) e consulta (query).
+    """
+    common = {
+        'tree': result['tree'],
+        'input_file': result['input_file'],
+        'size': result['size'],
+        'repetition': result['repetition'],
+        'memory': result.get('memory'),
+    }
+    return [
+        dict(common, phase='build', comparisons=result['comparisons'], time=result['time'], hits=None, misses=None),
+        dict(common, phase='query', comparisons=result['query_comparisons'], time=result['query_time'], hits=result['hits'], misses=result['misses']),
+    ]
+
+def write_rows(path, rows):
+    """
+    Grava as linhas em CSV (extensão .csv) ou JSONL (qualquer outra extensão).
+    Campos ausentes ficam vazios no CSV e null no JSONL.
+    """
+    if path.endswith('.csv'):
+        with atomic_write(path, newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=FIELDS)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({field: row.get(field) for field in FIELDS})
+    else:
+        with atomic_write(path) as file:
+            for row in rows:
+                file.write(json.dumps({field: row.get(field) for field in FIELDS}, ensure_ascii=False) + "\n")
+
+def aggregate(rows):
+    """
+    Agrupa as repetições por (tamanho, fase, árvore) e retorna, para cada grupo,
+    as medianas de comparações, tempo e memória.
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['size'], row['phase'], row['tree']), []).append(row)
+
+    summary = {}
+    for key, group in groups.items():
+        memory = [row['memory'] for row in group if row.get('memory') is not None]
+        summary[key] = {
+            'comparisons': statistics.median(row['comparisons'] for row in group),
+            'time': statistics.median(row['time'] for row in group),
+            'memory': statistics.median(memory) if memory else None,
+            'repetitions': len(group),
+        }
+    return summary
+
+def write_report(path, rows):
+    """
+    Grava o relatório agregado: para cada fase, uma tabela com uma linha por
+    tamanho de entrada e as colunas das árvores lado a lado (medianas das
+    repetições). Com duas árvores, inclui a razão entre elas.
+    """
+    summary = aggregate(rows)
+    sizes = sorted({size for size, _, _ in summary})
+    trees = list(dict.fromkeys(row['tree'] for row in rows))
+    titles = {'build': "Construção", 'query': "Consulta"}
+
+    with atomic_write(path) as file:
+        if len(trees) == 2:
+            file.write(f"Razões: {trees[0]} / {trees[1]}\n\n")
+
+        for phase in ('build', 'query'):
+            file.write(f"{titles[phase]} (medianas das repetições)\n")
+
+            header = f"{'Tamanho':>10}"
+            for tree in trees:
+                header += f" {tree + ' comp.':>18} {tree + ' tempo (s)':>18} {tree + ' bytes/chave':>20}"
+            if len(trees) == 2:
+                header += f" {'Razão comp.':>12} {'Razão tempo':>12}"
+            file.write(header + "\n")
+
+            for size in sizes:
+                cells = [summary.get((size, phase, tree)) for tree in trees]
+                if not any(cells):
+                    continue
+
+                line = f"{size:>10}"
+                for cell in cells:
+                    if cell is None:
+                        line += f" {'-':>18} {'-':>18} {'-':>20}"
+                        continue
+                    per_key = f"{cell['memory'] / size:.1f}" if cell['memory'] is not None and size else '-'
+                    line += f" {cell['comparisons']:>18.0f} {cell['time']:>18.6f} {per_key:>20}"
+
+                # Razão da primeira árvore em relação à segunda
+                if len(trees) == 2 and all(cells):
+                    first, second = cells
+                    comparisons = first['comparisons'] / second['comparisons'] if second['comparisons'] else float('nan')
+                    time = first['time'] / second['time'] if second['time'] else float('nan')
+                    line += f" {comparisons:>12.2f} {time:>12.2f}"
+
+                file.write(line + "\n")
+
+            file.write("\n")
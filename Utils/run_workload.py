@@ -0,0 +1,82 @@
+import os
+import time
+import argparse
+
+from utils import INPUT_DIR, load_tree_class
+
+# Executa um arquivo de operações gerado pelo create_workload.py em cada árvore,
+# medindo a vazão (operações por segundo) da carga inicial e da carga mista.
+# Exemplo: python3 run_workload.py operacoes_100000.txt --trees bst rb
+
+def read_workload(path):
+    """
+    Lê o arquivo de operações, retornando a lista de operações iniciais e a da
+    carga mista, cada uma como pares (operação, chave).
+    """
+    phases = [[]]
+    with open(path, 'r') as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('#'):
+                phases.append([])  # Início da carga mista
+                continue
+            try:
+                operation, key = line.split()
+                phases[-1].append((operation, int(key)))
+            except ValueError:
+                continue  # Ignora linhas inválidas
+
+    initial = phases[0] if len(phases) > 1 else []
+    mixed = phases[-1]
+    return initial, mixed
+
+def run_operations(tree, operations):
+    """
+    Executa as operações na árvore e retorna o tempo gasto e a quantidade de
+    operações de cada tipo que tiveram efeito (inserções, remoções e hits).
+    """
+    insert = tree.insert
+    delete = tree.delete
+    search = tree.search
+    deleted = 0
+    hits_before = tree.hits
+
+    start_time = time.perf_counter()
+    for operation, key in operations:
+        if operation == 'I':
+            insert(key)
+        elif operation == 'D':
+            deleted += delete(key)
+        else:
+            search(key)
+    total_time = time.perf_counter() - start_time
+
+    return total_time, deleted, tree.hits - hits_before
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Mede a vazão das árvores sob uma carga mista de operações.")
+    parser.add_argument('workload', help="Arquivo de Entradas Árvores/Operações.")
+    parser.add_argument('--trees', nargs='*', default=['bst', 'rb'], choices=['bst', 'rb'], help="Árvores a medir.")
+    args = parser.parse_args()
+
+    initial, mixed = read_workload(os.path.join(INPUT_DIR, 'Operações', args.workload))
+    counts = {op: sum(1 for operation, _ in mixed if operation == op) for op in 'IDS'}
+
+    print(f"Carga inicial: {len(initial)} inserções")
+    print(f"Carga mista: {counts['I']} inserções, {counts['D']} remoções, {counts['S']} buscas")
+    print(f"{'Árvore':>8} {'Inicial (ops/s)':>16} {'Mista (ops/s)':>14} {'Remoções efetivas':>18} {'Hits':>8} {'Chaves no fim':>14}")
+
+    for name in args.trees:
+        tree = load_tree_class(name)()
+
+        initial_time, _, _ = run_operations(tree, initial)
+        mixed_time, deleted, hits = run_operations(tree, mixed)
+
+        size = sum(1 for _ in tree.iter_inorder())
+        initial_rate = len(initial) / initial_time if initial_time else 0.0
+        mixed_rate = len(mixed) / mixed_time if mixed_time else 0.0
+
+        print(f"{name:>8} {initial_rate:>16.0f} {mixed_rate:>14.0f} {deleted:>18} {hits:>8} {size:>14}")
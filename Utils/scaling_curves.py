@@ -0,0 +1,181 @@
+import os
+import csv
+import math
+import argparse
+
+from utils import ROOT_DIR, list_input_files
+from arvores import available_backends
+from parallel_runner import run_all
+from results import result_rows, atomic_write
+
+# Curvas de escala: executa as árvores em todos os tamanhos de entrada, ajusta
+# as comparações e os tempos de cada fase aos modelos n, n log n e n² e grava
+# os gráficos (PNG e SVG) em Ánalise/Curvas, sem abrir janela (backend Agg).
+# Como cada fase faz n operações, o esperado para uma árvore balanceada é
+# n log n; uma série que se ajusta melhor a outro modelo, como a árvore binária
+# de busca com entrada sequencial (n²), é marcada como desvio.
+# Exemplo: python3 scaling_curves.py --repeat 3 --jobs 8
+#          python3 scaling_curves.py --from-csv ../Saídas\ Árvores/resultados.csv
+
+CURVES_DIR = os.path.join(ROOT_DIR, 'Ánalise', 'Curvas')
+
+MODELS = {
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log2(n),
+    'n²': lambda n: n * n,
+}
+
+EXPECTED_MODEL = 'n log n'
+
+METRICS = {'comparisons': "Comparações", 'time': "Tempo (s)"}
+PHASES = {'build': "construção", 'query': "consulta"}
+
+def fit(sizes, values):
+    """
+    Ajusta values ≈ c · f(n) para cada modelo por mínimos quadrados relativos
+    (cada ponto pesa o mesmo, independente da sua escala) e retorna
+    {modelo: (c, erro)}, com o erro sendo a raiz do erro relativo quadrático
+    médio. Também retorna o expoente b da reta log(valor) = a + b·log(n).
+    """
+    fits = {}
+    for name, model in MODELS.items():
+        ratios = [value / model(n) for n, value in zip(sizes, values)]
+        # Minimiza Σ (c·f(n)/valor - 1)², cuja solução fecha em c = Σ(1/r) / Σ(1/r²).
+        c = sum(1 / r for r in ratios) / sum(1 / (r * r) for r in ratios)
+        error = math.sqrt(sum((c / r - 1) ** 2 for r in ratios) / len(ratios))
+        fits[name] = (c, error)
+
+    logs = [(math.log(n), math.log(value)) for n, value in zip(sizes, values)]
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    spread = sum((x - mean_x) ** 2 for x, _ in logs)
+    exponent = sum((x - mean_x) * (y - mean_y) for x, y in logs) / spread if spread else float('nan')
+
+    return fits, exponent
+
+def series_name(tree, input_file):
+    """
+    Separa as séries pelo prefixo do arquivo de entrada: 100000.txt é a entrada
+    aleatória e entrada_100000.txt a sequencial do create_inputs_seq.py.
+    """
+    prefix = ''.join(c for c in os.path.splitext(input_file)[0] if not c.isdigit()).strip('_')
+    return f"{tree} ({prefix})" if prefix else tree
+
+def collect_series(rows):
+    """
+    Agrupa as linhas em séries (fase, métrica, série) -> {n: mediana}.
+    """
+    samples = {}
+    for row in rows:
+        for metric in METRICS:
+            key = (row['phase'], metric, series_name(row['tree'], row['input_file']))
+            samples.setdefault(key, {}).setdefault(int(row['size']), []).append(float(row[metric]))
+
+    series = {}
+    for key, by_size in samples.items():
+        medians = {n: sorted(values)[len(values) // 2] for n, values in sorted(by_size.items())}
+        # Os modelos só fazem sentido com n > 1 e valores positivos (escala log).
+        series[key] = {n: value for n, value in medians.items() if n > 1 and value > 0}
+    return series
+
+def read_rows(path):
+    with open(path, newline='') as file:
+        return list(csv.DictReader(file))
+
+def plot(series, fits, output_dir, formats):
+    """
+    Desenha, para cada fase e métrica, os pontos medidos de cada série e a curva
+    do modelo que melhor se ajustou a ela. Retorna os arquivos gravados.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+
+    for phase, phase_title in PHASES.items():
+        for metric, metric_title in METRICS.items():
+            names = [name for (p, m, name) in series if p == phase and m == metric]
+            if not names:
+                continue
+
+            figure, axes = plt.subplots(figsize=(9, 6))
+            for name in names:
+                points = series[(phase, metric, name)]
+                sizes = list(points)
+                line, = axes.plot(sizes, list(points.values()), 'o', label=f"{name} (medido)")
+
+                best = fits[(phase, metric, name)]['best']
+                c = fits[(phase, metric, name)]['models'][best][0]
+                axes.plot(sizes, [c * MODELS[best](n) for n in sizes], '--', color=line.get_color(), label=f"{name}: {c:.3g} · {best}")
+
+            axes.set_xscale('log')
+            axes.set_yscale('log')
+            axes.set_xlabel("Quantidade de elementos (n)")
+            axes.set_ylabel(metric_title)
+            axes.set_title(f"{metric_title} na {phase_title}")
+            axes.grid(True, which='both', alpha=0.3)
+            axes.legend()
+
+            for extension in formats:
+                path = os.path.join(output_dir, f"{metric}_{phase}.{extension}")
+                figure.savefig(path)
+                written.append(path)
+            plt.close(figure)
+
+    return written
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Ajusta as comparações e os tempos das árvores aos modelos n, n log n e n² e gera os gráficos.")
+    parser.add_argument('--trees', nargs='*', default=['bst', 'rb'], choices=available_backends(), help="Árvores (backends do pacote arvores) a executar.")
+    parser.add_argument('--files', nargs='*', help="Arquivos de Entradas Árvores/Construir (padrão: todos).")
+    parser.add_argument('--max-size', type=int, help="Ignora as entradas com mais elementos que este valor.")
+    parser.add_argument('--repeat', type=int, default=1, help="Quantidade de repetições de cada combinação.")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="Quantidade de processos usados.")
+    parser.add_argument('--from-csv', help="Usa as linhas de um CSV do parallel_runner.py --csv em vez de executar as árvores.")
+    parser.add_argument('--formats', nargs='*', default=['png', 'svg'], choices=['png', 'svg'], help="Formatos dos gráficos.")
+    args = parser.parse_args()
+
+    if args.from_csv:
+        rows = read_rows(args.from_csv)
+    else:
+        input_files = args.files or list_input_files()
+        if args.max_size:
+            input_files = [f for f in input_files if int(''.join(filter(str.isdigit, f)) or 0) <= args.max_size]
+        rows = [row for result in run_all(args.trees, input_files, args.repeat, args.jobs) for row in result_rows(result)]
+
+    series = collect_series(rows)
+
+    # Ajuste de cada série e detecção dos desvios
+    fits = {}
+    lines = [f"{'Fase':>8} {'Métrica':>12} {'Série':>22} {'Expoente':>9} " + ' '.join(f"{'Erro ' + m:>12}" for m in MODELS) + f" {'Melhor':>8}  Desvio"]
+    for (phase, metric, name), points in sorted(series.items()):
+        if len(points) < 2:
+            continue
+
+        models, exponent = fit(list(points), list(points.values()))
+        best = min(models, key=lambda m: models[m][1])
+        deviation = best != EXPECTED_MODEL
+        fits[(phase, metric, name)] = {'models': models, 'best': best, 'exponent': exponent, 'deviation': deviation}
+
+        lines.append(
+            f"{phase:>8} {metric:>12} {name:>22} {exponent:>9.3f} "
+            + ' '.join(f"{models[m][1]:>12.3f}" for m in MODELS)
+            + f" {best:>8}  {'SIM' if deviation else '-'}"
+        )
+
+    report = "\n".join(lines) + "\n"
+    print(report, end='')
+
+    os.makedirs(CURVES_DIR, exist_ok=True)
+    with atomic_write(os.path.join(CURVES_DIR, 'ajustes.txt')) as file:
+        file.write(report)
+
+    series = {key: points for key, points in series.items() if key in fits}
+    try:
+        for path in plot(series, fits, CURVES_DIR, args.formats):
+            print(f"Gráfico gravado em {path}")
+    except ImportError:
+        print("O matplotlib não está instalado; apenas os ajustes foram gravados (pip install matplotlib).")
@@ -0,0 +1,113 @@
+import sys
+import mmap
+import struct
+from array import array
+
+# Formato dos snapshots gravados pelo save e lidos pelo load das árvores (com
+# Node e compactas), no mesmo estilo dos arquivos de chaves do binary_keys.py:
+#
+#   cabeçalho (24 bytes, little-endian)
+#     4 bytes  assinatura (b'ARVB' na árvore binária de busca, b'ARVR' na rubro-negra)
+#     1 byte   versão do formato
+#     1 byte   tamanho de cada chave em bytes (4 = int32, 8 = int64)
+#     1 byte   política de duplicatas (índice em DUPLICATES; 0 = 'allow')
+#     1 byte   reservado
+#     8 bytes  quantidade de nós (n)
+#     8 bytes  índice da raiz (0 para a árvore vazia)
+#   vetores de n + 1 posições, um depois do outro
+#     chaves, filho esquerdo, filho direito e pai (int32) e, na rubro-negra,
+#     a cor (1 byte, 1 = vermelho) e, com a política 'count', as repetições
+#     de cada chave (uint32)
+#
+# Os nós são numerados em pré-ordem a partir de 1, e a posição 0 representa o
+# NIL (ou a ausência de nó), o mesmo layout das árvores compactas. Como os
+# vetores ficam alinhados, o arquivo pode ser mapeado em memória e usado
+# diretamente, sem cópia.
+
+BST_MAGIC = b'ARVB'
+RB_MAGIC = b'ARVR'
+VERSION = 1
+HEADER = struct.Struct('<4sBBBxQQ')
+
+# Assinatura -> typecodes dos vetores que vêm depois das chaves
+LAYOUTS = {
+    BST_MAGIC: ('i', 'i', 'i'),
+    RB_MAGIC: ('i', 'i', 'i', 'B'),
+}
+
+# Tamanho da chave -> typecode usado pelo array/memoryview
+TYPECODES = {4: 'i', 8: 'q'}
+
+# Políticas de duplicatas da RedBlackTree, na ordem do byte do cabeçalho. As
+# árvores sem política gravam 'allow'.
+DUPLICATES = ('allow', 'reject', 'count')
+COUNT_TYPECODE = 'I'
+
+def write_snapshot(path, magic, root, keys, *vectors, duplicates='allow', counts=None):
+    """
+    Grava a raiz e os vetores de uma árvore (chaves e, na ordem de
+    LAYOUTS[magic], esquerda, direita, pai e cor) no formato de snapshot, junto
+    com a política de duplicatas e, na política 'count', as repetições de cada
+    nó.
+    """
+    keys = array('q', keys)
+    if all(-2**31 <= key < 2**31 for key in keys):
+        keys = array('i', keys)
+
+    arrays = [keys] + [array(typecode, values) for typecode, values in zip(LAYOUTS[magic], vectors)]
+    if duplicates == 'count':
+        arrays.append(array(COUNT_TYPECODE, counts))
+
+    # O formato é little-endian, então inverte os bytes em máquinas big-endian.
+    if sys.byteorder == 'big':
+        for values in arrays:
+            values.byteswap()
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(magic, VERSION, keys.itemsize, DUPLICATES.index(duplicates), len(keys) - 1, root))
+        for values in arrays:
+            values.tofile(file)
+
+def read_snapshot(path, magic, use_mmap=False):
+    """
+    Lê um snapshot com a assinatura esperada e retorna a raiz, os vetores
+    (chaves e os de LAYOUTS[magic]), a política de duplicatas e o vetor de
+    repetições (None fora da política 'count'). Com use_mmap=True os vetores
+    são memoryviews somente leitura sobre o arquivo mapeado em memória; caso
+    contrário são arrays copiados.
+    """
+    with open(path, 'rb') as file:
+        header = file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise ValueError(f"Snapshot inválido: {path}")
+
+        file_magic, version, itemsize, policy, count, root = HEADER.unpack(header)
+        if (file_magic != magic or version != VERSION or itemsize not in TYPECODES
+                or policy >= len(DUPLICATES)):
+            raise ValueError(f"Snapshot inválido: {path}")
+
+        duplicates = DUPLICATES[policy]
+        typecodes = (TYPECODES[itemsize],) + LAYOUTS[magic]
+        if duplicates == 'count':
+            typecodes += (COUNT_TYPECODE,)
+
+        # O mapeamento só é possível quando a ordem dos bytes da máquina é a do arquivo.
+        if use_mmap and sys.byteorder == 'little':
+            view = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            offset = HEADER.size
+            arrays = []
+            for typecode in typecodes:
+                size = array(typecode).itemsize * (count + 1)
+                arrays.append(view[offset:offset + size].cast(typecode))
+                offset += size
+        else:
+            arrays = []
+            for typecode in typecodes:
+                values = array(typecode)
+                values.fromfile(file, count + 1)
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                arrays.append(values)
+
+    counts = arrays.pop() if duplicates == 'count' else None
+    return (root, *arrays, duplicates, counts)
@@ -0,0 +1,105 @@
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+from utils import TREES, BST_DIR, RB_DIR
+
+# Mede o tempo de inicialização de um interpretador novo que apenas importa o
+# módulo de cada árvore, e verifica quais bibliotecas de terceiros foram
+# carregadas junto. Os módulos das árvores não devem importar nenhuma delas.
+# Mede também os módulos opcionais do Utils (que podem carregar bibliotecas
+# pesadas, como o NumPy) e a inicialização dos main.py até a leitura dos
+# argumentos, que não deve carregar nenhum desses módulos sem a opção que o usa.
+# Exemplo: python3 startup_time.py --repeat 20
+
+THIRD_PARTY = ('rich', 'networkx', 'matplotlib', 'graphviz', 'numpy')
+
+# Código executado no interpretador novo: importa o módulo e lista as
+# bibliotecas de terceiros presentes em sys.modules.
+PROBE = """
+import sys
+sys.path.insert(0, {folder!r})
+import {module}
+print(','.join(m for m in {third_party!r} if m in sys.modules))
+"""
+
+# Mesma verificação para um main.py: executado com --help, ele faz todas as
+# importações do topo do arquivo e termina ao ler os argumentos.
+DRIVER_PROBE = """
+import os, sys, runpy
+os.chdir({folder!r})
+sys.path.insert(0, {folder!r})
+sys.argv = ['main.py', '--help']
+sys.stdout = open(os.devnull, 'w')
+try:
+    runpy.run_path('main.py', run_name='__main__')
+except SystemExit:
+    pass
+sys.stdout = sys.__stdout__
+print(','.join(m for m in {third_party!r} + {optional!r} if m in sys.modules))
+"""
+
+# Módulos do Utils que os main.py só devem importar sob demanda.
+OPTIONAL_MODULES = ('vectorized_search',)
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def measure(folder, module, repeat, probe=PROBE):
+    """
+    Executa o interpretador `repeat` vezes importando o módulo e retorna os
+    tempos (em segundos) e as bibliotecas de terceiros carregadas.
+    """
+    code = probe.format(folder=folder, module=module, third_party=THIRD_PARTY, optional=OPTIONAL_MODULES)
+    times = []
+    loaded = ''
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        times.append(time.perf_counter() - start)
+        loaded = result.stdout.strip()
+
+    return times, loaded
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Mede o tempo de importação dos módulos das árvores.")
+    parser.add_argument('--repeat', type=int, default=10, help="Quantidade de execuções de cada medição.")
+    args = parser.parse_args()
+
+    # Referência: interpretador que não importa nada.
+    baseline, _ = measure('.', 'sys', args.repeat)
+    baseline = statistics.median(baseline)
+
+    print(f"{'Árvore':>17} {'Mediana (ms)':>13} {'Acima do Python (ms)':>21}  Bibliotecas de terceiros")
+    print(f"{'(python)':>17} {baseline * 1000:>13.1f} {0:>21.1f}  -")
+
+    for name, (folder, module, _) in TREES.items():
+        times, loaded = measure(folder, module, args.repeat)
+        median = statistics.median(times)
+        print(f"{name:>17} {median * 1000:>13.1f} {(median - baseline) * 1000:>21.1f}  {loaded or '-'}")
+
+    for module in OPTIONAL_MODULES:
+        times, loaded = measure(UTILS_DIR, module, args.repeat)
+        median = statistics.median(times)
+        print(f"{module:>17} {median * 1000:>13.1f} {(median - baseline) * 1000:>21.1f}  {loaded or '-'}")
+
+    # Os main.py precisam do rich; sem ele, a medição desses não é feita.
+    regressions = []
+    for name, folder in (('main bst', BST_DIR), ('main rb', RB_DIR)):
+        try:
+            times, loaded = measure(folder, 'main', args.repeat, DRIVER_PROBE)
+        except subprocess.CalledProcessError:
+            print(f"{name:>17} {'-':>13} {'-':>21}  (não executou; o rich está instalado?)")
+            continue
+        median = statistics.median(times)
+        print(f"{name:>17} {median * 1000:>13.1f} {(median - baseline) * 1000:>21.1f}  {loaded or '-'}")
+        regressions += [f"{name} carrega {module} sem a opção que o usa" for module in loaded.split(',') if module in OPTIONAL_MODULES + ('numpy',)]
+
+    for message in regressions:
+        print(f"Atenção: {message}")
+    if regressions:
+        raise SystemExit(1)
@@ -0,0 +1,50 @@
+import threading
+
+# Contadores de busca separados por thread, para as árvores que são buscadas por
+# várias threads ao mesmo tempo (ConcurrentRedBlackTree e PersistentRedBlackTree).
+
+class _ThreadCounters:
+    # Contadores de busca de uma thread; só a própria thread os altera.
+    __slots__ = ('hits', 'misses', 'searches', 'comparisons')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.searches = 0
+        self.comparisons = 0
+
+class PerThreadCounters:
+    """
+    Contadores de busca separados por thread: cada thread altera apenas os
+    seus, sem trava, e os totais somam os contadores de todas as threads no
+    momento da leitura. Usado pela ConcurrentRedBlackTree e pela
+    PersistentRedBlackTree.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._counters = []  # Contadores de todas as threads que já buscaram
+        self._lock = threading.Lock()
+
+    def mine(self):
+        """
+        Contadores da thread atual, criados na primeira busca dela.
+        """
+        counters = getattr(self._local, 'counters', None)
+        if counters is None:
+            counters = self._local.counters = _ThreadCounters()
+            with self._lock:
+                self._counters.append(counters)
+        return counters
+
+    def total(self, name):
+        with self._lock:
+            return sum(getattr(counters, name) for counters in self._counters)
+
+    def per_thread(self):
+        """
+        Lista com (hits, misses, buscas, comparações) de cada thread que já
+        buscou, na ordem da primeira busca de cada uma.
+        """
+        with self._lock:
+            return [(c.hits, c.misses, c.searches, c.comparisons) for c in self._counters]
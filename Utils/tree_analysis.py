@@ -0,0 +1,218 @@
+import os
+import argparse
+from collections import Counter
+
+from results import atomic_write
+
+# Métricas de forma das árvores (altura, altura negra, profundidade média e
+# máxima, histograma de profundidades) e validação das propriedades da árvore
+# binária de busca e da rubro-negra. Tudo é calculado com pilha explícita, então
+# funciona mesmo em árvores degeneradas de 500000 nós.
+# Funciona com as quatro árvores: BinarySearchTree, CompactBinarySearchTree,
+# RedBlackTree e CompactRedBlackTree, e também com a PersistentRedBlackTree.
+# Exemplo: python3 tree_analysis.py --tree bst --file 500000.txt --write-result-archive
+
+def _accessors(tree):
+    """
+    Retorna (nil, filho esquerdo, filho direito, pai, chave, é vermelho) para
+    percorrer a árvore sem depender da sua representação. Para as árvores sem
+    cores, é vermelho é None; para as sem ponteiro para o pai, pai é None.
+    """
+    # Árvores compactas: os nós são índices em vetores paralelos, com o 0 como NIL.
+    if isinstance(tree.root, int):
+        color = getattr(tree, 'color', None)
+        return (
+            0,
+            tree.left.__getitem__,
+            tree.right.__getitem__,
+            tree.parent.__getitem__,
+            tree.key.__getitem__,
+            (lambda n: color[n] == 1) if color is not None else None,
+        )
+
+    # PersistentRedBlackTree: os nós são compartilhados entre versões e não
+    # guardam o pai; as folhas são None.
+    if getattr(tree, 'persistent', False):
+        return (
+            None,
+            lambda n: n.left,
+            lambda n: n.right,
+            None,
+            lambda n: n.key,
+            lambda n: n.color == 1,
+        )
+
+    # RedBlackTree: folhas apontam para o nó sentinela NIL e a raiz tem pai None.
+    if hasattr(tree, 'NIL'):
+        return (
+            tree.NIL,
+            lambda n: n.left,
+            lambda n: n.right,
+            lambda n: n.parent if n.parent is not None else tree.NIL,
+            lambda n: n.key,
+            lambda n: n.color == 1,
+        )
+
+    # BinarySearchTree: folhas e pai da raiz são None.
+    return (
+        None,
+        lambda n: n.left,
+        lambda n: n.right,
+        lambda n: n.parent,
+        lambda n: n.key,
+        None,
+    )
+
+def analyze(tree, max_errors=10):
+    """
+    Percorre a árvore uma única vez e retorna um dicionário com:
+
+    - size: quantidade de nós;
+    - height: altura em níveis (0 para a árvore vazia, 1 só com a raiz);
+    - average_depth e max_depth: profundidade média e máxima dos nós, com a
+      raiz na profundidade 0 (uma busca com acerto faz profundidade + 1
+      comparações);
+    - depth_histogram: profundidade -> quantidade de nós;
+    - black_height: nós pretos em um caminho da raiz até um NIL, contando a
+      raiz (None para a árvore binária de busca);
+    - errors: violações encontradas (no máximo max_errors), vazia se a árvore
+      for válida.
+
+    A ordenação é validada com limites inclusivos (esquerda <= nó <= direita),
+    pois as rotações podem levar uma chave repetida para a subárvore esquerda.
+    """
+    nil, left, right, parent, key, is_red = _accessors(tree)
+
+    histogram = Counter()
+    errors = []
+    black_heights = set()
+
+    def error(message):
+        if len(errors) < max_errors:
+            errors.append(message)
+
+    if is_red is not None and tree.root != nil and is_red(tree.root):
+        error("A raiz é vermelha.")
+
+    # Cada entrada: (nó, profundidade, limite inferior, limite superior,
+    # nós pretos desde a raiz até o nó, inclusive).
+    stack = [(tree.root, 0, None, None, 0)] if tree.root != nil else []
+    while stack:
+        node, depth, lo, hi, blacks = stack.pop()
+        histogram[depth] += 1
+
+        node_key = key(node)
+        left_hi = right_lo = node_key
+        if (lo is not None and node_key < lo) or (hi is not None and node_key > hi):
+            error(f"A chave {node_key} está fora do intervalo [{lo}, {hi}] imposto pelos ancestrais.")
+
+            # Os descendentes continuam validados pelos limites dos ancestrais,
+            # para que uma chave errada não gere uma violação por descendente.
+            left_hi, right_lo = hi, lo
+
+        if is_red is not None:
+            red = is_red(node)
+            if not red:
+                blacks += 1
+
+        for child, child_lo, child_hi in ((left(node), lo, left_hi), (right(node), right_lo, hi)):
+            if child == nil:
+                if is_red is not None:
+                    black_heights.add(blacks)
+                continue
+
+            if parent is not None and parent(child) != node:
+                error(f"O pai do nó {key(child)} não aponta para o nó {node_key}.")
+            if is_red is not None and red and is_red(child):
+                error(f"O nó vermelho {node_key} tem o filho vermelho {key(child)}.")
+
+            stack.append((child, depth + 1, child_lo, child_hi, blacks))
+
+    if len(black_heights) > 1:
+        error(f"Caminhos até o NIL com quantidades diferentes de nós pretos: {sorted(black_heights)}.")
+
+    size = sum(histogram.values())
+    max_depth = max(histogram) if histogram else 0
+
+    return {
+        'size': size,
+        'height': max_depth + 1 if size else 0,
+        'average_depth': sum(d * c for d, c in histogram.items()) / size if size else 0.0,
+        'max_depth': max_depth,
+        'depth_histogram': dict(sorted(histogram.items())),
+        'black_height': (min(black_heights) if black_heights else 0) if is_red is not None else None,
+        'errors': errors,
+    }
+
+def validate(tree):
+    """
+    Retorna True se a árvore respeita a ordenação (e as propriedades
+    rubro-negras, quando for o caso).
+    """
+    return not analyze(tree, max_errors=1)['errors']
+
+def analysis_rows(analysis):
+    """
+    Linhas (descrição, valor) do resultado de analyze, no formato das tabelas e
+    arquivos de resultados.
+    """
+    rows = [
+        ("Quantidade de nós", str(analysis['size'])),
+        ("Altura (níveis)", str(analysis['height'])),
+        ("Profundidade média", f"{analysis['average_depth']:.4f}"),
+        ("Profundidade máxima", str(analysis['max_depth'])),
+    ]
+    if analysis['black_height'] is not None:
+        rows.append(("Altura negra", str(analysis['black_height'])))
+    rows.append(("Válida", "sim" if not analysis['errors'] else "não"))
+    return rows
+
+def write_analysis(path, analysis):
+    """
+    Grava o resultado de analyze no arquivo, com o histograma de profundidades
+    e as violações encontradas.
+    """
+    with atomic_write(path) as file:
+        for description, value in analysis_rows(analysis):
+            file.write(f"{description}: {value}\n")
+
+        for message in analysis['errors']:
+            file.write(f"Violação: {message}\n")
+
+        file.write("\nHistograma de profundidades:\n")
+        for depth, count in analysis['depth_histogram'].items():
+            file.write(f"{depth}: {count}\n")
+
+if __name__ == '__main__':
+
+    from utils import INPUT_DIR, OUTPUT_DIR, TREES, RESULT_SUFFIXES, load_tree_class, read_numbers, list_input_files
+
+    parser = argparse.ArgumentParser(description="Calcula as métricas de forma e valida as árvores construídas.")
+    parser.add_argument('--tree', choices=sorted(TREES), nargs='+', default=['bst', 'rb'], help="Árvores analisadas.")
+    parser.add_argument('--file', nargs='+', help="Arquivos de Entradas Árvores/Construir (padrão: todos).")
+    parser.add_argument('--bulk-load', action='store_true', help="Constrói as árvores com from_iterable (apenas bst e rb).")
+    parser.add_argument('--write-result-archive', action='store_true', help="Grava a análise em Saídas Árvores/Construir.")
+    args = parser.parse_args()
+
+    for input_file in args.file or list_input_files():
+        numbers = read_numbers(os.path.join(INPUT_DIR, 'Construir', input_file))
+
+        for name in args.tree:
+            cls = load_tree_class(name)
+            if args.bulk_load and hasattr(cls, 'from_iterable'):
+                # A análise não usa as comparações da construção.
+                tree = cls.from_iterable(numbers, count_comparisons=False)
+            else:
+                tree = cls()
+                for number in numbers:
+                    tree.insert(number)
+
+            analysis = analyze(tree)
+            print(f"{input_file} ({name}):")
+            for description, value in analysis_rows(analysis):
+                print(f"  {description}: {value}")
+            for message in analysis['errors']:
+                print(f"  Violação: {message}")
+
+            if args.write_result_archive:
+                write_analysis(os.path.join(OUTPUT_DIR, 'Construir', f"{input_file}_{RESULT_SUFFIXES[name]}_Analise.txt"), analysis)
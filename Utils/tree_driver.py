@@ -0,0 +1,346 @@
+import os
+import sys
+import time
+import argparse
+from itertools import chain
+
+from utils import (INPUT_DIR, OUTPUT_DIR, TREES, RESULT_SUFFIXES, import_tree_module, load_tree_class,
+                   iter_number_chunks, list_input_files, peak_rss)
+from binary_keys import load_keys, binary_path
+from tree_analysis import analyze, analysis_rows, write_analysis
+from results import atomic_write
+from memory_profile import MemoryProfile
+
+# O rich é usado para as tabelas de resultados. As bibliotecas de visualização
+# (networkx e matplotlib) só são importadas pela árvore com --print-graphical.
+try:
+    import rich.console as console
+    import rich.table as table
+except ImportError:
+    sys.exit("O pacote rich é necessário para executar o programa: pip install rich")
+
+# Programa dos main.py das duas árvores: constrói a árvore a partir de um arquivo
+# de Entradas Árvores/Construir, consulta as chaves de Entradas Árvores/Consultar
+# e exibe (e, com --write-result-archive, grava em Saídas Árvores) os resultados.
+# Cada main.py só escolhe a árvore; os argumentos e as medidas são os mesmos.
+# Exemplo: python3 main.py --all_inputs --snapshot --stats --write-result-archive
+
+# Árvores com main.py: nome em TREES -> (nome exibido, módulo da versão instrumentada)
+DRIVERS = {
+    'bst': ("Árvore Binária de Busca", 'InstrumentedBinarySearchTree'),
+    'rb': ("Árvore Rubro-Negra", 'InstrumentedRedBlackTree'),
+}
+
+# Quantidade máxima de números lidos e ainda não processados com --stream
+STREAM_BUFFER = 65536
+
+def build_parser(tree_name):
+    """
+    Argumentos do main.py da árvore, os mesmos para as duas.
+    """
+    label = DRIVERS[tree_name][0]
+
+    # Argumentos para o programa relacionados à exibição da árvore
+    parser = argparse.ArgumentParser(description=f"Construa uma {label.lower()} a partir de um arquivo de entrada.")
+    parser.add_argument('--print-terminal', action='store_true', help="Imprime a árvore no terminal.")
+    parser.add_argument('--print-graphical', action='store_true', help="Visualiza a árvore graficamente.")
+    parser.add_argument('--write-result-archive', action='store_true', help="Escreve os resultados em um arquivo.")
+    parser.add_argument('--all_inputs', action='store_true', help="Executa o programa para todos os arquivos de entrada.")
+    parser.add_argument('--bulk-load', action='store_true', help="Constrói a árvore em lote (ordenada e sem duplicatas) em vez de inserir um número por vez.")
+    parser.add_argument('--sort-queries', action='store_true', help="Ordena as consultas antes de medir, para a busca em lote reaproveitar o caminho entre chaves.")
+    parser.add_argument('--binary', action='store_true', help="Lê as entradas no formato binário (.bin) gerado pelo Utils/binary_keys.py.")
+    parser.add_argument('--snapshot', action='store_true', help="Carrega a árvore de um snapshot em Saídas Árvores/Snapshots, gravando-o na primeira execução.")
+    parser.add_argument('--stats', action='store_true', help="Coleta estatísticas das operações (rotações, recolorações e profundidades) e as exibe junto com os resultados.")
+    parser.add_argument('--analyze', action='store_true', help="Calcula a altura e a distribuição de profundidades da árvore e valida suas propriedades.")
+    parser.add_argument('--stream', action='store_true', help="Lê as entradas em blocos durante a construção e a consulta, sem carregar os arquivos inteiros (o tempo passa a incluir a leitura).")
+    parser.add_argument('--profile-memory', action='store_true', help="Mede a memória da construção com tracemalloc e amostras de RSS (a construção fica mais lenta).")
+    parser.add_argument('--freeze', choices=['bfs', 'veb'], help="Congela a árvore em vetores na ordem por nível (bfs) ou van Emde Boas (veb) antes das consultas.")
+    parser.add_argument('--vectorized', action='store_true', help="Faz as consultas de cada lote de uma só vez com o NumPy, sobre a árvore congelada (bfs, se o --freeze não for usado). Sem o NumPy, usa a mesma busca em Python.")
+    return parser
+
+class TreeDriver:
+    """
+    Executa a construção e as consultas de uma árvore com as opções do main.py.
+    """
+
+    def __init__(self, tree_name, args, console):
+        self.label, instrumented = DRIVERS[tree_name]
+        self.suffix = RESULT_SUFFIXES[tree_name]
+        self.args = args
+        self.console = console
+
+        self.freeze_layout = args.freeze or ('bfs' if args.vectorized else None)
+
+        # Com --stats é usada a versão instrumentada da árvore; sem ele, a árvore
+        # original, sem nenhum custo extra nas operações.
+        if args.stats:
+            folder = TREES[tree_name][0]
+            self.Tree = getattr(import_tree_module(folder, instrumented), instrumented)
+        else:
+            self.Tree = load_tree_class(tree_name)
+
+    def input_path(self, folder, input_file):
+        return os.path.join(INPUT_DIR, folder, input_file)
+
+    def output_path(self, folder, input_file, extra=''):
+        return os.path.join(OUTPUT_DIR, folder, f"{input_file}_{self.suffix}{extra}.txt")
+
+    def read_input(self, folder, input_file):
+        """
+        Lê os números de um arquivo de entrada da pasta "Entradas Árvores/{folder}".
+        No modo binário o arquivo .bin é mapeado em memória, sem conversão de texto.
+        """
+        path = self.input_path(folder, input_file)
+        if self.args.binary:
+            return load_keys(binary_path(path))
+
+        with open(path, 'r') as file:
+            lines = file.readlines()
+            # Processa cada linha separadamente
+            numbers = []
+            for line in lines:
+                try:
+                    numbers.extend(map(int, line.strip().split()))
+                except ValueError:
+                    continue  # Ignora linhas com caracteres inválidos
+
+        return numbers
+
+    def stream_input(self, folder, input_file):
+        """
+        Lê os números de um arquivo de entrada em blocos de até STREAM_BUFFER
+        números. No modo binário os blocos são fatias do arquivo mapeado em memória.
+        """
+        path = self.input_path(folder, input_file)
+        if self.args.binary:
+            keys = load_keys(binary_path(path))
+            return (keys[i:i + STREAM_BUFFER] for i in range(0, len(keys), STREAM_BUFFER))
+
+        return iter_number_chunks(path, STREAM_BUFFER)
+
+    def new_table(self, title):
+        result_table = table.Table(title=title)
+        result_table.add_column("Descrição", justify="left", style="cyan")
+        result_table.add_column("Valor", justify="right", style="green")
+        return result_table
+
+    def build_tree(self, input_file):
+        args = self.args
+        Tree = self.Tree
+
+        # Lê o arquivo de entrada (com --stream, os números são lidos durante a construção)
+        if args.stream:
+            numbers = chain.from_iterable(self.stream_input("Construir", input_file))
+        else:
+            numbers = self.read_input("Construir", input_file)
+
+        # Com --profile-memory, a construção é acompanhada pelo perfil de memória
+        if args.profile_memory:
+            profile = MemoryProfile()
+            profile.start()
+
+        # Constrói a árvore
+        start_time = time.perf_counter()  # Inicia a contagem do tempo
+
+        if args.bulk_load:
+            tree = Tree.from_iterable(numbers)  # Monta a árvore balanceada em lote
+        else:
+            tree = Tree()
+            for number in numbers:
+                tree.insert(number)  # Insere os números na árvore
+
+        end_time = time.perf_counter()  # Finaliza a contagem do tempo
+        total_time = end_time - start_time  # Calcula o tempo total
+
+        if args.profile_memory:
+            profile.stop(tree)
+
+        # Exibe os resultados em uma tabela
+        result_table = self.new_table(f"Resultados da Construção da {self.label} - {input_file}")
+        result_table.add_row("Quantidade de comparações", str(tree.comparison_count))
+        result_table.add_row("Tempo total de construção (s)", f"{total_time:.6f}")
+
+        # Pico de memória do processo até aqui (com --all_inputs, de todos os arquivos já processados)
+        peak = peak_rss()
+        if peak is not None:
+            result_table.add_row("Pico de memória RSS (MB)", f"{peak / 2**20:.1f}")
+
+        self.console.print(result_table)
+
+        # Exibe o perfil de memória da construção
+        if args.profile_memory:
+            memory_table = self.new_table(f"Memória da Construção da {self.label} - {input_file}")
+            for description, value in profile.rows():
+                memory_table.add_row(description, value)
+
+            self.console.print(memory_table)
+
+        # Salva os resultados da construção em arquivo
+        if args.write_result_archive:
+            with atomic_write(self.output_path("Construir", input_file)) as file:
+                file.write(f"Quantidade de comparações: {tree.comparison_count}\n")
+                file.write(f"Tempo total de construção (s): {total_time:.6f}\n")
+
+            if args.profile_memory:
+                with atomic_write(self.output_path("Construir", input_file, "_Memoria")) as file:
+                    for description, value in profile.rows():
+                        file.write(f"{description}: {value}\n")
+
+        return tree, total_time
+
+    def process_file(self, input_file):
+        args = self.args
+        console = self.console
+
+        # A construção em lote gera uma forma de árvore diferente da inserção uma a
+        # uma, então cada modo tem o seu snapshot.
+        build_mode = "_Lote" if args.bulk_load else ""
+        snapshot_path = os.path.join(OUTPUT_DIR, "Snapshots", f"{input_file}_{self.suffix}{build_mode}.snap")
+
+        # Com um snapshot já gravado, a árvore é recarregada sem ser construída
+        if args.snapshot and os.path.exists(snapshot_path):
+            start_time = time.perf_counter()
+            tree = self.Tree.load(snapshot_path)
+            total_time = time.perf_counter() - start_time
+
+            console.print(f"Árvore carregada do snapshot {snapshot_path} em {total_time:.6f} s")
+        else:
+            tree, total_time = self.build_tree(input_file)
+
+            if args.snapshot:
+                os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+                tree.save(snapshot_path)
+
+        # Exibe a forma da árvore construída e a validação das suas propriedades
+        if args.analyze:
+            analysis = analyze(tree)
+
+            analysis_table = self.new_table(f"Análise da {self.label} - {input_file}")
+            for description, value in analysis_rows(analysis):
+                analysis_table.add_row(description, value)
+
+            console.print(analysis_table)
+
+            for message in analysis['errors']:
+                console.print(f"[red]Violação:[/red] {message}")
+
+            # A análise fica ao lado dos resultados da construção
+            if args.write_result_archive:
+                write_analysis(self.output_path("Construir", input_file, "_Analise"), analysis)
+
+        # Lê o arquivo de consulta (com --stream, em blocos durante a consulta)
+        if args.stream:
+            query_chunks = self.stream_input("Consultar", input_file)
+        else:
+            query_chunks = [self.read_input("Consultar", input_file)]
+
+        # A ordenação fica fora da medição de tempo
+        if args.sort_queries:
+            query_chunks = [sorted(chain.from_iterable(query_chunks))]
+
+        # Com --freeze, as consultas são feitas em uma cópia da árvore em vetores
+        searcher = tree
+        if self.freeze_layout:
+            start_freeze_time = time.perf_counter()
+            searcher = tree.freeze(self.freeze_layout)
+            freeze_time = time.perf_counter() - start_freeze_time
+
+        # O vectorized_search importa o NumPy (cerca de 100 ms), então só é
+        # carregado quando a busca vetorizada é pedida.
+        if args.vectorized:
+            from vectorized_search import search_batch, total_comparisons
+
+        # Realiza as consultas em lote
+        start_query_time = time.perf_counter()  # Inicia a contagem do tempo de consulta
+
+        # Busca todos os números na árvore, obtendo as comparações de cada consulta
+        query_comparison_count = 0  # Total de comparações durante as consultas
+        for query_numbers in query_chunks:
+            if args.vectorized:
+                _, query_comparisons = search_batch(searcher, query_numbers)
+                query_comparison_count += total_comparisons(query_comparisons)
+            else:
+                _, _, query_comparisons = searcher.search_many(query_numbers)
+                query_comparison_count += sum(query_comparisons)
+
+            if args.stats and self.freeze_layout:
+                tree.stats.search_depth.update(map(int, query_comparisons))
+
+        end_query_time = time.perf_counter()  # Finaliza a contagem do tempo de consulta
+        total_query_time = end_query_time - start_query_time  # Calcula o tempo total de consulta
+
+        # Exibe os resultados da consulta em uma tabela
+        query_table = self.new_table(f"Resultados da Consulta na {self.label} - {input_file}")
+        query_table.add_row("Quantidade de comparações", str(query_comparison_count))
+        query_table.add_row("Tempo total de consulta (s)", f"{total_query_time:.6f}")
+        if self.freeze_layout:
+            query_table.add_row(f"Tempo para congelar ({self.freeze_layout}) (s)", f"{freeze_time:.6f}")
+        query_table.add_row("[green]Hits (acertos)[/green]", str(searcher.hits))  # Exibe o número de acertos
+        query_table.add_row("[red]Misses (erros)[/red]", str(searcher.misses))  # Exibe o número de erros
+
+        console.print(query_table)
+
+        # Exibe as estatísticas das operações
+        if args.stats:
+            stats_table = self.new_table(f"Estatísticas das Operações na {self.label} - {input_file}")
+            for description, value in tree.stats.rows():
+                stats_table.add_row(description, value)
+
+            console.print(stats_table)
+
+        # Exibe a árvore (opcional para grandes árvores)
+        if args.print_terminal:
+            tree.print_tree(tree.root)
+
+        if args.print_graphical:
+            tree.visualize_tree()
+
+        if args.write_result_archive:
+            with atomic_write(self.output_path("Consultar", input_file)) as file:
+                file.write(f"Quantidade de comparações: {query_comparison_count}\n")
+                file.write(f"Tempo total de consulta (s): {total_query_time:.6f}\n")
+                if self.freeze_layout:
+                    file.write(f"Tempo para congelar ({self.freeze_layout}) (s): {freeze_time:.6f}\n")
+                file.write(f"Hits (acertos): {searcher.hits}\n")
+                file.write(f"Misses (erros): {searcher.misses}\n")
+
+            if args.stats:
+                tree.stats.write(self.output_path("Estatísticas", input_file))
+
+def main(tree_name, argv=None):
+    """
+    Ponto de entrada dos main.py: lê os argumentos e processa todos os arquivos
+    de entrada (--all_inputs) ou o escolhido no menu.
+    """
+    args = build_parser(tree_name).parse_args(argv)
+    driver = TreeDriver(tree_name, args, console.Console())
+    output = driver.console
+
+    if args.all_inputs:
+        # Percorre todos os arquivos de entrada na pasta "Entradas Árvores/Construir"
+        for input_file in list_input_files():
+            output.print(f"Processando arquivo: {input_file}")
+            driver.process_file(input_file)
+            output.print("\n" + "="*50 + "\n")  # Separador entre os arquivos
+    else:
+        # Cria um menu de opções com os arquivos da pasta "Entradas Árvores/Construir"
+        # para o usuário escolher o arquivo de entrada
+        options = list_input_files()
+        options.append("Sair")
+
+        output.print(f"Selecione o arquivo de entrada para construir a {driver.label.lower()}:")
+        for i, op in enumerate(options):
+            output.print(f"[bold red]{i+1}[/bold red] - {op}")
+
+        # Pega a opção escolhida pelo usuário
+        option = output.input("Opção: ")
+        option = int(option)
+
+        # Verifica se a opção escolhida é válida
+        if option < 1 or option > len(options):
+            output.print("Opção inválida!")
+        else:
+            if option == len(options):
+                output.print("Saindo...")
+            else:
+                driver.process_file(options[option-1])
@@ -0,0 +1,176 @@
+import os
+import signal
+import asyncio
+from contextlib import suppress
+import argparse
+
+from utils import INPUT_DIR, read_numbers
+from arvores import create, available_backends
+
+# Servidor de consultas: constrói a árvore uma única vez a partir de um arquivo
+# de Entradas Árvores e responde, por TCP ou socket Unix, a pedidos em linhas de
+# texto. O cliente pode enviar vários pedidos seguidos sem esperar as respostas
+# (pipelining); cada conexão recebe as respostas na ordem dos pedidos.
+#
+# Protocolo (uma linha por pedido e uma por resposta, chaves inteiras separadas
+# por espaço):
+#
+#   S k1 k2 ...   busca as chaves      -> OK <um 1 ou 0 por chave, sem espaços>
+#   I k1 k2 ...   insere as chaves     -> OK <quantidade inserida>
+#   D k1 k2 ...   remove as chaves     -> OK <quantidade removida>
+#   R lo hi       chaves em [lo, hi]   -> OK k1 k2 ... (no máximo --max-range)
+#   N             estatísticas         -> OK size=... comparisons=... hits=... misses=...
+#   Q             encerra a conexão
+#
+# Pedidos inválidos (inclusive linhas maiores que LINE_LIMIT e erros do
+# backend) recebem ERR <mensagem> e a conexão continua. Todos os
+# pedidos rodam no laço de eventos, um por vez, então a árvore não precisa de
+# trava.
+# Exemplo: python3 tree_server.py --backend rb --file 100000.txt --tcp 127.0.0.1:7070
+#          python3 tree_server.py --backend rb-compact --file 500000.txt --unix /tmp/arvores.sock
+
+# Tamanho máximo de uma linha de pedido ou de resposta, usado pelo servidor e
+# pelo load_client.py. O padrão do asyncio (64 KiB) não comporta um pedido S com
+# mais de uns 9000 chaves; 16 MiB comportam mais de um milhão.
+LINE_LIMIT = 16 * 2 ** 20
+
+def build(backend_name, input_file):
+    tree = create(backend_name)
+    for number in read_numbers(os.path.join(INPUT_DIR, 'Construir', input_file)):
+        tree.insert(number)
+    return tree
+
+def execute(tree, line, max_range):
+    """
+    Executa um pedido e retorna a linha de resposta (sem a quebra de linha).
+    """
+    parts = line.split()
+    if not parts:
+        return "ERR pedido vazio"
+
+    command = parts[0].upper()
+    try:
+        keys = [int(part) for part in parts[1:]]
+    except ValueError:
+        return "ERR chave inválida"
+
+    try:
+        if command == 'S':
+            # Uma única busca em lote, que já devolve o acerto de cada chave
+            # (na ConcurrentRedBlackTree, com uma só entrada na trava de leitura).
+            return "OK " + ''.join(map('01'.__getitem__, tree.search_mask(keys)))
+        if command == 'I':
+            return f"OK {sum(tree.insert(key) for key in keys)}"
+        if command == 'D':
+            return f"OK {sum(tree.delete(key) for key in keys)}"
+        if command == 'R':
+            if len(keys) != 2:
+                return "ERR uso: R lo hi"
+            result = []
+            for key in tree.range(keys[0], keys[1]):
+                if len(result) == max_range:
+                    break
+                result.append(str(key))
+            return "OK " + ' '.join(result)
+        if command == 'N':
+            stats = tree.stats()
+            return "OK " + ' '.join(f"{name}={value}" for name, value in stats.items() if isinstance(value, int))
+    except NotImplementedError as error:
+        return f"ERR {error}"
+    except Exception as error:
+        # Qualquer outra falha do backend vira uma resposta de erro, sem
+        # derrubar a conexão (e os pedidos que vêm depois dela).
+        return f"ERR {type(error).__name__}: {error}"
+
+    return f"ERR comando desconhecido: {parts[0]}"
+
+async def discard_line(reader):
+    """
+    Descarta o restante de uma linha maior que o limite do reader, até a quebra
+    de linha (inclusive), sem perder os pedidos seguintes.
+    """
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            return
+        except asyncio.LimitOverrunError as error:
+            await reader.readexactly(error.consumed)
+
+async def handle_connection(tree, max_range, reader, writer):
+    try:
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as error:
+                line = error.partial  # Última linha sem quebra de linha
+            except asyncio.LimitOverrunError:
+                await discard_line(reader)
+                writer.write(f"ERR pedido maior que {LINE_LIMIT} bytes\n".encode())
+                await writer.drain()
+                continue
+
+            if not line or line.strip().upper() == b'Q':
+                break
+            try:
+                response = execute(tree, line.decode(), max_range)
+            except UnicodeDecodeError:
+                response = "ERR pedido com caracteres inválidos"
+            writer.write(response.encode() + b"\n")
+
+            # Com pedidos em sequência já recebidos, as respostas são acumuladas
+            # e enviadas juntas; o drain só espera quando o buffer de saída enche.
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(tree, tcp=None, unix=None, max_range=1000):
+    async def handler(reader, writer):
+        await handle_connection(tree, max_range, reader, writer)
+
+    if unix:
+        if os.path.exists(unix):
+            os.unlink(unix)
+        server = await asyncio.start_unix_server(handler, path=unix, limit=LINE_LIMIT)
+        address = unix
+    else:
+        host, port = tcp.rsplit(':', 1)
+        server = await asyncio.start_server(handler, host, int(port), limit=LINE_LIMIT)
+        address = tcp
+
+    # O cliente com --spawn espera esta linha para começar a carga.
+    print(f"Servidor pronto em {address} ({len(tree)} chaves)", flush=True)
+
+    # Encerra normalmente com SIGINT ou SIGTERM (como o --spawn do cliente faz),
+    # removendo o socket Unix. Sem suporte a sinais no laço (Windows), só o
+    # Ctrl+C encerra.
+    stop = asyncio.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        with suppress(NotImplementedError):
+            asyncio.get_running_loop().add_signal_handler(signum, stop.set)
+
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        if unix and os.path.exists(unix):
+            os.unlink(unix)
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Servidor de consultas sobre uma árvore construída a partir de Entradas Árvores.")
+    parser.add_argument('--backend', default='rb', choices=available_backends(), help="Backend da árvore.")
+    parser.add_argument('--file', default='100000.txt', help="Arquivo de Entradas Árvores/Construir usado para construir a árvore.")
+    address = parser.add_mutually_exclusive_group()
+    address.add_argument('--tcp', default='127.0.0.1:7070', help="Endereço host:porta.")
+    address.add_argument('--unix', help="Caminho do socket Unix (no lugar do TCP).")
+    parser.add_argument('--max-range', type=int, default=1000, help="Máximo de chaves na resposta de um pedido R.")
+    args = parser.parse_args()
+
+    tree = build(args.backend, args.file)
+
+    try:
+        asyncio.run(serve(tree, args.tcp, args.unix, args.max_range))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,81 @@
+from collections import Counter
+
+from results import atomic_write
+
+# Estatísticas das árvores instrumentadas (InstrumentedBinarySearchTree e
+# InstrumentedRedBlackTree): contadores de operações internas e histogramas de
+# profundidade (profundidade -> quantidade de operações), gravados pelo
+# --stats dos main.py em Saídas Árvores/Estatísticas.
+
+class TreeStats:
+    """
+    Histogramas de profundidade da descida na busca e na inserção. A árvore
+    binária de busca não faz rotações nem recolorações, então só registra as
+    profundidades.
+    """
+
+    COUNTERS = ()
+
+    HISTOGRAMS = (
+        ('insert_depth', "Profundidade das inserções"),
+        ('search_depth', "Profundidade das buscas"),
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for name, _ in self.COUNTERS:
+            setattr(self, name, 0)
+        for name, _ in self.HISTOGRAMS:
+            setattr(self, name, Counter())
+
+    def as_dict(self):
+        """
+        Retorna as estatísticas em um dicionário, com os histogramas ordenados
+        pela profundidade.
+        """
+        result = {name: getattr(self, name) for name, _ in self.COUNTERS}
+        for name, _ in self.HISTOGRAMS:
+            result[name] = dict(sorted(getattr(self, name).items()))
+        return result
+
+    def rows(self):
+        """
+        Linhas (descrição, valor) com os contadores e o resumo de cada
+        histograma, no formato das tabelas e arquivos de resultados.
+        """
+        rows = [(label, str(getattr(self, name))) for name, label in self.COUNTERS]
+        for name, label in self.HISTOGRAMS:
+            histogram = getattr(self, name)
+            total = sum(histogram.values())
+            if total:
+                average = sum(depth * count for depth, count in histogram.items()) / total
+                rows.append((f"{label} (média)", f"{average:.2f}"))
+                rows.append((f"{label} (máxima)", str(max(histogram))))
+        return rows
+
+    def write(self, path):
+        """
+        Grava as estatísticas no arquivo, com os histogramas completos.
+        """
+        with atomic_write(path) as file:
+            for label, value in self.rows():
+                file.write(f"{label}: {value}\n")
+            for name, label in self.HISTOGRAMS:
+                file.write(f"\n{label}:\n")
+                for depth, count in sorted(getattr(self, name).items()):
+                    file.write(f"{depth}: {count}\n")
+
+class RedBlackTreeStats(TreeStats):
+    """
+    TreeStats da árvore rubro-negra, que conta também as rotações (à esquerda e
+    à direita), as recolorações e as iterações do laço do _fix_insert.
+    """
+
+    COUNTERS = (
+        ('left_rotations', "Rotações à esquerda"),
+        ('right_rotations', "Rotações à direita"),
+        ('recolorings', "Recolorações"),
+        ('fixup_iterations', "Iterações do fix_insert"),
+    )
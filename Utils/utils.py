@@ -1,4 +1,156 @@
 import os
+import sys
+import importlib
+
+# Caminhos das pastas do projeto, calculados a partir deste arquivo para que os
+# scripts funcionem independente do diretório de onde são executados.
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+BST_DIR = os.path.join(ROOT_DIR, 'Árvore Binária de Busca')
+RB_DIR = os.path.join(ROOT_DIR, 'Árvore Red Black')
+INPUT_DIR = os.path.join(ROOT_DIR, 'Entradas Árvores')
+OUTPUT_DIR = os.path.join(ROOT_DIR, 'Saídas Árvores')
+
+# Módulos das árvores: nome -> (pasta, módulo, classe), usados pelo
+# load_tree_class quando o script precisa da própria classe (como o
+# tree_analysis, que percorre os nós). A lista de árvores que os scripts de
+# medida executam é o registro do pacote arvores, que cria os backends destas
+# árvores a partir desta tabela e registra também as demais estruturas.
+TREES = {
+    'bst': (BST_DIR, 'BinarySearchTree', 'BinarySearchTree'),
+    'bst-compact': (BST_DIR, 'CompactBinarySearchTree', 'CompactBinarySearchTree'),
+    'rb': (RB_DIR, 'RedBlackTree', 'RedBlackTree'),
+    'rb-compact': (RB_DIR, 'CompactRedBlackTree', 'CompactRedBlackTree'),
+}
+
+# Sufixo de cada árvore nos arquivos de resultados em Saídas Árvores, usado pelos
+# main.py (tree_driver.py) e pelo tree_analysis.py
+RESULT_SUFFIXES = {
+    'bst': 'Arvore_Binaria_de_Busca',
+    'bst-compact': 'Arvore_Binaria_de_Busca_Compacta',
+    'rb': 'Arvore_Rubro-Negra',
+    'rb-compact': 'Arvore_Rubro-Negra_Compacta',
+}
+
+# Módulos que existem com o mesmo nome nas duas pastas das árvores
+_SHARED_MODULE_NAMES = ('Node',)
 
 def clear_terminal():
-    os.system('cls' if os.name == 'nt' else 'clear')
\ No newline at end of file
+    os.system('cls' if os.name == 'nt' else 'clear')
+
+def import_tree_module(folder, name):
+    """
+    Importa um módulo de uma das pastas das árvores. Como as duas pastas possuem
+    um Node.py próprio, o módulo Node é isolado durante a importação para que uma
+    árvore não acabe usando o Node da outra.
+    """
+    saved = {m: sys.modules.pop(m) for m in _SHARED_MODULE_NAMES if m in sys.modules}
+    sys.path.insert(0, folder)
+    try:
+        return importlib.import_module(name)
+    finally:
+        sys.path.remove(folder)
+        for m in _SHARED_MODULE_NAMES:
+            sys.modules.pop(m, None)
+        sys.modules.update(saved)
+
+def load_tree_class(name):
+    """
+    Retorna a classe da árvore registrada em TREES com o nome fornecido.
+    """
+    folder, module, cls = TREES[name]
+    return getattr(import_tree_module(folder, module), cls)
+
+def read_numbers(path):
+    """
+    Lê os números de um arquivo de entrada, ignorando linhas com caracteres
+    inválidos da mesma forma que o process_file dos main.py.
+    """
+    numbers = []
+    with open(path, 'r') as file:
+        for line in file:
+            try:
+                numbers.extend(map(int, line.strip().split()))
+            except ValueError:
+                continue
+    return numbers
+
+def iter_number_chunks(path, buffer_size=65536, chunk_size=1 << 16):
+    """
+    Lê os números do arquivo de entrada aos poucos (chunk_size caracteres por
+    vez) e os entrega em listas de no máximo buffer_size números, sem nunca
+    manter o arquivo inteiro em memória.
+
+    Os caracteres inválidos são tratados exatamente como no read_numbers: os
+    números da linha anteriores ao caractere inválido são mantidos e o restante
+    da linha é ignorado.
+    """
+    ready = []        # números lidos e ainda não entregues
+    line_ok = True    # False depois de um caractere inválido na linha atual
+    tail = ''         # pedaço de número cortado no fim do bloco anterior
+
+    with open(path, 'r') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+
+            lines = (tail + chunk).split('\n')
+            fragment = lines.pop()
+
+            # O último número do fragmento pode continuar no próximo bloco.
+            tokens = fragment.split()
+            tail = tokens.pop() if tokens and not fragment[-1].isspace() else ''
+
+            for line_tokens, line_end in [(line.split(), True) for line in lines] + [(tokens, False)]:
+                if line_ok:
+                    try:
+                        ready.extend(map(int, line_tokens))
+                    except ValueError:
+                        line_ok = False  # Ignora o restante da linha
+                if line_end:
+                    line_ok = True
+
+                while len(ready) >= buffer_size:
+                    yield ready[:buffer_size]
+                    del ready[:buffer_size]
+
+    # O arquivo pode terminar sem quebra de linha.
+    if line_ok:
+        try:
+            ready.extend(map(int, tail.split()))
+        except ValueError:
+            pass
+
+    while ready:
+        yield ready[:buffer_size]
+        del ready[:buffer_size]
+
+def iter_numbers(path, buffer_size=65536):
+    """
+    Versão do iter_number_chunks que entrega um número por vez.
+    """
+    for chunk in iter_number_chunks(path, buffer_size):
+        yield from chunk
+
+def peak_rss():
+    """
+    Retorna o pico de memória residente (RSS) do processo em bytes, ou None se
+    o sistema não oferecer o módulo resource (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # O Linux informa em kilobytes e o macOS em bytes.
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def list_input_files(folder=None):
+    """
+    Lista os arquivos .txt da pasta de entrada, ordenados pela quantidade de elementos.
+    """
+    folder = folder or os.path.join(INPUT_DIR, 'Construir')
+    files = [f for f in os.listdir(folder) if f.endswith('.txt')]
+    files.sort(key=lambda x: int(''.join(filter(str.isdigit, x)) or 0))
+    return files
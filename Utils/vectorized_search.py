@@ -0,0 +1,125 @@
+from array import array
+
+# Busca em lote vetorizada com NumPy sobre as árvores em vetores (as cópias do
+# freeze() e as árvores compactas, que usam os mesmos vetores key/left/right com
+# o NIL na posição 0). Todas as consultas descem juntas, um nível por passo: em
+# cada passo, as chaves dos nós atuais são comparadas com as consultas ainda
+# ativas de uma só vez, e só as que não acharam a chave nem chegaram ao NIL
+# continuam. O laço em Python roda uma vez por nível (a altura da árvore), e
+# não uma vez por nó visitado.
+#
+# O NumPy é opcional: sem ele (ou com chaves que não cabem em 64 bits), a mesma
+# busca é feita em Python puro, com os mesmos resultados em listas.
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAVE_NUMPY = np is not None
+
+NIL = 0
+
+def export_arrays(tree):
+    """
+    Retorna (chaves, esquerda, direita) da árvore como vetores do NumPy, sem
+    cópia (os vetores compartilham a memória dos arrays da árvore). Retorna None
+    se o NumPy não estiver instalado ou se as chaves não estiverem em um array
+    tipado (chaves fora dos 64 bits).
+    """
+    if not HAVE_NUMPY or not isinstance(tree.key, array):
+        return None
+
+    return tuple(np.frombuffer(values, dtype=values.typecode) for values in (tree.key, tree.left, tree.right))
+
+def search_batch(tree, queries, use_numpy=True):
+    """
+    Busca todas as consultas na árvore e retorna (acertos, comparações): o
+    primeiro indica, para cada consulta, se a chave foi encontrada e o segundo
+    quantas comparações o search faria para ela. Atualiza os contadores de hits
+    e misses da árvore como o search_many.
+
+    Com o NumPy, os dois resultados são vetores do NumPy (bool e int32); sem ele,
+    ou com use_numpy=False, são listas.
+    """
+    arrays = export_arrays(tree) if use_numpy else None
+    if arrays is not None:
+        try:
+            queries = np.asarray(queries, dtype=np.int64)
+        except OverflowError:
+            arrays = None
+
+    if arrays is None:
+        found, comparisons = _search_batch_python(tree, queries)
+        hits = sum(found)
+    else:
+        found, comparisons = _search_batch_numpy(arrays, tree.root, queries)
+        hits = int(np.count_nonzero(found))
+
+    tree.hits += hits
+    tree.misses += len(found) - hits
+
+    return found, comparisons
+
+def _search_batch_numpy(arrays, root, queries):
+    node_keys, left, right = arrays
+
+    found = np.zeros(len(queries), dtype=bool)
+    comparisons = np.zeros(len(queries), dtype=np.int32)
+
+    # Consultas ainda descendo (posições no lote) e o nó atual de cada uma.
+    active = np.arange(len(queries)) if root != NIL else np.arange(0)
+    current = np.full(len(active), root, dtype=left.dtype)
+    targets = queries[active]
+
+    while active.size:
+        comparisons[active] += 1
+        current_keys = node_keys[current]
+
+        equal = targets == current_keys
+        found[active[equal]] = True
+
+        # Quem não achou desce para a esquerda ou a direita; quem chega ao NIL
+        # termina com miss.
+        current = np.where(targets < current_keys, left[current], right[current])
+        keep = ~equal & (current != NIL)
+
+        active = active[keep]
+        current = current[keep]
+        targets = targets[keep]
+
+    return found, comparisons
+
+def _search_batch_python(tree, queries):
+    node_keys = tree.key
+    left = tree.left
+    right = tree.right
+    root = tree.root
+
+    found = []
+    comparisons = []
+
+    for key in queries:
+        current = root
+        count = 0
+        hit = False
+        while current != NIL:
+            count += 1
+            current_key = node_keys[current]
+            if key == current_key:
+                hit = True
+                break
+            elif key < current_key:
+                current = left[current]
+            else:
+                current = right[current]
+        found.append(hit)
+        comparisons.append(count)
+
+    return found, comparisons
+
+def total_comparisons(comparisons):
+    """
+    Soma as comparações retornadas pelo search_batch, seja vetor ou lista.
+    """
+    return int(comparisons.sum()) if hasattr(comparisons, 'sum') else sum(comparisons)
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Os testes importam as árvores pelo utils.py, como os scripts de Utils, que
+# isola o Node.py de cada pasta durante a importação.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Utils')))
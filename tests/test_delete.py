@@ -0,0 +1,147 @@
+import random
+from collections import Counter
+
+import pytest
+
+from utils import RB_DIR, import_tree_module, load_tree_class
+
+RedBlackTree = load_tree_class('rb')
+BinarySearchTree = load_tree_class('bst')
+CompactRedBlackTree = load_tree_class('rb-compact')
+CompactBinarySearchTree = load_tree_class('bst-compact')
+red_black_module = import_tree_module(RB_DIR, 'RedBlackTree')
+BLACK, RED = red_black_module.BLACK, red_black_module.RED
+
+def node_fields(tree):
+    """
+    Retorna a raiz, a folha (o que o pai da raiz aponta) e uma função que dá
+    (chave, esquerda, direita, pai, cor) de um nó, para verificar do mesmo jeito
+    as árvores com Node (em que a folha é o NIL da rubro-negra ou None) e as
+    compactas (em que a folha é o índice 0). A cor é None na árvore binária de
+    busca compacta.
+    """
+    if hasattr(tree, 'key'):
+        color = getattr(tree, 'color', None)
+        def fields(n):
+            return tree.key[n], tree.left[n], tree.right[n], tree.parent[n], color[n] if color is not None else None
+        return tree.root, 0, 0, fields
+
+    def fields(n):
+        return n.key, n.left, n.right, n.parent, n.color
+    return tree.root, getattr(tree, 'NIL', None), None, fields
+
+def check_tree(tree, expected, red_black):
+    """
+    Verifica a árvore depois de uma operação: ligações com o pai, ordem das
+    chaves, as chaves guardadas (com as repetições de duplicates='count') e, na
+    rubro-negra, raiz preta, nenhum vermelho com filho vermelho e a mesma altura
+    negra em todos os caminhos.
+    """
+    root, nil, top, fields = node_fields(tree)
+    counting = getattr(tree, 'duplicates', None) == 'count'
+    stored = Counter()
+    inorder = []
+
+    def walk(node, parent):
+        # Retorna a altura negra da subárvore (o NIL conta como preto).
+        if node is nil or node == nil:
+            return 1
+        key, left, right, node_parent, color = fields(node)
+        assert node_parent is parent or node_parent == parent
+
+        if red_black and color == RED:
+            for child in (left, right):
+                assert child is nil or child == nil or fields(child)[4] == BLACK
+
+        left_height = walk(left, node)
+        inorder.append(key)
+        stored[key] += node.count if counting else 1
+        right_height = walk(right, node)
+
+        if red_black:
+            assert left_height == right_height
+            return left_height + (color == BLACK)
+        return 1
+
+    walk(root, top)
+
+    assert inorder == sorted(inorder)
+    assert stored == expected
+
+    # As compactas devolvem a posição do nó removido: os vetores têm um nó por
+    # chave, além da posição reservada.
+    if hasattr(tree, 'key'):
+        assert len(tree.key) == len(tree.left) == len(tree.right) == len(tree.parent) == len(inorder) + 1
+    if counting:
+        assert len(inorder) == len(set(inorder))
+    if red_black and not (root is nil or root == nil):
+        assert fields(root)[4] == BLACK
+    if red_black and nil is not None and nil != 0:
+        assert nil.color == BLACK
+
+def random_operations(tree, red_black, seed, operations=300, key_range=40):
+    # Mistura inserções e remoções (de chaves presentes e ausentes), verificando
+    # a árvore depois de cada operação.
+    rng = random.Random(seed)
+    expected = Counter()
+
+    for _ in range(operations):
+        if expected and rng.random() < 0.45:
+            key = rng.choice(list(expected)) if rng.random() < 0.8 else rng.randrange(key_range)
+            present = expected[key] > 0
+            assert tree.delete(key) == present
+            if present:
+                expected[key] -= 1
+                if not expected[key]:
+                    del expected[key]
+        else:
+            key = rng.randrange(key_range)
+            tree.insert(key)
+            expected[key] += 1
+        check_tree(tree, expected, red_black)
+
+    # Esvazia a árvore no final.
+    for key in list(expected.elements()):
+        assert tree.delete(key)
+        expected[key] -= 1
+        check_tree(tree, +expected, red_black)
+    assert tree.delete(0) is False
+
+@pytest.mark.parametrize('seed', range(10))
+def test_delete_binary_search_tree(seed):
+    random_operations(BinarySearchTree(), False, seed)
+
+@pytest.mark.parametrize('seed', range(10))
+def test_delete_compact_binary_search_tree(seed):
+    random_operations(CompactBinarySearchTree(), False, seed)
+
+@pytest.mark.parametrize('seed', range(10))
+@pytest.mark.parametrize('duplicates', ['allow', 'count'])
+@pytest.mark.parametrize('order_statistics', [False, True])
+def test_delete_red_black_tree(seed, duplicates, order_statistics):
+    tree = RedBlackTree(order_statistics=order_statistics, duplicates=duplicates)
+    random_operations(tree, True, seed)
+
+@pytest.mark.parametrize('seed', range(10))
+def test_delete_compact_red_black_tree(seed):
+    random_operations(CompactRedBlackTree(), True, seed)
+
+def test_delete_missing_key():
+    for tree in (BinarySearchTree(), RedBlackTree(), CompactBinarySearchTree(), CompactRedBlackTree()):
+        assert tree.delete(1) is False
+        tree.insert(1)
+        assert tree.delete(2) is False
+        assert tree.delete(1) is True
+        assert tree.delete(1) is False
+
+def test_delete_counted_repetitions():
+    tree = RedBlackTree(duplicates='count')
+    for key in (5, 5, 5, 3):
+        tree.insert(key)
+
+    # Cada delete remove uma repetição; o nó só sai com a última.
+    assert tree.delete(5) and tree.delete(5)
+    check_tree(tree, Counter({5: 1, 3: 1}), True)
+    assert tree.delete(5)
+    assert tree.delete(5) is False
+    check_tree(tree, Counter({3: 1}), True)
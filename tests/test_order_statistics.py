@@ -0,0 +1,131 @@
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+from utils import load_tree_class
+
+RedBlackTree = load_tree_class('rb')
+
+def check_sizes(tree):
+    """
+    Verifica o campo size de todos os nós: a soma dos tamanhos dos filhos com as
+    chaves do próprio nó (as repetições, com duplicates='count').
+    """
+    nil = tree.NIL
+    assert nil.size == 0
+
+    def walk(node):
+        if node is nil:
+            return 0
+        own = node.count if tree.duplicates == 'count' else 1
+        size = walk(node.left) + walk(node.right) + own
+        assert node.size == size
+        return size
+
+    return walk(tree.root)
+
+def check_queries(tree, keys):
+    """
+    Compara rank, select e count_range com as respostas calculadas sobre a
+    lista ordenada das chaves (com todas as repetições).
+    """
+    assert check_sizes(tree) == len(keys)
+
+    for k in range(1, len(keys) + 1):
+        assert tree.select(k) == keys[k - 1]
+    for k in (0, len(keys) + 1):
+        with pytest.raises(IndexError):
+            tree.select(k)
+
+    probes = range((keys[0] if keys else 0) - 1, (keys[-1] if keys else 0) + 2)
+    for key in probes:
+        assert tree.rank(key) == bisect_right(keys, key)
+    for lo in probes:
+        for hi in (lo - 1, lo, lo + 3):
+            expected = bisect_right(keys, hi) - bisect_left(keys, lo) if lo <= hi else 0
+            assert tree.count_range(lo, hi) == expected
+
+def test_empty_tree():
+    tree = RedBlackTree(order_statistics=True)
+    assert tree.rank(10) == 0
+    assert tree.count_range(0, 100) == 0
+    with pytest.raises(IndexError):
+        tree.select(1)
+    check_queries(tree, [])
+
+def test_requires_order_statistics():
+    tree = RedBlackTree()
+    tree.insert(1)
+    for query in (lambda: tree.rank(1), lambda: tree.select(1), lambda: tree.count_range(0, 2)):
+        with pytest.raises(RuntimeError):
+            query()
+
+def test_sizes_through_rotations():
+    # Inserções crescentes e decrescentes fazem rotações em quase todo insert.
+    for keys in (list(range(64)), list(range(64, 0, -1))):
+        tree = RedBlackTree(order_statistics=True)
+        for key in keys:
+            tree.insert(key)
+            check_sizes(tree)
+        check_queries(tree, sorted(keys))
+
+@pytest.mark.parametrize('seed', range(8))
+@pytest.mark.parametrize('duplicates', ['allow', 'count'])
+def test_queries_through_insert_and_delete(seed, duplicates):
+    rng = random.Random(seed)
+    tree = RedBlackTree(order_statistics=True, duplicates=duplicates)
+    keys = []
+
+    # Chaves em um intervalo pequeno, para que haja muitas repetições.
+    for _ in range(200):
+        if keys and rng.random() < 0.4:
+            key = rng.choice(keys)
+            assert tree.delete(key)
+            keys.remove(key)
+        else:
+            key = rng.randrange(30)
+            tree.insert(key)
+            keys.append(key)
+        keys.sort()
+        check_sizes(tree)
+
+    check_queries(tree, keys)
+
+    # Remove tudo, conferindo as consultas no caminho até a árvore vazia.
+    while keys:
+        key = keys.pop(rng.randrange(len(keys)))
+        assert tree.delete(key)
+        check_queries(tree, keys)
+
+@pytest.mark.parametrize('duplicates', ['allow', 'count'])
+def test_duplicate_keys(duplicates):
+    tree = RedBlackTree(order_statistics=True, duplicates=duplicates)
+    for key in (7, 3, 7, 7, 1, 3):
+        tree.insert(key)
+
+    # As repetições contam em todas as consultas, nas duas políticas.
+    assert tree.rank(3) == 3
+    assert tree.rank(7) == 6
+    assert tree.count_range(7, 7) == 3
+    assert [tree.select(k) for k in range(1, 7)] == [1, 3, 3, 7, 7, 7]
+    with pytest.raises(IndexError):
+        tree.select(7)
+
+    tree.delete(7)
+    assert tree.count_range(7, 7) == 2
+    check_queries(tree, [1, 3, 3, 7, 7])
+
+def test_reject_duplicates():
+    tree = RedBlackTree(order_statistics=True, duplicates='reject')
+    for key in (2, 2, 5, 2):
+        tree.insert(key)
+    check_queries(tree, [2, 5])
+
+def test_from_iterable():
+    tree = RedBlackTree.from_iterable([9, 4, 4, 1, 12, 7], order_statistics=True)
+    check_queries(tree, [1, 4, 7, 9, 12])
+
+    tree.insert(5)
+    tree.delete(9)
+    check_queries(tree, [1, 4, 5, 7, 12])
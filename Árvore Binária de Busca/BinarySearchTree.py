@@ -1,9 +1,19 @@
 from Node import Node
-import rich.console as console
-import networkx as nx
-import matplotlib.pyplot as plt
+import os
+import sys
+from array import array
 
-class BinarySearchTree:
+# A busca em lote, os percursos, a cópia congelada, o formato dos snapshots e
+# a preparação das chaves do from_iterable ficam em Utils, compartilhados com a
+# outra árvore (e, no caso dos snapshots, com a versão compacta).
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Utils')))
+
+from snapshots import BST_MAGIC, read_snapshot, write_snapshot
+from bulk_load import sorted_unique
+from node_tree import NodeTreeMixin
+from frozen_tree import FrozenTree
+
+class BinarySearchTree(NodeTreeMixin):
     def __init__(self):
         
         # Inicializa a raiz da árvore como None (árvore vazia).
@@ -14,6 +24,49 @@ class BinarySearchTree:
         self.hits = 0  # Conta o número de acertos durante buscas.
         self.misses = 0  # Conta o número de erros durante buscas.
 
+    @classmethod
+    def from_iterable(cls, iterable, count_comparisons=True):
+        """
+        Constrói uma árvore binária de busca balanceada a partir de um lote de
+        chaves, sem passar pelo insert. As chaves são ordenadas (ou apenas
+        verificadas, se já vierem ordenadas), as duplicatas são removidas e a
+        árvore é montada escolhendo sempre o elemento do meio como raiz de cada
+        subárvore, em tempo linear depois da ordenação. Com isso uma entrada
+        sequencial não degenera a árvore em uma lista.
+
+        O comparison_count da árvore passa a contar as comparações feitas na
+        verificação, na ordenação e na remoção de duplicatas.
+        Com count_comparisons=False as chaves são ordenadas com sorted(set(...)),
+        sem contar as comparações, o que é bem mais rápido.
+        """
+        tree = cls()
+        keys, comparisons = sorted_unique(iterable, count_comparisons)
+        tree.comparison_count += comparisons
+
+        # Pilha com os intervalos [inicio, fim) ainda não montados, o nó pai e
+        # o lado em que o nó será pendurado.
+        stack = [(0, len(keys), None, False)] if keys else []
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            mid = (lo + hi) // 2
+
+            node = Node(keys[mid])
+            node.parent = parent
+
+            if parent is None:
+                tree.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+
+            if lo < mid:
+                stack.append((lo, mid, node, True))
+            if mid + 1 < hi:
+                stack.append((mid + 1, hi, node, False))
+
+        return tree
+
     def insert(self, key):
         """
         Insere um novo nó com a chave fornecida na árvore.
@@ -47,6 +100,108 @@ class BinarySearchTree:
         else:
             parent.right = new_node
 
+    def delete(self, key):
+        """
+        Remove um nó com a chave fornecida da árvore. Quando o nó possui dois
+        filhos, ele recebe a chave do seu sucessor (o menor nó da subárvore
+        direita), que é removido no lugar dele. Retorna True se a chave foi
+        encontrada e removida e False caso contrário.
+        """
+        node = self.root  # Começa a busca pela raiz da árvore.
+
+        # Procura o nó a ser removido.
+        while node is not None and key != node.key:
+            if key < node.key:
+                node = node.left  # Vai para a esquerda se a chave for menor.
+            else:
+                node = node.right  # Vai para a direita se a chave for maior.
+
+        if node is None:
+            return False  # A chave não está na árvore.
+
+        # Com dois filhos, copia a chave do sucessor e passa a remover o sucessor,
+        # que nunca tem filho esquerdo.
+        if node.left is not None and node.right is not None:
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+
+            node.key = successor.key
+            node = successor
+
+        # Agora o nó tem no máximo um filho, que sobe para o lugar dele.
+        child = node.left if node.left is not None else node.right
+
+        if child is not None:
+            child.parent = node.parent
+
+        if node.parent is None:
+            self.root = child  # O nó removido era a raiz.
+        elif node == node.parent.left:
+            node.parent.left = child
+        else:
+            node.parent.right = child
+
+        return True
+
+    def _lower_bound(self, key):
+        """
+        Retorna o nó com a menor chave maior ou igual à chave fornecida, ou
+        None se não existir, descendo uma única vez a partir da raiz.
+        """
+        node = self.root
+        candidate = None
+
+        while node is not None:
+            if node.key < key:
+                node = node.right
+            else:
+                # O nó serve, mas pode haver um menor na subárvore esquerda.
+                candidate = node
+                node = node.left
+
+        return candidate
+
+    def _successor(self, node):
+        """
+        Retorna o nó seguinte em ordem, usando os ponteiros para o pai.
+        """
+        # Com subárvore direita, o sucessor é o menor nó dela.
+        if node.right is not None:
+            node = node.right
+            while node.left is not None:
+                node = node.left
+            return node
+
+        # Sem subárvore direita, sobe até chegar vindo de um filho esquerdo.
+        parent = node.parent
+        while parent is not None and node is parent.right:
+            node = parent
+            parent = parent.parent
+
+        return parent
+
+    def iter_from(self, key):
+        """
+        Gera, em ordem crescente, as chaves maiores ou iguais à chave fornecida.
+        Desce uma vez até o limite inferior e depois caminha pelos sucessores.
+        """
+        node = self._lower_bound(key)
+
+        while node is not None:
+            yield node.key
+            node = self._successor(node)
+
+    def range(self, lo, hi):
+        """
+        Gera, em ordem crescente, as chaves no intervalo [lo, hi]. O custo é
+        O(log n + k), onde k é a quantidade de chaves geradas.
+        """
+        for key in self.iter_from(lo):
+            if key > hi:
+                break
+            yield key
+
     def search(self, key):
         """
         Busca um nó com a chave fornecida e retorna o número de comparações feitas.
@@ -70,26 +225,96 @@ class BinarySearchTree:
         
         return comparisons  # Retorna o número de comparações, mesmo se o nó não for encontrado.
 
+    def freeze(self, layout='bfs'):
+        """
+        Retorna uma cópia imutável da árvore, com a mesma forma, disposta em
+        vetores na ordem por nível ('bfs') ou van Emde Boas ('veb'), para uma
+        fase só de consultas. A busca na cópia faz as mesmas comparações, mas a
+        árvore original pode continuar sendo alterada sem afetá-la.
+        """
+        return FrozenTree.from_tree(self, layout, None)
+
+    def save(self, path):
+        """
+        Grava a árvore em um snapshot binário, numerando os nós em pré-ordem. A
+        árvore pode ser recarregada com load sem refazer nenhuma comparação,
+        mantendo exatamente o mesmo formato (inclusive se estiver degenerada).
+        """
+        # A posição 0 de cada vetor indica a ausência de nó.
+        keys = [0]
+        left = array('i', [0])
+        right = array('i', [0])
+        parent = array('i', [0])
+
+        # Percorre em pré-ordem guardando o índice do pai e o lado do filho.
+        stack = [(self.root, 0, False)] if self.root is not None else []
+        while stack:
+            node, parent_index, is_left = stack.pop()
+            index = len(keys)
+
+            keys.append(node.key)
+            left.append(0)
+            right.append(0)
+            parent.append(parent_index)
+
+            if is_left:
+                left[parent_index] = index
+            elif parent_index:
+                right[parent_index] = index
+
+            # Empilha a direita primeiro para que a esquerda receba o próximo índice.
+            if node.right is not None:
+                stack.append((node.right, index, False))
+            if node.left is not None:
+                stack.append((node.left, index, True))
+
+        write_snapshot(path, BST_MAGIC, 1 if len(keys) > 1 else 0, keys, left, right, parent)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Recarrega uma árvore gravada com save, ligando os nós diretamente a partir
+        dos vetores do snapshot, sem comparações.
+        """
+        tree = cls()
+        root, keys, left, right, parent, _, _ = read_snapshot(path, BST_MAGIC)
+
+        # Cria todos os nós; a posição 0 corresponde a None.
+        nodes = [None]
+        nodes.extend(Node(keys[i]) for i in range(1, len(keys)))
+
+        for i in range(1, len(nodes)):
+            node = nodes[i]
+            node.left = nodes[left[i]]
+            node.right = nodes[right[i]]
+            node.parent = nodes[parent[i]]
+
+        tree.root = nodes[root]
+
+        return tree
+
     def inorder_traversal(self, node):
         """
         Percorre a árvore em ordem (in-order traversal).
         """
-        
-        if node is not None:
-            # Percorre a subárvore esquerda.
-            self.inorder_traversal(node.left)
 
-            # Visita o nó atual (imprime a chave).
+        # Visita cada nó em ordem (imprime a chave).
+        for node in self._inorder_nodes(node):
             print(node.key)
 
-            # Percorre a subárvore direita.
-            self.inorder_traversal(node.right)
-
     def print_tree(self, node, indent="", last=True):
         """
         Exibe a árvore no terminal de forma hierárquica.
         """
-        if node is not None:
+        # Pilha com os nós a imprimir, a indentação e se são o último nó do nível.
+        stack = [(node, indent, last)]
+
+        while stack:
+            node, indent, last = stack.pop()
+
+            if node is None:
+                continue
+
             # Imprime a indentação atual.
             print(indent, end="")
 
@@ -104,16 +329,19 @@ class BinarySearchTree:
             # Imprime a chave do nó atual.
             print(node.key)
 
-            # Percorre a subárvore esquerda.
-            self.print_tree(node.left, indent, False)
-
-            # Percorre a subárvore direita.
-            self.print_tree(node.right, indent, True)
+            # Empilha a subárvore direita antes da esquerda, para que a esquerda
+            # seja impressa primeiro.
+            stack.append((node.right, indent, True))
+            stack.append((node.left, indent, False))
 
     def visualize_tree(self):
         """
         Gera uma visualização gráfica da árvore usando matplotlib e networkx.
         """
+        # As bibliotecas de visualização só são importadas quando usadas.
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
         G = nx.DiGraph()  # Cria um grafo direcionado para representar a árvore.
         self._add_nodes_edges(self.root, G)  # Adiciona nós e arestas ao grafo.
 
@@ -129,19 +357,18 @@ class BinarySearchTree:
         """
         Adiciona nós e arestas ao grafo.
         """
-        if node is not None:
+        # Percorre a subárvore em pré-ordem, sem recursão.
+        for node in self._preorder_nodes(node):
             # Adiciona o nó ao grafo.
             G.add_node(node.key)
 
             # Adiciona uma aresta para o filho esquerdo, se existir.
             if node.left is not None:
                 G.add_edge(node.key, node.left.key)
-                self._add_nodes_edges(node.left, G)  # Recursão para o filho esquerdo.
 
             # Adiciona uma aresta para o filho direito, se existir.
             if node.right is not None:
                 G.add_edge(node.key, node.right.key)
-                self._add_nodes_edges(node.right, G)  # Recursão para o filho direito.
 
     def _hierarchy_pos(self, G, root, width=1.0, vert_gap=0.2, vert_loc=0, xcenter=0.5):
         """
@@ -150,24 +377,32 @@ class BinarySearchTree:
         if root is None:
             return {}  # Retorna um dicionário vazio se a árvore estiver vazia.
 
-        # Define a posição do nó raiz.
-        pos = {root: (xcenter, vert_loc)}
+        pos = {}
+
+        # Pilha com o nó, a largura do espaço da sua subárvore e sua posição.
+        stack = [(root, width, vert_loc, xcenter)]
+
+        while stack:
+            root, width, vert_loc, xcenter = stack.pop()
+
+            # Define a posição do nó atual.
+            pos[root] = (xcenter, vert_loc)
 
-        # Obtém os vizinhos (filhos) do nó raiz.
-        neighbors = list(G.neighbors(root))
+            # Obtém os vizinhos (filhos) do nó atual.
+            neighbors = list(G.neighbors(root))
 
-        # Se houver vizinhos, calcula a posição de cada um.
-        if len(neighbors) != 0:
-            dx = width / 2  # Largura do espaço para cada subárvore.
-            nextx = xcenter - width / 2  # Posição inicial no eixo x.
+            # Se houver vizinhos, calcula a posição de cada um.
+            if len(neighbors) != 0:
+                dx = width / 2  # Largura do espaço para cada subárvore.
+                nextx = xcenter - width / 2  # Posição inicial no eixo x.
 
-            # Percorre os vizinhos e calcula suas posições.
-            for neighbor in neighbors:
-                if neighbor < root:  # Nó à esquerda (menor que o nó atual).
-                    pos.update(self._hierarchy_pos(G, neighbor, width=dx, vert_gap=vert_gap, vert_loc=vert_loc - vert_gap, xcenter=nextx))
-                else:  # Nó à direita (maior que o nó atual).
-                    pos.update(self._hierarchy_pos(G, neighbor, width=dx, vert_gap=vert_gap, vert_loc=vert_loc - vert_gap, xcenter=nextx + dx))
-                nextx += dx
+                # Percorre os vizinhos e calcula suas posições.
+                for neighbor in neighbors:
+                    if neighbor < root:  # Nó à esquerda (menor que o nó atual).
+                        stack.append((neighbor, dx, vert_loc - vert_gap, nextx))
+                    else:  # Nó à direita (maior que o nó atual).
+                        stack.append((neighbor, dx, vert_loc - vert_gap, nextx + dx))
+                    nextx += dx
 
         # Retorna o dicionário de posições.
-        return pos
\ No newline at end of file
+        return pos
@@ -0,0 +1,297 @@
+import os
+import sys
+from array import array
+
+# O formato dos snapshots fica em Utils, compartilhado com a BinarySearchTree.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Utils')))
+
+from snapshots import BST_MAGIC, read_snapshot, write_snapshot
+
+# Índice que representa a ausência de nó (equivalente ao None da BinarySearchTree).
+# A posição 0 dos vetores é reservada e nunca guarda uma chave.
+NIL = 0
+
+def _key_range_error(key, keys):
+    # Mensagem do OverflowError de uma chave que não cabe no vetor de chaves.
+    bits = 8 * keys.itemsize
+    message = f"A chave {key} não cabe no vetor de chaves de {bits} bits (de {-2 ** (bits - 1)} a {2 ** (bits - 1) - 1})"
+    if keys.typecode != 'q':
+        message += "; crie a árvore com typecode='q' para chaves de 64 bits"
+    return message + "."
+
+class CompactBinarySearchTree:
+    """
+    Árvore binária de busca com armazenamento compacto: os campos de todos os
+    nós ficam em vetores paralelos tipados (chave, esquerda, direita e pai como
+    inteiros de 32 bits), e um nó é apenas o índice da sua posição.
+
+    Possui a mesma interface de insert/search/search_many/delete da
+    BinarySearchTree, com os mesmos contadores de comparações, hits e misses.
+    """
+
+    def __init__(self, typecode='i'):
+
+        # Vetores paralelos com os campos dos nós, com a posição 0 reservada.
+        # O typecode 'i' guarda as chaves como inteiros de 32 bits; para chaves
+        # maiores pode ser usado 'q' (64 bits).
+        self.key = array(typecode, [0])
+        self.left = array('i', [NIL])
+        self.right = array('i', [NIL])
+        self.parent = array('i', [NIL])
+
+        # Inicializa a raiz da árvore como vazia.
+        self.root = NIL
+
+        # Contadores para comparações, hits e misses.
+        self.comparison_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        # Desconta a posição reservada.
+        return len(self.key) - 1
+
+    def insert(self, key):
+        """
+        Insere um novo nó com a chave fornecida na árvore.
+        """
+        keys = self.key
+        left = self.left
+        right = self.right
+
+        parent = NIL
+        current = self.root
+        comparisons = 0
+
+        # Encontra a posição correta para inserir o novo nó.
+        while current != NIL:
+            parent = current
+            comparisons += 1
+
+            if key < keys[current]:
+                current = left[current]
+            else:
+                current = right[current]
+
+        self.comparison_count += comparisons
+
+        # O novo nó é a próxima posição livre dos vetores. O vetor de chaves é o
+        # primeiro a crescer, então uma chave fora do typecode não altera nada.
+        node = len(keys)
+        try:
+            keys.append(key)
+        except OverflowError:
+            raise OverflowError(_key_range_error(key, keys)) from None
+        left.append(NIL)
+        right.append(NIL)
+        self.parent.append(parent)
+
+        if parent == NIL:
+            self.root = node
+        elif key < keys[parent]:
+            left[parent] = node
+        else:
+            right[parent] = node
+
+    def delete(self, key):
+        """
+        Remove um nó com a chave fornecida da árvore, como o delete da
+        BinarySearchTree. Retorna True se a chave foi encontrada e removida e
+        False caso contrário.
+        """
+        keys = self.key
+        left = self.left
+        right = self.right
+        parent = self.parent
+
+        # Procura o nó a ser removido.
+        node = self.root
+        while node != NIL and key != keys[node]:
+            if key < keys[node]:
+                node = left[node]
+            else:
+                node = right[node]
+
+        if node == NIL:
+            return False
+
+        # Com dois filhos, copia a chave do sucessor e passa a remover o sucessor,
+        # que nunca tem filho esquerdo.
+        if left[node] != NIL and right[node] != NIL:
+            successor = right[node]
+            while left[successor] != NIL:
+                successor = left[successor]
+
+            keys[node] = keys[successor]
+            node = successor
+
+        # Agora o nó tem no máximo um filho, que sobe para o lugar dele.
+        child = left[node] if left[node] != NIL else right[node]
+
+        if child != NIL:
+            parent[child] = parent[node]
+
+        if parent[node] == NIL:
+            self.root = child
+        elif node == left[parent[node]]:
+            left[parent[node]] = child
+        else:
+            right[parent[node]] = child
+
+        self._release(node)
+        return True
+
+    def _release(self, node):
+        # Libera a posição do nó removido movendo o último nó dos vetores para
+        # ela, para que os vetores continuem sem buracos e len() siga correto.
+        keys = self.key
+        left = self.left
+        right = self.right
+        parent = self.parent
+
+        last = len(keys) - 1
+        if node != last:
+            keys[node] = keys[last]
+            left[node] = left[last]
+            right[node] = right[last]
+            parent[node] = parent[last]
+
+            # O pai e os filhos do último nó passam a apontar para a nova posição.
+            father = parent[last]
+            if father == NIL:
+                self.root = node
+            elif left[father] == last:
+                left[father] = node
+            else:
+                right[father] = node
+            if left[last] != NIL:
+                parent[left[last]] = node
+            if right[last] != NIL:
+                parent[right[last]] = node
+
+        keys.pop()
+        left.pop()
+        right.pop()
+        parent.pop()
+
+    def save(self, path):
+        """
+        Grava a árvore no mesmo formato de snapshot da BinarySearchTree. Os nós
+        são renumerados em pré-ordem, então o arquivo pode ser lido por qualquer
+        uma das duas classes.
+        """
+        keys = self.key
+        left = self.left
+        right = self.right
+
+        # Novo índice (pré-ordem) de cada nó, com a posição 0 mantida reservada.
+        order = [NIL]
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if right[node] != NIL:
+                stack.append(right[node])
+            if left[node] != NIL:
+                stack.append(left[node])
+
+        new_index = array('i', [0]) * len(keys)
+        for index, node in enumerate(order):
+            new_index[node] = index
+
+        write_snapshot(
+            path,
+            BST_MAGIC,
+            new_index[self.root],
+            [keys[node] for node in order],
+            [new_index[left[node]] for node in order],
+            [new_index[right[node]] for node in order],
+            [new_index[self.parent[node]] for node in order],
+        )
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """
+        Carrega um snapshot gravado pela BinarySearchTree ou pela
+        CompactBinarySearchTree. Com use_mmap=True (padrão) os vetores são lidos
+        diretamente do arquivo mapeado em memória, então a árvore fica pronta
+        para buscas quase instantaneamente, mas não aceita novas inserções.
+        """
+        tree = cls()
+        tree.root, tree.key, tree.left, tree.right, tree.parent, _, _ = read_snapshot(path, BST_MAGIC, use_mmap)
+        return tree
+
+    def search(self, key):
+        """
+        Busca um nó com a chave fornecida e retorna o número de comparações feitas.
+        Incrementa os contadores de hits e misses.
+        """
+        keys = self.key
+        left = self.left
+        right = self.right
+
+        current = self.root
+        comparisons = 0
+
+        while current != NIL:
+            comparisons += 1
+            current_key = keys[current]
+            if key == current_key:
+                self.hits += 1
+                return comparisons
+            elif key < current_key:
+                current = left[current]
+            else:
+                current = right[current]
+
+        self.misses += 1
+        return comparisons
+
+    def search_many(self, keys):
+        """
+        Busca um lote de chaves e retorna (hits, misses, comparações de cada
+        chave), como o search_many da BinarySearchTree.
+        """
+        found, comparisons = self._search_batch(keys)
+        hits = sum(found)
+        return hits, len(found) - hits, comparisons
+
+    def search_mask(self, keys):
+        """
+        Busca um lote de chaves e retorna uma lista com True para cada chave
+        encontrada, atualizando hits e misses como o search.
+        """
+        found, _ = self._search_batch(keys)
+        return found
+
+    def _search_batch(self, keys):
+        # Busca de cada chave do lote a partir da raiz, com os vetores em
+        # variáveis locais; retorna os acertos e as comparações de cada chave.
+        tree_keys = self.key
+        left = self.left
+        right = self.right
+        root = self.root
+
+        found = []
+        comparisons = []
+
+        for key in keys:
+            current = root
+            count = 0
+            while current != NIL:
+                count += 1
+                current_key = tree_keys[current]
+                if key == current_key:
+                    break
+                elif key < current_key:
+                    current = left[current]
+                else:
+                    current = right[current]
+            found.append(current != NIL)
+            comparisons.append(count)
+
+        hits = sum(found)
+        self.hits += hits
+        self.misses += len(found) - hits
+
+        return found, comparisons
@@ -0,0 +1,36 @@
+import os
+import sys
+from BinarySearchTree import BinarySearchTree
+
+# O TreeStats fica em Utils, compartilhado com a InstrumentedRedBlackTree.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Utils')))
+
+from tree_stats import TreeStats
+
+class InstrumentedBinarySearchTree(BinarySearchTree):
+    """
+    BinarySearchTree que registra as estatísticas das operações em self.stats.
+    A BinarySearchTree em si não tem nenhum contador extra no caminho crítico.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.stats = TreeStats()
+
+    def insert(self, key):
+        # Uma comparação por nível na descida: a diferença no comparison_count
+        # é a profundidade do novo nó.
+        before = self.comparison_count
+        super().insert(key)
+        self.stats.insert_depth[self.comparison_count - before] += 1
+
+    def search(self, key):
+        comparisons = super().search(key)
+        self.stats.search_depth[comparisons] += 1
+        return comparisons
+
+    def _search_batch(self, keys):
+        # Usado pelo search_many e pelo search_mask.
+        found, comparisons = super()._search_batch(keys)
+        self.stats.search_depth.update(comparisons)
+        return found, comparisons
@@ -0,0 +1,513 @@
+import os
+import sys
+from array import array
+
+# O formato dos snapshots fica em Utils, compartilhado com a RedBlackTree.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Utils')))
+
+from snapshots import RB_MAGIC, read_snapshot, write_snapshot
+
+# Índice reservado para o nó NIL. Como os nós são posições nos vetores, o NIL
+# ocupa a posição 0 e todo filho/pai "vazio" aponta para ele.
+NIL = 0
+
+# As cores são guardadas como um byte por nó, em vez das strings 'RED'/'BLACK'.
+BLACK = 0
+RED = 1
+
+def _key_range_error(key, keys):
+    # Mensagem do OverflowError de uma chave que não cabe no vetor de chaves.
+    bits = 8 * keys.itemsize
+    message = f"A chave {key} não cabe no vetor de chaves de {bits} bits (de {-2 ** (bits - 1)} a {2 ** (bits - 1) - 1})"
+    if keys.typecode != 'q':
+        message += "; crie a árvore com typecode='q' para chaves de 64 bits"
+    return message + "."
+
+class CompactRedBlackTree:
+    """
+    Árvore rubro-negra com armazenamento compacto: em vez de um objeto Node por
+    chave, os campos de todos os nós ficam em vetores paralelos tipados
+    (chave, esquerda, direita e pai como inteiros de 32 bits e a cor como um
+    byte). Um nó é apenas o índice da sua posição nesses vetores.
+
+    Possui a mesma interface de insert/search/search_many/delete da
+    RedBlackTree, com os mesmos contadores de comparações, hits e misses.
+    """
+
+    def __init__(self, typecode='i'):
+
+        # Vetores paralelos com os campos dos nós. A posição 0 é o NIL, que é
+        # sempre preto e não possui chave válida.
+        # O typecode 'i' guarda as chaves como inteiros de 32 bits; para chaves
+        # maiores pode ser usado 'q' (64 bits).
+        self.key = array(typecode, [0])
+        self.left = array('i', [NIL])
+        self.right = array('i', [NIL])
+        self.parent = array('i', [NIL])
+        self.color = bytearray([BLACK])
+
+        # No início a árvore está vazia, então a raiz aponta para o NIL.
+        self.root = NIL
+
+        # Contadores de comparações (inserção), hits e misses (busca).
+        self.comparison_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        # Desconta a posição reservada para o NIL.
+        return len(self.key) - 1
+
+    def insert(self, key):
+        """
+        Insere a chave na árvore, corrigindo as propriedades rubro-negras.
+        """
+        keys = self.key
+        left = self.left
+        right = self.right
+
+        parent = NIL
+        current = self.root
+        comparisons = 0
+
+        # Desce até um NIL, exatamente como na RedBlackTree.
+        while current != NIL:
+            parent = current
+            comparisons += 1
+
+            if key < keys[current]:
+                current = left[current]
+            else:
+                current = right[current]
+
+        self.comparison_count += comparisons
+
+        # O novo nó é a próxima posição livre dos vetores. O vetor de chaves é o
+        # primeiro a crescer, então uma chave fora do typecode não altera nada.
+        node = len(keys)
+        try:
+            keys.append(key)
+        except OverflowError:
+            raise OverflowError(_key_range_error(key, keys)) from None
+        left.append(NIL)
+        right.append(NIL)
+        self.parent.append(parent)
+        self.color.append(RED)
+
+        if parent == NIL:
+            self.root = node
+        elif key < keys[parent]:
+            left[parent] = node
+        else:
+            right[parent] = node
+
+        self._fix_insert(node)
+
+    def _fix_insert(self, node):
+        parent = self.parent
+        left = self.left
+        right = self.right
+        color = self.color
+
+        # O pai da raiz é o NIL, que é preto, então o laço para na raiz.
+        while color[parent[node]] == RED:
+            father = parent[node]
+            grandfather = parent[father]
+
+            if father == left[grandfather]:
+                uncle = right[grandfather]
+
+                # Caso 1: o tio é vermelho, apenas recolore.
+                if color[uncle] == RED:
+                    color[father] = BLACK
+                    color[uncle] = BLACK
+                    color[grandfather] = RED
+                    node = grandfather
+                else:
+                    # Caso 2: o nó é filho direito, rotaciona para virar o Caso 3.
+                    if node == right[father]:
+                        node = father
+                        self._left_rotate(node)
+                        father = parent[node]
+
+                    # Caso 3: recolore e rotaciona o avô para a direita.
+                    color[father] = BLACK
+                    color[grandfather] = RED
+                    self._right_rotate(grandfather)
+            else:
+                uncle = left[grandfather]
+
+                # Caso 1 (simétrico): o tio é vermelho, apenas recolore.
+                if color[uncle] == RED:
+                    color[father] = BLACK
+                    color[uncle] = BLACK
+                    color[grandfather] = RED
+                    node = grandfather
+                else:
+                    # Caso 2 (simétrico): o nó é filho esquerdo.
+                    if node == left[father]:
+                        node = father
+                        self._right_rotate(node)
+                        father = parent[node]
+
+                    # Caso 3 (simétrico): recolore e rotaciona o avô para a esquerda.
+                    color[father] = BLACK
+                    color[grandfather] = RED
+                    self._left_rotate(grandfather)
+
+        # Garante que a raiz seja sempre preta.
+        color[self.root] = BLACK
+
+    def _left_rotate(self, x):
+        parent = self.parent
+        left = self.left
+        right = self.right
+
+        # y é o filho direito de x e o filho esquerdo de y passa para x.
+        y = right[x]
+        right[x] = left[y]
+
+        if left[y] != NIL:
+            parent[left[y]] = x
+
+        # y ocupa o lugar de x abaixo do pai de x.
+        parent[y] = parent[x]
+
+        if parent[x] == NIL:
+            self.root = y
+        elif x == left[parent[x]]:
+            left[parent[x]] = y
+        else:
+            right[parent[x]] = y
+
+        left[y] = x
+        parent[x] = y
+
+    def _right_rotate(self, y):
+        parent = self.parent
+        left = self.left
+        right = self.right
+
+        # x é o filho esquerdo de y e o filho direito de x passa para y.
+        x = left[y]
+        left[y] = right[x]
+
+        if right[x] != NIL:
+            parent[right[x]] = y
+
+        # x ocupa o lugar de y abaixo do pai de y.
+        parent[x] = parent[y]
+
+        if parent[y] == NIL:
+            self.root = x
+        elif y == right[parent[y]]:
+            right[parent[y]] = x
+        else:
+            left[parent[y]] = x
+
+        right[x] = y
+        parent[y] = x
+
+    def delete(self, key):
+        """
+        Remove um nó com a chave fornecida, mantendo as propriedades da árvore
+        rubro-negra, como o delete da RedBlackTree. Retorna True se a chave foi
+        encontrada e removida e False caso contrário.
+        """
+        keys = self.key
+        left = self.left
+        right = self.right
+        parent = self.parent
+        color = self.color
+
+        # Procura o nó a ser removido.
+        node = self.root
+        while node != NIL and key != keys[node]:
+            if key < keys[node]:
+                node = left[node]
+            else:
+                node = right[node]
+
+        if node == NIL:
+            return False
+
+        # y é o nó que sai de fato da sua posição e x é o nó que ocupa o lugar de y.
+        y = node
+        y_original_color = color[y]
+
+        if left[node] == NIL:
+            x = right[node]
+            self._transplant(node, x)
+        elif right[node] == NIL:
+            x = left[node]
+            self._transplant(node, x)
+        else:
+            # Dois filhos: o sucessor ocupa o lugar do nó, herdando sua cor.
+            y = right[node]
+            while left[y] != NIL:
+                y = left[y]
+            y_original_color = color[y]
+            x = right[y]
+
+            if parent[y] == node:
+                parent[x] = y
+            else:
+                self._transplant(y, x)
+                right[y] = right[node]
+                parent[right[y]] = y
+
+            self._transplant(node, y)
+            left[y] = left[node]
+            parent[left[y]] = y
+            color[y] = color[node]
+
+        if y_original_color == BLACK:
+            self._fix_delete(x)
+
+        # O NIL pode ter recebido um pai durante a remoção; volta ao estado inicial.
+        parent[NIL] = NIL
+
+        self._release(node)
+        return True
+
+    def _transplant(self, u, v):
+        parent = self.parent
+
+        # Substitui a subárvore de u pela de v (mesmo quando v é o NIL, cujo pai
+        # é usado pelo _fix_delete para subir na árvore).
+        if parent[u] == NIL:
+            self.root = v
+        elif u == self.left[parent[u]]:
+            self.left[parent[u]] = v
+        else:
+            self.right[parent[u]] = v
+        parent[v] = parent[u]
+
+    def _fix_delete(self, x):
+        parent = self.parent
+        left = self.left
+        right = self.right
+        color = self.color
+
+        # x carrega um preto extra; sobe até encontrar um nó vermelho ou a raiz.
+        while x != self.root and color[x] == BLACK:
+            father = parent[x]
+
+            if x == left[father]:
+                sibling = right[father]
+
+                # Caso 1: o irmão é vermelho; a rotação leva aos outros casos.
+                if color[sibling] == RED:
+                    color[sibling] = BLACK
+                    color[father] = RED
+                    self._left_rotate(father)
+                    sibling = right[father]
+
+                # Caso 2: os filhos do irmão são pretos; o preto extra sobe.
+                if color[left[sibling]] == BLACK and color[right[sibling]] == BLACK:
+                    color[sibling] = RED
+                    x = father
+                else:
+                    # Caso 3: só o filho esquerdo do irmão é vermelho.
+                    if color[right[sibling]] == BLACK:
+                        color[left[sibling]] = BLACK
+                        color[sibling] = RED
+                        self._right_rotate(sibling)
+                        sibling = right[father]
+
+                    # Caso 4: o filho direito do irmão é vermelho; termina a correção.
+                    color[sibling] = color[father]
+                    color[father] = BLACK
+                    color[right[sibling]] = BLACK
+                    self._left_rotate(father)
+                    x = self.root
+            else:
+                sibling = left[father]
+
+                # Casos simétricos, com x como filho direito.
+                if color[sibling] == RED:
+                    color[sibling] = BLACK
+                    color[father] = RED
+                    self._right_rotate(father)
+                    sibling = left[father]
+
+                if color[left[sibling]] == BLACK and color[right[sibling]] == BLACK:
+                    color[sibling] = RED
+                    x = father
+                else:
+                    if color[left[sibling]] == BLACK:
+                        color[right[sibling]] = BLACK
+                        color[sibling] = RED
+                        self._left_rotate(sibling)
+                        sibling = left[father]
+
+                    color[sibling] = color[father]
+                    color[father] = BLACK
+                    color[left[sibling]] = BLACK
+                    self._right_rotate(father)
+                    x = self.root
+
+        color[x] = BLACK
+
+    def _release(self, node):
+        # Libera a posição do nó removido movendo o último nó dos vetores para
+        # ela, para que os vetores continuem sem buracos e len() siga correto.
+        keys = self.key
+        left = self.left
+        right = self.right
+        parent = self.parent
+        color = self.color
+
+        last = len(keys) - 1
+        if node != last:
+            keys[node] = keys[last]
+            left[node] = left[last]
+            right[node] = right[last]
+            parent[node] = parent[last]
+            color[node] = color[last]
+
+            # O pai e os filhos do último nó passam a apontar para a nova posição.
+            father = parent[last]
+            if father == NIL:
+                self.root = node
+            elif left[father] == last:
+                left[father] = node
+            else:
+                right[father] = node
+            if left[last] != NIL:
+                parent[left[last]] = node
+            if right[last] != NIL:
+                parent[right[last]] = node
+
+        keys.pop()
+        left.pop()
+        right.pop()
+        parent.pop()
+        color.pop()
+
+    def save(self, path):
+        """
+        Grava a árvore no mesmo formato de snapshot da RedBlackTree. Os nós são
+        renumerados em pré-ordem, então o arquivo pode ser lido por qualquer uma
+        das duas classes.
+        """
+        keys = self.key
+        left = self.left
+        right = self.right
+
+        # Novo índice (pré-ordem) de cada nó, com o NIL continuando na posição 0.
+        order = [NIL]
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if right[node] != NIL:
+                stack.append(right[node])
+            if left[node] != NIL:
+                stack.append(left[node])
+
+        new_index = array('i', [0]) * len(keys)
+        for index, node in enumerate(order):
+            new_index[node] = index
+
+        write_snapshot(
+            path,
+            RB_MAGIC,
+            new_index[self.root],
+            [keys[node] for node in order],
+            [new_index[left[node]] for node in order],
+            [new_index[right[node]] for node in order],
+            [new_index[self.parent[node]] for node in order],
+            [self.color[node] for node in order],
+        )
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """
+        Carrega um snapshot gravado pela RedBlackTree ou pela CompactRedBlackTree.
+        Com use_mmap=True (padrão) os vetores são lidos diretamente do arquivo
+        mapeado em memória, então a árvore fica pronta para buscas quase
+        instantaneamente, mas não aceita novas inserções.
+        """
+        tree = cls()
+        tree.root, tree.key, tree.left, tree.right, tree.parent, tree.color, duplicates, _ = read_snapshot(path, RB_MAGIC, use_mmap)
+
+        # A versão compacta guarda um nó por chave, sem contagem de repetições.
+        if duplicates == 'count':
+            raise ValueError(f"O snapshot {path} tem repetições contadas (duplicates='count'), que a {cls.__name__} não suporta.")
+        return tree
+
+    def search(self, key):
+        """
+        Busca um nó com a chave fornecida e retorna o número de comparações feitas.
+        Incrementa os contadores de hits e misses.
+        """
+        keys = self.key
+        left = self.left
+        right = self.right
+
+        current = self.root
+        comparisons = 0
+
+        while current != NIL:
+            comparisons += 1
+            current_key = keys[current]
+            if key == current_key:
+                self.hits += 1
+                return comparisons
+            elif key < current_key:
+                current = left[current]
+            else:
+                current = right[current]
+
+        self.misses += 1
+        return comparisons
+
+    def search_many(self, keys):
+        """
+        Busca um lote de chaves e retorna (hits, misses, comparações de cada
+        chave), como o search_many da RedBlackTree.
+        """
+        found, comparisons = self._search_batch(keys)
+        hits = sum(found)
+        return hits, len(found) - hits, comparisons
+
+    def search_mask(self, keys):
+        """
+        Busca um lote de chaves e retorna uma lista com True para cada chave
+        encontrada, atualizando hits e misses como o search.
+        """
+        found, _ = self._search_batch(keys)
+        return found
+
+    def _search_batch(self, keys):
+        # Busca de cada chave do lote a partir da raiz, com os vetores em
+        # variáveis locais; retorna os acertos e as comparações de cada chave.
+        tree_keys = self.key
+        left = self.left
+        right = self.right
+        root = self.root
+
+        found = []
+        comparisons = []
+
+        for key in keys:
+            current = root
+            count = 0
+            while current != NIL:
+                count += 1
+                current_key = tree_keys[current]
+                if key == current_key:
+                    break
+                elif key < current_key:
+                    current = left[current]
+                else:
+                    current = right[current]
+            found.append(current != NIL)
+            comparisons.append(count)
+
+        hits = sum(found)
+        self.hits += hits
+        self.misses += len(found) - hits
+
+        return found, comparisons
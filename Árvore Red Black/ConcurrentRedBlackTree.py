@@ -0,0 +1,205 @@
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from RedBlackTree import RedBlackTree
+
+# Os contadores por thread ficam em Utils, compartilhados com a
+# PersistentRedBlackTree.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Utils')))
+
+from thread_counters import PerThreadCounters
+
+class ReadWriteLock:
+    """
+    Trava de leitores e escritores: vários leitores ao mesmo tempo ou um único
+    escritor. Um escritor esperando impede a entrada de novos leitores, para que
+    um fluxo contínuo de buscas não deixe as inserções esperando para sempre.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self):
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+class ConcurrentRedBlackTree:
+    """
+    RedBlackTree que pode ser usada por várias threads ao mesmo tempo: as buscas
+    entram com a trava de leitura e podem rodar juntas, enquanto insert e delete
+    (que rotacionam e recolorem nós) entram com a trava de escrita, sozinhos.
+
+    As buscas não chamam o search da RedBlackTree, que incrementa hits e misses
+    da árvore e por isso não pode rodar em paralelo. Cada thread conta hits,
+    misses e comparações em contadores próprios, sem trava, e hits e misses
+    somam os contadores de todas as threads no momento da leitura.
+    """
+
+    def __init__(self, order_statistics=False, duplicates='allow'):
+        self.tree = RedBlackTree(order_statistics=order_statistics, duplicates=duplicates)
+        self.lock = ReadWriteLock()
+
+        self.counters = PerThreadCounters()
+
+    def insert(self, key):
+        with self.lock.write_locked():
+            return self.tree.insert(key)
+
+    def delete(self, key):
+        with self.lock.write_locked():
+            return self.tree.delete(key)
+
+    def _descend(self, key):
+        # Descida do search da RedBlackTree, sem tocar nos contadores da árvore.
+        # Retorna as comparações feitas, negativas em caso de miss.
+        nil = self.tree.NIL
+        current = self.tree.root
+        comparisons = 0
+
+        while current is not nil:
+            comparisons += 1
+            if key == current.key:
+                return comparisons
+            elif key < current.key:
+                current = current.left
+            else:
+                current = current.right
+
+        return -comparisons
+
+    def search(self, key):
+        """
+        Busca a chave e retorna o número de comparações feitas, como o search
+        da RedBlackTree. Os hits e misses vão para os contadores da thread.
+        """
+        with self.lock.read_locked():
+            result = self._descend(key)
+
+        counters = self.counters.mine()
+        counters.searches += 1
+        if result > 0:
+            counters.hits += 1
+        else:
+            counters.misses += 1
+            result = -result
+        counters.comparisons += result
+        return result
+
+    def search_many(self, keys):
+        """
+        Busca um lote de chaves com uma única entrada na trava de leitura e
+        retorna (hits, misses, comparações de cada chave), como o search_many
+        da RedBlackTree. Um escritor esperando aguarda o lote inteiro.
+        """
+        found, comparisons = self._search_batch(keys)
+        hits = sum(found)
+        return hits, len(found) - hits, comparisons
+
+    def search_mask(self, keys):
+        """
+        Busca um lote de chaves como o search_many e retorna uma lista com True
+        para cada chave encontrada, tirada da própria descida (e não dos
+        contadores, que somam as buscas de todas as threads).
+        """
+        found, _ = self._search_batch(keys)
+        return found
+
+    def _search_batch(self, keys):
+        # Lote do search_many e do search_mask, com os acertos e as comparações
+        # de cada chave; os totais vão para os contadores da thread.
+        descend = self._descend
+        found = []
+        comparisons = []
+
+        with self.lock.read_locked():
+            for key in keys:
+                result = descend(key)
+                found.append(result > 0)
+                comparisons.append(abs(result))
+
+        hits = sum(found)
+        counters = self.counters.mine()
+        counters.searches += len(comparisons)
+        counters.hits += hits
+        counters.misses += len(comparisons) - hits
+        counters.comparisons += sum(comparisons)
+
+        return found, comparisons
+
+    @property
+    def hits(self):
+        return self.counters.total('hits')
+
+    @property
+    def misses(self):
+        return self.counters.total('misses')
+
+    @property
+    def comparison_count(self):
+        # Comparações das inserções, como na RedBlackTree.
+        with self.lock.read_locked():
+            return self.tree.comparison_count
+
+    def thread_stats(self):
+        """
+        Lista com (hits, misses, buscas, comparações) de cada thread que já
+        buscou, na ordem da primeira busca de cada uma.
+        """
+        return self.counters.per_thread()
+
+    def range(self, lo, hi):
+        """
+        Lista as chaves no intervalo [lo, hi], copiadas com a trava de leitura.
+        """
+        with self.lock.read_locked():
+            return list(self.tree.range(lo, hi))
+
+    def iter_inorder(self):
+        """
+        Gera as chaves em ordem crescente. As chaves são copiadas com a trava de
+        leitura, então as inserções feitas durante a iteração não a afetam.
+        """
+        with self.lock.read_locked():
+            keys = list(self.tree.iter_inorder())
+        return iter(keys)
@@ -0,0 +1,110 @@
+import os
+import sys
+from RedBlackTree import RedBlackTree, BLACK, RED
+
+# O TreeStats fica em Utils, compartilhado com a InstrumentedBinarySearchTree.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Utils')))
+
+from tree_stats import RedBlackTreeStats
+
+class InstrumentedRedBlackTree(RedBlackTree):
+    """
+    RedBlackTree que registra as estatísticas das operações em self.stats.
+
+    Os contadores ficam nesta subclasse (as rotações em _left_rotate e
+    _right_rotate e as recolorações em uma cópia instrumentada do laço do
+    _fix_insert), então as operações da RedBlackTree não têm nenhum contador
+    além de comparison_count, hits e misses.
+    """
+
+    def __init__(self, order_statistics=False, duplicates='allow'):
+        super().__init__(order_statistics=order_statistics, duplicates=duplicates)
+        self.stats = RedBlackTreeStats()
+
+    def insert(self, key):
+        # A descida do insert faz uma comparação por nível, então a diferença no
+        # comparison_count é a profundidade em que o novo nó foi pendurado.
+        before = self.comparison_count
+        inserted = super().insert(key)
+        self.stats.insert_depth[self.comparison_count - before] += 1
+        return inserted
+
+    def _fix_insert(self, node):
+        # Cópia do laço do _fix_insert da RedBlackTree que conta as iterações e
+        # cada recoloração no ponto em que ela acontece, para que o laço da
+        # RedBlackTree continue sem contadores. As rotações são contadas em
+        # _left_rotate e _right_rotate.
+        stats = self.stats
+        parent = node.parent
+
+        while parent is not None and parent.color == RED:
+            stats.fixup_iterations += 1
+            grandparent = parent.parent
+
+            if parent is grandparent.left:
+                uncle = grandparent.right
+
+                # Caso 1: pai e tio ficam pretos e o avô fica vermelho.
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grandparent.color = RED
+                    stats.recolorings += 3
+                    node = grandparent
+                    parent = node.parent
+                else:
+                    # Caso 2.
+                    if node is parent.right:
+                        self._left_rotate(parent)
+                        node, parent = parent, node
+
+                    # Caso 3: o pai fica preto e o avô fica vermelho.
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    stats.recolorings += 2
+                    self._right_rotate(grandparent)
+                    break
+            else:
+                uncle = grandparent.left
+
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grandparent.color = RED
+                    stats.recolorings += 3
+                    node = grandparent
+                    parent = node.parent
+                else:
+                    if node is parent.left:
+                        self._right_rotate(parent)
+                        node, parent = parent, node
+
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    stats.recolorings += 2
+                    self._left_rotate(grandparent)
+                    break
+
+        # A raiz só conta como recolorida quando estava vermelha.
+        if self.root.color == RED:
+            self.root.color = BLACK
+            stats.recolorings += 1
+
+    def _left_rotate(self, x):
+        self.stats.left_rotations += 1
+        super()._left_rotate(x)
+
+    def _right_rotate(self, y):
+        self.stats.right_rotations += 1
+        super()._right_rotate(y)
+
+    def search(self, key):
+        comparisons = super().search(key)
+        self.stats.search_depth[comparisons] += 1
+        return comparisons
+
+    def _search_batch(self, keys):
+        # Usado pelo search_many e pelo search_mask.
+        found, comparisons = super()._search_batch(keys)
+        self.stats.search_depth.update(comparisons)
+        return found, comparisons
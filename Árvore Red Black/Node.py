@@ -1,5 +1,6 @@
 class Node:
-    def __init__(self, key, color='RED'):
+    def __init__(self, key, color=1):
+        # A cor é 1 (vermelho) ou 0 (preto), como RED e BLACK do RedBlackTree.
         self.key = key
         self.left = None
         self.right = None
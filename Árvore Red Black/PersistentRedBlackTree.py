@@ -0,0 +1,248 @@
+import os
+import sys
+from RedBlackTree import RED, BLACK
+
+# Os contadores por thread ficam em Utils, compartilhados com a
+# ConcurrentRedBlackTree.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Utils')))
+
+from thread_counters import PerThreadCounters
+
+class PersistentNode:
+    """
+    Nó imutável da PersistentRedBlackTree. Não há ponteiro para o pai, pois um
+    mesmo nó pode pertencer a várias versões da árvore, e as folhas são None.
+    """
+    __slots__ = ('key', 'color', 'left', 'right')
+
+    def __init__(self, key, color, left=None, right=None):
+        self.key = key
+        self.color = color
+        self.left = left
+        self.right = right
+
+def _balance(color, left, key, right):
+    """
+    Monta o nó (color, left, key, right), desfazendo um vermelho com filho
+    vermelho logo abaixo de um nó preto. Os quatro casos (esquerda-esquerda,
+    esquerda-direita, direita-esquerda e direita-direita) viram o mesmo nó
+    vermelho com dois filhos pretos, como na inserção de Okasaki.
+    """
+    if color == BLACK:
+        if left is not None and left.color == RED:
+            a = left.left
+            if a is not None and a.color == RED:
+                return PersistentNode(left.key, RED,
+                                      PersistentNode(a.key, BLACK, a.left, a.right),
+                                      PersistentNode(key, BLACK, left.right, right))
+            b = left.right
+            if b is not None and b.color == RED:
+                return PersistentNode(b.key, RED,
+                                      PersistentNode(left.key, BLACK, left.left, b.left),
+                                      PersistentNode(key, BLACK, b.right, right))
+
+        if right is not None and right.color == RED:
+            b = right.left
+            if b is not None and b.color == RED:
+                return PersistentNode(b.key, RED,
+                                      PersistentNode(key, BLACK, left, b.left),
+                                      PersistentNode(right.key, BLACK, b.right, right.right))
+            c = right.right
+            if c is not None and c.color == RED:
+                return PersistentNode(right.key, RED,
+                                      PersistentNode(key, BLACK, left, right.left),
+                                      PersistentNode(c.key, BLACK, c.left, c.right))
+
+    return PersistentNode(key, color, left, right)
+
+class PersistentRedBlackTree:
+    """
+    Árvore rubro-negra persistente: cada objeto é uma versão imutável da árvore,
+    e insert retorna uma nova versão sem alterar a atual. Só os nós do caminho
+    da raiz até a nova folha são copiados (O(log n) nós); todo o resto é
+    compartilhado com a versão anterior. Como os nós nunca são alterados, a
+    estrutura de uma versão pode ser consultada por outras threads enquanto
+    novas versões são criadas, sem trava.
+
+    O balanceamento segue a inserção de Okasaki, e não o _fix_insert da
+    RedBlackTree, então a forma da árvore (e as comparações das buscas) pode ser
+    diferente da RedBlackTree com as mesmas chaves, mas as propriedades
+    rubro-negras são as mesmas. Chaves repetidas vão para a direita, como na
+    RedBlackTree.
+
+    comparison_count soma as comparações das inserções de todas as versões até
+    esta. hits e misses não fazem parte da árvore: todas as versões criadas a
+    partir de uma mesma árvore vazia compartilham um único objeto counters
+    (PerThreadCounters), então hits e misses são os totais das buscas feitas
+    em qualquer versão dessa linhagem, como no VersionedBackend, que passa de
+    versão a cada inserção. As buscas são contadas por thread, como na
+    ConcurrentRedBlackTree, para que buscas simultâneas não disputem os
+    contadores.
+    """
+
+    # Usado pelo tree_analysis: os nós não têm ponteiro para o pai.
+    persistent = True
+
+    def __init__(self, root=None, size=0, comparison_count=0, version=0, counters=None):
+        self.root = root
+        self.size = size
+        self.version = version
+        self.comparison_count = comparison_count
+
+        # Só a árvore vazia cria os contadores; as versões seguintes recebem o
+        # mesmo objeto, sem nenhum custo por versão além da referência.
+        self.counters = PerThreadCounters() if counters is None else counters
+
+    @property
+    def hits(self):
+        return self.counters.total('hits')
+
+    @property
+    def misses(self):
+        return self.counters.total('misses')
+
+    def __len__(self):
+        return self.size
+
+    def insert(self, key):
+        """
+        Retorna uma nova versão com a chave inserida.
+        """
+        # Desce até a folha guardando o caminho e o lado escolhido em cada nó.
+        path = []
+        current = self.root
+        while current is not None:
+            went_left = key < current.key
+            path.append((current, went_left))
+            current = current.left if went_left else current.right
+
+        # Reconstrói o caminho de baixo para cima, balanceando cada nível; os
+        # filhos fora do caminho são reaproveitados.
+        node = PersistentNode(key, RED)
+        for parent, went_left in reversed(path):
+            if went_left:
+                node = _balance(parent.color, node, parent.key, parent.right)
+            else:
+                node = _balance(parent.color, parent.left, parent.key, node)
+
+        if node.color == RED:
+            node = PersistentNode(node.key, BLACK, node.left, node.right)
+
+        return PersistentRedBlackTree(node, self.size + 1, self.comparison_count + len(path), self.version + 1,
+                                      self.counters)
+
+    def insert_many(self, keys):
+        """
+        Insere as chaves uma a uma e retorna apenas a última versão; as
+        intermediárias ficam livres para o coletor de lixo.
+        """
+        tree = self
+        for key in keys:
+            tree = tree.insert(key)
+        return tree
+
+    def search(self, key):
+        """
+        Busca a chave e retorna o número de comparações feitas. O hit ou miss
+        vai para os contadores da thread, compartilhados pela linhagem.
+        """
+        current = self.root
+        comparisons = 0
+        counters = self.counters.mine()
+        counters.searches += 1
+
+        while current is not None:
+            comparisons += 1
+            if key == current.key:
+                counters.hits += 1
+                counters.comparisons += comparisons
+                return comparisons
+            elif key < current.key:
+                current = current.left
+            else:
+                current = current.right
+
+        counters.misses += 1
+        counters.comparisons += comparisons
+        return comparisons
+
+    def search_many(self, keys):
+        """
+        Busca um lote de chaves. Retorna a quantidade de hits, a de misses e a
+        lista com o número de comparações de cada chave, como o search_many da
+        RedBlackTree.
+        """
+        found, comparisons = self._search_batch(keys)
+        hits = sum(found)
+        return hits, len(found) - hits, comparisons
+
+    def search_mask(self, keys):
+        """
+        Busca um lote de chaves como o search_many e retorna uma lista com True
+        para cada chave encontrada.
+        """
+        found, _ = self._search_batch(keys)
+        return found
+
+    def _search_batch(self, keys):
+        # Lote do search_many e do search_mask, com os acertos e as comparações
+        # de cada chave; os totais vão para os contadores da thread.
+        root = self.root
+        found = []
+        comparisons = []
+
+        for key in keys:
+            current = root
+            count = 0
+            while current is not None:
+                count += 1
+                if key == current.key:
+                    break
+                elif key < current.key:
+                    current = current.left
+                else:
+                    current = current.right
+            found.append(current is not None)
+            comparisons.append(count)
+
+        hits = sum(found)
+        counters = self.counters.mine()
+        counters.searches += len(comparisons)
+        counters.hits += hits
+        counters.misses += len(comparisons) - hits
+        counters.comparisons += sum(comparisons)
+
+        return found, comparisons
+
+    def iter_inorder(self):
+        """
+        Gera as chaves em ordem crescente, com pilha explícita.
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def range(self, lo, hi):
+        """
+        Gera, em ordem crescente, as chaves no intervalo [lo, hi], descendo
+        apenas pelas subárvores que podem conter chaves do intervalo.
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                # Com a chave abaixo de lo, a subárvore esquerda está toda fora.
+                node = node.left if node.key >= lo else None
+            node = stack.pop()
+            if node.key > hi:
+                return
+            if node.key >= lo:
+                yield node.key
+            node = node.right
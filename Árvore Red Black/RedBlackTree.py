@@ -1,15 +1,33 @@
 from Node import Node
-import rich.console as console
-import networkx as nx
-import matplotlib.pyplot as plt
+import os
+import sys
+from array import array
 
-class RedBlackTree:
+# A busca em lote, os percursos, a cópia congelada, o formato dos snapshots e
+# a preparação das chaves do from_iterable ficam em Utils, compartilhados com a
+# outra árvore (e, no caso dos snapshots, com a versão compacta).
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Utils')))
+
+from snapshots import RB_MAGIC, read_snapshot, write_snapshot
+from bulk_load import sorted_unique
+from node_tree import NodeTreeMixin
+from frozen_tree import FrozenTree
+
+# Cores dos nós. São inteiros em vez das strings 'RED'/'BLACK' para que cada
+# verificação de cor seja uma comparação de inteiros; são os mesmos valores da
+# CompactRedBlackTree e do snapshot.
+BLACK = 0
+RED = 1
+
+COLOR_NAMES = {BLACK: 'BLACK', RED: 'RED'}
+
+class RedBlackTree(NodeTreeMixin):
     
-    def __init__(self):
+    def __init__(self, order_statistics=False, duplicates='allow'):
         
         # Cria um nó especial chamado NIL, que representa os nós folha da árvore rubro-negra.
-        # O NIL é sempre preto (color='BLACK') e não contém nenhum valor (key=None).
-        self.NIL = Node(None, color='BLACK')
+        # O NIL é sempre preto (color=BLACK) e não contém nenhum valor (key=None).
+        self.NIL = Node(None, color=BLACK)
 
         # Inicializa a raiz da árvore como o nó NIL.
         # No início, a árvore está vazia, então a raiz aponta para o NIL.
@@ -19,132 +37,260 @@ class RedBlackTree:
         # Esse contador será usado para contar quantas comparações são feitas durante a inserção de elementos na árvore.
         self.comparison_count = 0
         
-        # Inicializa o console para exibir mensagens no terminal.
-        self.console = console.Console()
+        # O console para exibir mensagens no terminal só é criado quando a árvore
+        # é impressa, para que o rich não seja importado junto com a árvore.
+        self._console = None
         
         # Contadores para hits e misses durante a busca.
-        self.hits = 0 
+        self.hits = 0
         self.misses = 0
 
+        # Estatísticas de ordem (opcional): cada nó guarda o tamanho da sua
+        # subárvore (campo size), mantido pelo insert, pelas rotações e pelo
+        # delete, o que permite responder rank, select e count_range em O(log n).
+        # O NIL tem tamanho 0. Com duplicates='count', cada nó vale pelas suas
+        # repetições (campo count) no tamanho, então rank, select e count_range
+        # contam todas as ocorrências, como na política 'allow'.
+        self.order_statistics = order_statistics
+        if order_statistics:
+            self.NIL.size = 0
+
+        # Política para chaves repetidas no insert:
+        # - 'allow': insere um novo nó para cada repetição (comportamento original);
+        # - 'reject': ignora a repetição, sem alocar nenhum nó;
+        # - 'count': guarda a quantidade de repetições no campo count do nó
+        #   existente, e o delete remove uma repetição por vez.
+        # Nas duas últimas, duplicate_count conta as repetições encontradas.
+        if duplicates not in ('allow', 'reject', 'count'):
+            raise ValueError(f"Política de duplicatas inválida: {duplicates!r} (use 'allow', 'reject' ou 'count').")
+        self.duplicates = duplicates
+        self.duplicate_count = 0
+
+    @property
+    def console(self):
+        # Importa o rich apenas no primeiro uso do console.
+        if self._console is None:
+            import rich.console as console
+            self._console = console.Console()
+        return self._console
+
+    @classmethod
+    def from_iterable(cls, iterable, order_statistics=False, count_comparisons=True):
+        """
+        Constrói uma árvore rubro-negra balanceada a partir de um lote de chaves,
+        sem passar pelo insert. As chaves são ordenadas (ou apenas verificadas, se
+        já vierem ordenadas), as duplicatas são removidas e a árvore é montada de
+        baixo para cima escolhendo sempre o elemento do meio como raiz de cada
+        subárvore, o que leva tempo linear depois da ordenação.
+
+        Todos os nós são pretos, exceto os do último nível quando ele está
+        incompleto, que ficam vermelhos: assim todo caminho até um NIL passa pelo
+        mesmo número de nós pretos.
+
+        O comparison_count da árvore passa a contar as comparações feitas na
+        verificação, na ordenação e na remoção de duplicatas.
+        Com count_comparisons=False as chaves são ordenadas com sorted(set(...)),
+        sem contar as comparações, o que é bem mais rápido.
+        """
+        tree = cls(order_statistics=order_statistics)
+        keys, comparisons = sorted_unique(iterable, count_comparisons)
+        tree.comparison_count += comparisons
+
+        n = len(keys)
+        if n == 0:
+            return tree
+
+        # Profundidade do último nível, que só é colorido de vermelho quando não
+        # está completo (n + 1 não é potência de 2).
+        last_depth = n.bit_length() - 1
+        red_depth = last_depth if (n + 1) & n else -1
+
+        # Pilha com os intervalos [inicio, fim) ainda não montados, o nó pai,
+        # o lado em que o nó será pendurado e a profundidade.
+        stack = [(0, n, None, False, 0)]
+        while stack:
+            lo, hi, parent, is_left, depth = stack.pop()
+            mid = (lo + hi) // 2
+
+            node = Node(keys[mid], RED if depth == red_depth else BLACK)
+            node.left = tree.NIL
+            node.right = tree.NIL
+            node.parent = parent
+
+            # O tamanho da subárvore é o tamanho do intervalo que ela ocupa.
+            if order_statistics:
+                node.size = hi - lo
+
+            if parent is None:
+                tree.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+
+            if lo < mid:
+                stack.append((lo, mid, node, True, depth + 1))
+            if mid + 1 < hi:
+                stack.append((mid + 1, hi, node, False, depth + 1))
+
+        return tree
+
     def insert(self, key):
-        # Cria um novo nó com a chave fornecida.
-        # Por padrão, o novo nó é vermelho (color='RED').
-        new_node = Node(key)
+        """
+        Insere a chave na árvore. Retorna True se um novo nó foi criado e False
+        se a chave já existia e a política de duplicatas a recusou ou contou.
 
-        # Define os filhos esquerdo e direito do novo nó como NIL.
-        # NIL representa os nós folha na árvore rubro-negra.
-        new_node.left = self.NIL
-        new_node.right = self.NIL
+        O caminho é descido primeiro e o novo nó só é alocado depois que a
+        posição é encontrada (e que se sabe que a chave não será recusada).
+        """
+        nil = self.NIL
 
         # Inicializa as variáveis para percorrer a árvore.
         # `parent` será o nó pai do novo nó.
         # `current` começa na raiz da árvore.
         parent = None
         current = self.root
+        comparisons = 0
+
+        if self.duplicates == 'allow':
+            # Encontrar a posição correta para inserir o novo nó.
+            # Percorre a árvore até encontrar um nó folha (NIL), com uma
+            # comparação por nível: à esquerda se a chave for menor, à direita
+            # se for maior ou igual.
+            while current is not nil:
+                parent = current
+                comparisons += 1
+                if key < current.key:
+                    current = current.left
+                else:
+                    current = current.right
+        else:
+            # Com duplicatas recusadas ou contadas, a descida também verifica
+            # se a chave já está no nó (a mesma comparação de três vias do search).
+            while current is not nil:
+                parent = current
+                comparisons += 1
+                current_key = current.key
+                if key == current_key:
+                    self.comparison_count += comparisons
+                    self.duplicate_count += 1
+                    if self.duplicates == 'count':
+                        current.count += 1
+
+                        # A repetição aumenta em 1 o tamanho de todas as
+                        # subárvores do nó até a raiz.
+                        if self.order_statistics:
+                            ancestor = current
+                            while ancestor is not None:
+                                ancestor.size += 1
+                                ancestor = ancestor.parent
+                    return False
+                elif key < current_key:
+                    current = current.left
+                else:
+                    current = current.right
 
-        # Encontrar a posição correta para inserir o novo nó.
-        # Percorre a árvore até encontrar um nó folha (NIL).
-        while current != self.NIL:
-            parent = current  # Atualiza o nó pai para o nó atual.
-
-            # Incrementa o contador de comparações.
-            # Cada comparação entre chaves é contabilizada.
-            self.comparison_count += 1
-
-            # Decide se deve ir para a subárvore esquerda ou direita.
-            if new_node.key < current.key:
-                current = current.left  # Vai para a esquerda se a chave for menor.
-            else:
-                current = current.right  # Vai para a direita se a chave for maior ou igual.
+        self.comparison_count += comparisons
 
-        # Define o pai do novo nó como o nó encontrado no loop acima.
+        # Só agora o novo nó é criado, vermelho e com os filhos apontando para o NIL.
+        new_node = Node(key, RED)
+        new_node.left = nil
+        new_node.right = nil
         new_node.parent = parent
 
+        if self.duplicates == 'count':
+            new_node.count = 1
+
         # Se o pai for None, a árvore estava vazia, e o novo nó será a raiz.
         if parent is None:
             self.root = new_node
         # Se a chave do novo nó for menor que a chave do pai, insere à esquerda.
-        elif new_node.key < parent.key:
+        elif key < parent.key:
             parent.left = new_node
         # Caso contrário, insere à direita.
         else:
             parent.right = new_node
 
-        # Define a cor do novo nó como vermelho.
-        # Na árvore rubro-negra, novos nós são sempre inseridos como vermelhos.
-        new_node.color = 'RED'
+        # Com estatísticas de ordem, o novo nó aumenta em 1 o tamanho de todas
+        # as subárvores no caminho até a raiz.
+        if self.order_statistics:
+            new_node.size = 1
+            ancestor = parent
+            while ancestor is not None:
+                ancestor.size += 1
+                ancestor = ancestor.parent
 
-        # Chama a função _fix_insert para corrigir possíveis violações das propriedades da árvore rubro-negra.
-        # Isso garante que a árvore permaneça balanceada após a inserção.
-        self._fix_insert(new_node)
+        # Com o pai preto nenhuma propriedade é violada, então a correção só é
+        # chamada para a raiz nova ou quando o pai é vermelho.
+        if parent is None or parent.color == RED:
+            self._fix_insert(new_node)
+
+        return True
 
     def _fix_insert(self, node):
-        
-        # Enquanto o pai do nó existir e for vermelho, pode haver violações das propriedades da árvore rubro-negra.
-        while node.parent and node.parent.color == 'RED':
-            
-            # Verifica se o pai do nó é o filho esquerdo do avô.
-            if node.parent == node.parent.parent.left:
-                uncle = node.parent.parent.right  # O tio é o filho direito do avô.
-
-                # Caso 1: O tio é vermelho.
-                if uncle.color == 'RED':
-                    # Faz a recoloração:
-                    # - Pai e tio ficam pretos.
-                    # - Avô fica vermelho.
-                    node.parent.color = 'BLACK'
-                    uncle.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-
-                    # Move o nó para o avô, pois a violação pode ter subido na árvore.
-                    node = node.parent.parent
+        """
+        Restaura as propriedades rubro-negras depois da inserção de node.
+        """
+
+        # O pai e o avô ficam em variáveis locais, em vez de serem relidos como
+        # node.parent.parent a cada passo.
+        parent = node.parent
+
+        # Enquanto o pai for vermelho, há dois vermelhos seguidos. Um pai
+        # vermelho nunca é a raiz, então o avô sempre existe.
+        while parent is not None and parent.color == RED:
+            grandparent = parent.parent
+
+            # O pai é o filho esquerdo do avô.
+            if parent is grandparent.left:
+                uncle = grandparent.right  # O tio é o filho direito do avô.
+
+                # Caso 1: o tio é vermelho. Pai e tio ficam pretos, o avô fica
+                # vermelho e a violação pode ter subido para o avô.
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                    parent = node.parent
                 else:
-                    # Caso 2: O tio é preto e o nó é o filho direito do pai.
-                    if node == node.parent.right:
-                        
-                        # Faz uma rotação à esquerda no pai para transformar no Caso 3.
-                        node = node.parent
-                        self._left_rotate(node)
-
-                    # Caso 3: O tio é preto e o nó é o filho esquerdo do pai.
-                    # Faz a recoloração e uma rotação à direita no avô.
-                    node.parent.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    self._right_rotate(node.parent.parent)
+                    # Caso 2: o nó é o filho direito do pai. Uma rotação à
+                    # esquerda no pai transforma no Caso 3 (pai e nó trocam de papel).
+                    if node is parent.right:
+                        self._left_rotate(parent)
+                        node, parent = parent, node
+
+                    # Caso 3: recolore e rotaciona o avô para a direita. O novo
+                    # topo da subárvore é preto, então a correção termina.
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    self._right_rotate(grandparent)
+                    break
             else:
-                # O pai do nó é o filho direito do avô (caso simétrico ao anterior).
-                uncle = node.parent.parent.left  # O tio é o filho esquerdo do avô.
-
-                # Caso 1: O tio é vermelho.
-                if uncle.color == 'RED':
-                    # Faz a recoloração:
-                    # - Pai e tio ficam pretos.
-                    # - Avô fica vermelho.
-                    node.parent.color = 'BLACK'
-                    uncle.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-
-                    # Move o nó para o avô, pois a violação pode ter subido na árvore.
-                    node = node.parent.parent
+                # O pai é o filho direito do avô (caso simétrico ao anterior).
+                uncle = grandparent.left  # O tio é o filho esquerdo do avô.
+
+                # Caso 1: o tio é vermelho.
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                    parent = node.parent
                 else:
-                    # Caso 2: O tio é preto e o nó é o filho esquerdo do pai.
-                    if node == node.parent.left:
-                        # Faz uma rotação à direita no pai para transformar no Caso 3.
-                        node = node.parent
-                        self._right_rotate(node)
-
-                    # Caso 3: O tio é preto e o nó é o filho direito do pai.
-                    # Faz a recoloração e uma rotação à esquerda no avô.
-                    node.parent.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    self._left_rotate(node.parent.parent)
-
-            # Se o nó atual for a raiz, sai do loop.
-            if node == self.root:
-                break
+                    # Caso 2: o nó é o filho esquerdo do pai.
+                    if node is parent.left:
+                        self._right_rotate(parent)
+                        node, parent = parent, node
+
+                    # Caso 3: recolore e rotaciona o avô para a esquerda.
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    self._left_rotate(grandparent)
+                    break
 
         # Garante que a raiz da árvore seja sempre preta.
-        self.root.color = 'BLACK'
+        self.root.color = BLACK
 
     def _left_rotate(self, x):
         
@@ -191,6 +337,11 @@ class RedBlackTree:
         # O pai de x agora é y.
         x.parent = y
 
+        # y assume o tamanho da subárvore que era de x, e x é recalculado.
+        if self.order_statistics:
+            y.size = x.size
+            x.size = x.left.size + x.right.size + self._own_size(x)
+
     def _right_rotate(self, y):
         
         # Antes da rotação à direita:
@@ -236,6 +387,334 @@ class RedBlackTree:
         # O pai de y agora é x.
         y.parent = x
 
+        # x assume o tamanho da subárvore que era de y, e y é recalculado.
+        if self.order_statistics:
+            x.size = y.size
+            y.size = y.left.size + y.right.size + self._own_size(y)
+
+    def delete(self, key):
+        """
+        Remove um nó com a chave fornecida, mantendo as propriedades da árvore
+        rubro-negra. Retorna True se a chave foi encontrada e removida e False
+        caso contrário.
+        """
+        # Procura o nó a ser removido.
+        node = self.root
+        while node != self.NIL and key != node.key:
+            if key < node.key:
+                node = node.left
+            else:
+                node = node.right
+
+        if node == self.NIL:
+            return False
+
+        # Com duplicatas contadas, remove apenas uma das repetições.
+        if self.duplicates == 'count' and node.count > 1:
+            node.count -= 1
+            if self.order_statistics:
+                ancestor = node
+                while ancestor is not None:
+                    ancestor.size -= 1
+                    ancestor = ancestor.parent
+            return True
+
+        # Com estatísticas de ordem, todas as subárvores acima do nó que sai da
+        # sua posição (o próprio nó ou, com dois filhos, o sucessor) perdem o
+        # tamanho dele.
+        if self.order_statistics:
+            if node.left == self.NIL or node.right == self.NIL:
+                removed = node
+            else:
+                removed = self._minimum(node.right)
+
+            removed_size = self._own_size(removed)
+            ancestor = removed.parent
+            while ancestor is not None:
+                ancestor.size -= removed_size
+                ancestor = ancestor.parent
+
+            # Com repetições contadas, o sucessor leva as suas para o lugar do
+            # nó, então do nó para cima só sai a única ocorrência do nó.
+            if removed is not node and removed_size != 1:
+                ancestor = node
+                while ancestor is not None:
+                    ancestor.size += removed_size - 1
+                    ancestor = ancestor.parent
+
+        # y é o nó que sai de fato da sua posição e x é o nó que ocupa o lugar de y.
+        y = node
+        y_original_color = y.color
+
+        if node.left == self.NIL:
+            # Sem filho esquerdo: o filho direito sobe para o lugar do nó.
+            x = node.right
+            self._transplant(node, node.right)
+        elif node.right == self.NIL:
+            # Sem filho direito: o filho esquerdo sobe para o lugar do nó.
+            x = node.left
+            self._transplant(node, node.left)
+        else:
+            # Dois filhos: o sucessor (menor nó da subárvore direita) ocupa o
+            # lugar do nó removido, herdando sua cor.
+            y = self._minimum(node.right)
+            y_original_color = y.color
+            x = y.right
+
+            if y.parent == node:
+                x.parent = y
+            else:
+                self._transplant(y, y.right)
+                y.right = node.right
+                y.right.parent = y
+
+            self._transplant(node, y)
+            y.left = node.left
+            y.left.parent = y
+            y.color = node.color
+
+            if self.order_statistics:
+                y.size = node.size
+
+        # Remover um nó preto altera a quantidade de pretos em um dos caminhos,
+        # então a árvore precisa ser corrigida a partir de x.
+        if y_original_color == BLACK:
+            self._fix_delete(x)
+
+        # O NIL pode ter recebido um pai durante a remoção; volta ao estado inicial.
+        self.NIL.parent = None
+
+        return True
+
+    def _transplant(self, u, v):
+
+        # Substitui a subárvore enraizada em u pela subárvore enraizada em v.
+        if u.parent is None:
+            self.root = v
+        elif u == u.parent.left:
+            u.parent.left = v
+        else:
+            u.parent.right = v
+
+        # O pai de v passa a ser o pai de u (mesmo quando v é o NIL, o que é
+        # usado pelo _fix_delete para subir na árvore).
+        v.parent = u.parent
+
+    def _minimum(self, node):
+
+        # O menor nó de uma subárvore é o mais à esquerda.
+        while node.left != self.NIL:
+            node = node.left
+        return node
+
+    def _fix_delete(self, x):
+
+        # x carrega um preto "extra"; enquanto não for a raiz e for preto, o
+        # preto extra é empurrado para cima ou resolvido com rotações.
+        while x != self.root and x.color == BLACK:
+
+            # Verifica se x é o filho esquerdo do pai.
+            if x == x.parent.left:
+                w = x.parent.right  # O irmão de x.
+
+                # Caso 1: o irmão é vermelho. Recolore e rotaciona para que o
+                # irmão passe a ser preto (Casos 2, 3 ou 4).
+                if w.color == RED:
+                    w.color = BLACK
+                    x.parent.color = RED
+                    self._left_rotate(x.parent)
+                    w = x.parent.right
+
+                # Caso 2: o irmão e seus dois filhos são pretos. O irmão fica
+                # vermelho e o preto extra sobe para o pai.
+                if w.left.color == BLACK and w.right.color == BLACK:
+                    w.color = RED
+                    x = x.parent
+                else:
+                    # Caso 3: o filho direito do irmão é preto. Recolore e
+                    # rotaciona o irmão para transformar no Caso 4.
+                    if w.right.color == BLACK:
+                        w.left.color = BLACK
+                        w.color = RED
+                        self._right_rotate(w)
+                        w = x.parent.right
+
+                    # Caso 4: o filho direito do irmão é vermelho. Recolore e
+                    # rotaciona o pai, eliminando o preto extra.
+                    w.color = x.parent.color
+                    x.parent.color = BLACK
+                    w.right.color = BLACK
+                    self._left_rotate(x.parent)
+                    x = self.root
+            else:
+                # x é o filho direito do pai (caso simétrico ao anterior).
+                w = x.parent.left  # O irmão de x.
+
+                # Caso 1: o irmão é vermelho.
+                if w.color == RED:
+                    w.color = BLACK
+                    x.parent.color = RED
+                    self._right_rotate(x.parent)
+                    w = x.parent.left
+
+                # Caso 2: o irmão e seus dois filhos são pretos.
+                if w.right.color == BLACK and w.left.color == BLACK:
+                    w.color = RED
+                    x = x.parent
+                else:
+                    # Caso 3: o filho esquerdo do irmão é preto.
+                    if w.left.color == BLACK:
+                        w.right.color = BLACK
+                        w.color = RED
+                        self._left_rotate(w)
+                        w = x.parent.left
+
+                    # Caso 4: o filho esquerdo do irmão é vermelho.
+                    w.color = x.parent.color
+                    x.parent.color = BLACK
+                    w.left.color = BLACK
+                    self._right_rotate(x.parent)
+                    x = self.root
+
+        # O nó que recebeu o preto extra fica preto.
+        x.color = BLACK
+
+    def _require_order_statistics(self):
+        if not self.order_statistics:
+            raise RuntimeError("A árvore precisa ser criada com order_statistics=True.")
+
+    def _own_size(self, node):
+
+        # Quantas chaves o próprio nó representa: suas repetições na política
+        # 'count' e 1 nas demais.
+        return node.count if self.duplicates == 'count' else 1
+
+    def _count_less(self, key):
+
+        # Conta as chaves estritamente menores que a chave fornecida.
+        count = 0
+        node = self.root
+        while node != self.NIL:
+            if key <= node.key:
+                node = node.left
+            else:
+                count += node.left.size + self._own_size(node)
+                node = node.right
+        return count
+
+    def rank(self, key):
+        """
+        Retorna quantas chaves da árvore são menores ou iguais à chave fornecida,
+        em O(log n). Requer order_statistics=True.
+        """
+        self._require_order_statistics()
+
+        count = 0
+        node = self.root
+        while node != self.NIL:
+            if key < node.key:
+                node = node.left
+            else:
+                # O nó e toda a sua subárvore esquerda são <= chave.
+                count += node.left.size + self._own_size(node)
+                node = node.right
+        return count
+
+    def select(self, k):
+        """
+        Retorna a k-ésima menor chave da árvore (começando em 1), em O(log n).
+        Requer order_statistics=True.
+        """
+        self._require_order_statistics()
+
+        if k < 1 or k > self.root.size:
+            raise IndexError(f"Posição fora da árvore: {k}")
+
+        node = self.root
+        while True:
+            left_size = node.left.size
+            own_size = self._own_size(node)
+            if k <= left_size:
+                node = node.left
+            elif k <= left_size + own_size:
+                return node.key
+            else:
+                # Descarta a subárvore esquerda e o próprio nó.
+                k -= left_size + own_size
+                node = node.right
+
+    def count_range(self, lo, hi):
+        """
+        Retorna quantas chaves da árvore estão no intervalo [lo, hi], em O(log n).
+        Requer order_statistics=True.
+        """
+        self._require_order_statistics()
+
+        if lo > hi:
+            return 0
+        return self.rank(hi) - self._count_less(lo)
+
+    def _lower_bound(self, key):
+        """
+        Retorna o nó com a menor chave maior ou igual à chave fornecida, ou
+        o NIL se não existir, descendo uma única vez a partir da raiz.
+        """
+        nil = self.NIL
+        node = self.root
+        candidate = nil
+
+        while node is not nil:
+            if node.key < key:
+                node = node.right
+            else:
+                # O nó serve, mas pode haver um menor na subárvore esquerda.
+                candidate = node
+                node = node.left
+
+        return candidate
+
+    def _successor(self, node):
+        """
+        Retorna o nó seguinte em ordem, usando os ponteiros para o pai.
+        """
+        nil = self.NIL
+        # Com subárvore direita, o sucessor é o menor nó dela.
+        if node.right is not nil:
+            node = node.right
+            while node.left is not nil:
+                node = node.left
+            return node
+
+        # Sem subárvore direita, sobe até chegar vindo de um filho esquerdo.
+        parent = node.parent
+        while parent is not None and node is parent.right:
+            node = parent
+            parent = parent.parent
+
+        return parent if parent is not None else nil
+
+    def iter_from(self, key):
+        """
+        Gera, em ordem crescente, as chaves maiores ou iguais à chave fornecida.
+        Desce uma vez até o limite inferior e depois caminha pelos sucessores.
+        """
+        nil = self.NIL
+        node = self._lower_bound(key)
+
+        while node is not nil:
+            yield node.key
+            node = self._successor(node)
+
+    def range(self, lo, hi):
+        """
+        Gera, em ordem crescente, as chaves no intervalo [lo, hi]. O custo é
+        O(log n + k), onde k é a quantidade de chaves geradas.
+        """
+        for key in self.iter_from(lo):
+            if key > hi:
+                break
+            yield key
+
     def search(self, key):
         """
         Busca um nó com a chave fornecida e retorna o número de comparações feitas.
@@ -257,19 +736,99 @@ class RedBlackTree:
         self.misses += 1  # Incrementa o contador de erros
         return comparisons  # Retorna o número de comparações, mesmo se o nó não for encontrado
 
-    def inorder_traversal(self, node):
-        
-        # Verifica se o nó atual não é NIL (nó folha).
-        if node != self.NIL:
-            
-            # Percorre a subárvore esquerda.
-            self.inorder_traversal(node.left)
+    def freeze(self, layout='bfs'):
+        """
+        Retorna uma cópia imutável da árvore, com a mesma forma, disposta em
+        vetores na ordem por nível ('bfs') ou van Emde Boas ('veb'), para uma
+        fase só de consultas. A busca na cópia faz as mesmas comparações, mas a
+        árvore original pode continuar sendo alterada sem afetá-la.
+        """
+        return FrozenTree.from_tree(self, layout, self.NIL)
 
-            # Imprime a chave e a cor do nó atual.
-            print(node.key, node.color)
+    def save(self, path):
+        """
+        Grava a árvore em um snapshot binário (estrutura, cores, política de
+        duplicatas e, na política 'count', as repetições de cada nó), numerando
+        os nós em pré-ordem. A árvore pode ser recarregada com load sem refazer
+        nenhuma comparação ou rotação.
+        """
+        nil = self.NIL
+        counted = self.duplicates == 'count'
+
+        # A posição 0 de cada vetor é o NIL.
+        keys = [0]
+        left = array('i', [0])
+        right = array('i', [0])
+        parent = array('i', [0])
+        color = bytearray([0])
+        counts = array('I', [0]) if counted else None
+
+        # Percorre em pré-ordem guardando o índice do pai e o lado do filho.
+        stack = [(self.root, 0, False)] if self.root is not nil else []
+        while stack:
+            node, parent_index, is_left = stack.pop()
+            index = len(keys)
+
+            keys.append(node.key)
+            left.append(0)
+            right.append(0)
+            parent.append(parent_index)
+            color.append(node.color)
+            if counted:
+                counts.append(node.count)
+
+            if is_left:
+                left[parent_index] = index
+            elif parent_index:
+                right[parent_index] = index
+
+            # Empilha a direita primeiro para que a esquerda receba o próximo índice.
+            if node.right is not nil:
+                stack.append((node.right, index, False))
+            if node.left is not nil:
+                stack.append((node.left, index, True))
+
+        write_snapshot(path, RB_MAGIC, 1 if len(keys) > 1 else 0, keys, left, right, parent, color,
+                       duplicates=self.duplicates, counts=counts)
+
+    @classmethod
+    def load(cls, path, order_statistics=False):
+        """
+        Recarrega uma árvore gravada com save, ligando os nós diretamente a partir
+        dos vetores do snapshot, sem comparações nem rotações. A árvore volta com
+        a política de duplicatas e as repetições gravadas.
+        """
+        root, keys, left, right, parent, color, duplicates, counts = read_snapshot(path, RB_MAGIC)
+        tree = cls(order_statistics=order_statistics, duplicates=duplicates)
+
+        # Cria todos os nós; a posição 0 é o NIL da nova árvore.
+        nodes = [tree.NIL]
+        nodes.extend(Node(keys[i], color[i]) for i in range(1, len(keys)))
+
+        for i in range(1, len(nodes)):
+            node = nodes[i]
+            node.left = nodes[left[i]]
+            node.right = nodes[right[i]]
+            node.parent = nodes[parent[i]] if parent[i] else None
+            if counts is not None:
+                node.count = counts[i]
+
+        tree.root = nodes[root]
 
-            # Percorre a subárvore direita.
-            self.inorder_traversal(node.right)
+        # Na pré-ordem os filhos têm índices maiores que o pai, então percorrendo
+        # de trás para frente os tamanhos das subárvores já estão prontos.
+        if order_statistics:
+            for i in range(len(nodes) - 1, 0, -1):
+                node = nodes[i]
+                node.size = node.left.size + node.right.size + tree._own_size(node)
+
+        return tree
+
+    def inorder_traversal(self, node):
+
+        # Percorre a subárvore em ordem, imprimindo a chave e a cor de cada nó.
+        for node in self._inorder_nodes(node):
+            print(node.key, COLOR_NAMES[node.color])
 
     def print_tree(self, node, indent="", last=True):
                 
@@ -290,9 +849,16 @@ class RedBlackTree:
                     └── 98 (RED)
         """
         
-        # Verifica se o nó atual não é NIL (nó folha).
-        if node != self.NIL:
-            
+        # Pilha com os nós a imprimir, a indentação e se são o último nó do nível.
+        stack = [(node, indent, last)]
+
+        while stack:
+            node, indent, last = stack.pop()
+
+            # Ignora os nós NIL (nós folha).
+            if node == self.NIL:
+                continue
+
             # Imprime a indentação atual.
             self.console.print(indent, end="")
 
@@ -305,19 +871,22 @@ class RedBlackTree:
                 indent += "│   "       # Adiciona uma barra vertical para a próxima linha.
 
             # Imprime a chave e a cor do nó atual.
-            self.console.print(f"[{'red' if node.color == 'RED' else 'black'}]{node.key} ({node.color})[/]", style="red" if node.color == 'RED' else "black")
-
-            # Percorre a subárvore esquerda.
-            self.print_tree(node.left, indent, False)
+            self.console.print(f"[{'red' if node.color == RED else 'black'}]{node.key} ({COLOR_NAMES[node.color]})[/]", style="red" if node.color == RED else "black")
 
-            # Percorre a subárvore direita.
-            self.print_tree(node.right, indent, True)
+            # Empilha a subárvore direita antes da esquerda, para que a esquerda
+            # seja impressa primeiro.
+            stack.append((node.right, indent, True))
+            stack.append((node.left, indent, False))
     
     def visualize_tree(self):
         """
         Gera uma visualização gráfica da árvore rubro-negra usando matplotlib, networkx, não sendo recomendado para
         árvores muito grandes, pois a visualização pode ficar confusa.
         """
+        # As bibliotecas de visualização só são importadas quando usadas.
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
         # Cria um grafo direcionado para representar a árvore.
         G = nx.DiGraph()
 
@@ -344,20 +913,18 @@ class RedBlackTree:
         Adiciona nós e arestas ao grafo para desenhar a árvore rubro-negra, sendo uma função auxiliar para a função
         visualize_tree.
         """
-        # Verifica se o nó atual não é NIL (nó folha).
-        if node != self.NIL:
+        # Percorre a subárvore em pré-ordem, sem recursão.
+        for node in self._preorder_nodes(node):
             # Adiciona o nó ao grafo com sua cor (vermelho ou preto).
-            G.add_node(node.key, color='red' if node.color == 'RED' else 'black')
+            G.add_node(node.key, color='red' if node.color == RED else 'black')
 
             # Adiciona uma aresta para o filho esquerdo, se existir.
             if node.left != self.NIL:
                 G.add_edge(node.key, node.left.key)
-                self._add_nodes_edges(node.left, G)
 
             # Adiciona uma aresta para o filho direito, se existir.
             if node.right != self.NIL:
                 G.add_edge(node.key, node.right.key)
-                self._add_nodes_edges(node.right, G)
 
     def _hierarchy_pos(self, G, root, width=1.0, vert_gap=0.2, vert_loc=0, xcenter=0.5):
         """
@@ -366,19 +933,26 @@ class RedBlackTree:
         if root is None:
             return {}
 
-        pos = {root: (xcenter, vert_loc)}
-        neighbors = list(G.neighbors(root))
+        pos = {}
+
+        # Pilha com o nó, a largura do espaço da sua subárvore e sua posição.
+        stack = [(root, width, vert_loc, xcenter)]
+
+        while stack:
+            root, width, vert_loc, xcenter = stack.pop()
+            pos[root] = (xcenter, vert_loc)
+            neighbors = list(G.neighbors(root))
 
-        if len(neighbors) != 0:
-            dx = width / 2  # Largura do espaço para cada subárvore.
-            nextx = xcenter - width / 2  # Posição inicial no eixo x.
+            if len(neighbors) != 0:
+                dx = width / 2  # Largura do espaço para cada subárvore.
+                nextx = xcenter - width / 2  # Posição inicial no eixo x.
 
-            # Percorre os vizinhos e calcula suas posições.
-            for neighbor in neighbors:
-                if neighbor < root:  # Nó à esquerda (menor que o nó atual).
-                    pos.update(self._hierarchy_pos(G, neighbor, width=dx, vert_gap=vert_gap, vert_loc=vert_loc - vert_gap, xcenter=nextx))
-                else:  # Nó à direita (maior que o nó atual).
-                    pos.update(self._hierarchy_pos(G, neighbor, width=dx, vert_gap=vert_gap, vert_loc=vert_loc - vert_gap, xcenter=nextx + dx))
-                nextx += dx
+                # Percorre os vizinhos e calcula suas posições.
+                for neighbor in neighbors:
+                    if neighbor < root:  # Nó à esquerda (menor que o nó atual).
+                        stack.append((neighbor, dx, vert_loc - vert_gap, nextx))
+                    else:  # Nó à direita (maior que o nó atual).
+                        stack.append((neighbor, dx, vert_loc - vert_gap, nextx + dx))
+                    nextx += dx
 
-        return pos
\ No newline at end of file
+        return pos